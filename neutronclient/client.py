@@ -14,8 +14,15 @@
 #    under the License.
 #
 
+import abc
+import asyncio
+import functools
 import logging
 import os
+import ssl
+import threading
+import time
+import weakref
 
 import debtcollector.renames
 from keystoneauth1 import access
@@ -23,12 +30,16 @@ from keystoneauth1 import adapter
 from oslo_serialization import jsonutils
 from oslo_utils import importutils
 import requests
+from requests import adapters
 
 from neutronclient._i18n import _
 from neutronclient.common import exceptions
+from neutronclient.common import tokencache
 from neutronclient.common import utils
 
 osprofiler_web = importutils.try_import("osprofiler.web")
+aiohttp = importutils.try_import("aiohttp")
+httpx = importutils.try_import("httpx")
 
 _logger = logging.getLogger(__name__)
 
@@ -46,6 +57,301 @@ USER_AGENT = 'python-neutronclient'
 REQ_ID_HEADER = 'X-OpenStack-Request-ID'
 
 
+class _PoolStats(object):
+    """Thread-safe counters describing connection pool usage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_new_connection(self):
+        with self._lock:
+            self.new_connections += 1
+
+    def as_dict(self):
+        with self._lock:
+            return {'requests': self.requests,
+                    'new_connections': self.new_connections,
+                    'hits': max(self.requests - self.new_connections, 0)}
+
+
+def _counting_pool_class(pool_cls, stats):
+    class _CountingPool(pool_cls):
+        def _new_conn(self):
+            stats.record_new_connection()
+            return super(_CountingPool, self)._new_conn()
+    return _CountingPool
+
+
+class _PooledHTTPAdapter(adapters.HTTPAdapter):
+    """HTTPAdapter recording how often pooled connections are reused."""
+
+    def __init__(self, stats, **kwargs):
+        self._stats = stats
+        super(_PooledHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(_PooledHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        manager = self.poolmanager
+        manager.pool_classes_by_scheme = dict(
+            (scheme, _counting_pool_class(pool_cls, self._stats))
+            for scheme, pool_cls in manager.pool_classes_by_scheme.items())
+
+    def send(self, *args, **kwargs):
+        self._stats.record_request()
+        return super(_PooledHTTPAdapter, self).send(*args, **kwargs)
+
+
+class Transport(abc.ABC):
+    """Interface of the HTTP backends used by :class:`HTTPClient`.
+
+    A transport sends a request and returns a ``requests.Response``, so the
+    rest of the client does not depend on the backend in use.
+    """
+
+    @abc.abstractmethod
+    def request(self, method, url, data=None, headers=None, verify=True,
+                cert=None, timeout=None, stream=False):
+        """Send a request and return a ``requests.Response``.
+
+        With ``stream`` the body is not read up front and must be consumed
+        with ``iter_content``.
+        """
+
+    @abc.abstractmethod
+    def close(self):
+        """Close the connections held by the transport."""
+
+    def get_pool_stats(self):
+        """Return connection usage statistics, see HTTPClient."""
+        return {}
+
+
+class RequestsTransport(Transport):
+    """HTTP/1.1 transport backed by a pooled ``requests.Session``."""
+
+    def __init__(self, pool_connections=None, pool_maxsize=None,
+                 pool_idle_timeout=None):
+        self.pool_connections = (pool_connections or
+                                 adapters.DEFAULT_POOLSIZE)
+        self.pool_maxsize = pool_maxsize or adapters.DEFAULT_POOLSIZE
+        self.pool_idle_timeout = pool_idle_timeout
+        self._pool_stats = _PoolStats()
+        self._session_lock = threading.Lock()
+        self._session = None
+        self._session_last_used = None
+        # Number of requests in flight per session, a retired session is
+        # closed once its last request completes.
+        self._session_users = {}
+
+    def _new_session(self):
+        session = requests.Session()
+        adapter = _PooledHTTPAdapter(self._pool_stats,
+                                     pool_connections=self.pool_connections,
+                                     pool_maxsize=self.pool_maxsize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _retire_session(self):
+        """Stop handing out the session, closing it once unused.
+
+        Must be called with the session lock held.
+        """
+        session, self._session = self._session, None
+        if session is not None and session not in self._session_users:
+            session.close()
+
+    def _acquire_session(self):
+        """Return the pooled session, recycling it once it went idle.
+
+        The session must be given back with _release_session().
+        """
+        with self._session_lock:
+            now = time.monotonic()
+            if (self._session is not None and self.pool_idle_timeout and
+                    now - self._session_last_used > self.pool_idle_timeout):
+                _logger.debug("Closing connections idle for more than "
+                              "%s seconds", self.pool_idle_timeout)
+                self._retire_session()
+            if self._session is None:
+                self._session = self._new_session()
+            self._session_last_used = now
+            session = self._session
+            self._session_users[session] = (
+                self._session_users.get(session, 0) + 1)
+            return session
+
+    def _release_session(self, session):
+        with self._session_lock:
+            self._session_users[session] -= 1
+            if self._session_users[session]:
+                return
+            del self._session_users[session]
+            if session is self._session:
+                self._session_last_used = time.monotonic()
+            else:
+                session.close()
+
+    def request(self, method, url, data=None, headers=None, verify=True,
+                cert=None, timeout=None, stream=False):
+        session = self._acquire_session()
+        try:
+            return session.request(method, url, data=data, headers=headers,
+                                   verify=verify, cert=cert,
+                                   timeout=timeout, stream=stream)
+        finally:
+            self._release_session(session)
+
+    def close(self):
+        with self._session_lock:
+            self._retire_session()
+
+    def get_pool_stats(self):
+        return self._pool_stats.as_dict()
+
+
+class _HTTPXStream(object):
+    """File-like view of a streamed httpx response, for Response.raw."""
+
+    def __init__(self, response):
+        self._response = response
+        self._chunks = response.iter_bytes()
+        self._buffer = b''
+
+    def read(self, amt=None):
+        while amt is None or len(self._buffer) < amt:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        if amt is None:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self):
+        self._response.close()
+
+
+def _caused_by_ssl_error(exc):
+    while exc is not None:
+        if isinstance(exc, ssl.SSLError):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+class HTTPXTransport(Transport):
+    """Transport backed by httpx, multiplexing requests over HTTP/2.
+
+    With HTTP/2 the concurrent requests of a process share one connection
+    per host instead of a pool of HTTP/1.1 sockets. HTTP/2 is negotiated
+    over TLS; plain HTTP endpoints are served over HTTP/1.1. Requires the
+    optional ``httpx`` library, and ``h2`` for HTTP/2.
+    """
+
+    def __init__(self, pool_connections=None, pool_maxsize=None,
+                 pool_idle_timeout=None, http2=True):
+        if httpx is None:
+            raise ImportError(_('httpx is required by the httpx transport'))
+        self.http2 = http2
+        limits = {'max_connections': (pool_maxsize or
+                                      adapters.DEFAULT_POOLSIZE)}
+        if pool_idle_timeout:
+            limits['keepalive_expiry'] = pool_idle_timeout
+        self.limits = httpx.Limits(**limits)
+        self._clients_lock = threading.Lock()
+        # httpx sets the TLS options per client, not per request.
+        self._clients = {}
+        self._pool_stats = _PoolStats()
+
+    def _get_client(self, verify, cert):
+        key = (verify, cert)
+        with self._clients_lock:
+            if key not in self._clients:
+                self._clients[key] = httpx.Client(
+                    http2=self.http2, verify=verify, cert=cert,
+                    limits=self.limits)
+            return self._clients[key]
+
+    @staticmethod
+    def _convert_response(xresp, stream):
+        resp = requests.Response()
+        resp.status_code = xresp.status_code
+        resp.reason = xresp.reason_phrase
+        resp.headers = requests.structures.CaseInsensitiveDict(xresp.headers)
+        resp.url = str(xresp.url)
+        resp.encoding = xresp.charset_encoding or 'utf-8'
+        resp.request = requests.Request(xresp.request.method,
+                                        resp.url).prepare()
+        if stream:
+            resp.raw = _HTTPXStream(xresp)
+        else:
+            resp._content = xresp.content
+        return resp
+
+    def request(self, method, url, data=None, headers=None, verify=True,
+                cert=None, timeout=None, stream=False):
+        self._pool_stats.record_request()
+        client = self._get_client(verify, cert)
+        xreq = client.build_request(method, url, content=data,
+                                    headers=headers, timeout=timeout)
+        try:
+            xresp = client.send(xreq, stream=stream)
+        except httpx.ConnectError as e:
+            # Raised as by RequestsTransport, for HTTPClient to map it
+            if _caused_by_ssl_error(e):
+                raise requests.exceptions.SSLError(str(e)) from e
+            raise
+        return self._convert_response(xresp, stream)
+
+    def close(self):
+        with self._clients_lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients = {}
+
+    def get_pool_stats(self):
+        # httpx does not expose its connection reuse.
+        return {'requests': self._pool_stats.as_dict()['requests']}
+
+
+TRANSPORTS = {
+    'requests': RequestsTransport,
+    'httpx': HTTPXTransport,
+}
+
+
+def _refresh_token(client_ref, token):
+    """Timer callback renewing the token of a client still in use."""
+    http_client = client_ref()
+    if http_client is not None:
+        http_client._refresh_token(token, proactive=True)
+
+
+def get_transport(transport=None, **kwargs):
+    """Return a Transport instance.
+
+    :param transport: a Transport instance, or the name of one of the
+                      TRANSPORTS ('requests' by default) built with the
+                      keyword arguments.
+    """
+    if isinstance(transport, Transport):
+        return transport
+    try:
+        transport_cls = TRANSPORTS[transport or 'requests']
+    except KeyError:
+        raise exceptions.UnsupportedTransport(transport=transport)
+    return transport_cls(**kwargs)
+
+
 class HTTPClient(object):
     """Handles the REST calls and responses, include authn."""
 
@@ -63,7 +369,10 @@ class HTTPClient(object):
                  endpoint_type='publicURL',
                  auth_strategy='keystone', ca_cert=None, cert=None,
                  log_credentials=False, service_type='network',
-                 global_request_id=None, **kwargs):
+                 global_request_id=None, pool_connections=None,
+                 pool_maxsize=None, pool_idle_timeout=None, transport=None,
+                 token_cache=None, token_refresh_margin=30,
+                 background_token_refresh=False, **kwargs):
 
         self.username = username
         self.user_id = user_id
@@ -79,6 +388,9 @@ class HTTPClient(object):
         self.auth_tenant_id = None
         self.auth_user_id = None
         self.endpoint_url = endpoint_url
+        # endpoint_url is filled in from the catalog, the token cache keys
+        # depend on the one given by the user only.
+        self._endpoint_override = endpoint_url
         self.auth_strategy = auth_strategy
         self.log_credentials = log_credentials
         self.global_request_id = global_request_id
@@ -87,15 +399,50 @@ class HTTPClient(object):
             self.verify_cert = False
         else:
             self.verify_cert = ca_cert if ca_cert else True
+        self.transport = get_transport(transport,
+                                       pool_connections=pool_connections,
+                                       pool_maxsize=pool_maxsize,
+                                       pool_idle_timeout=pool_idle_timeout)
+        if token_cache is True:
+            token_cache = tokencache.TokenCache()
+        self.token_cache = token_cache or None
+        self.token_refresh_margin = token_refresh_margin
+        self.background_token_refresh = background_token_refresh
+        # Serializes the authentications of the threads sharing this client
+        self._auth_lock = threading.RLock()
+        self._refresh_timer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close all pooled connections held by this client."""
+        self._cancel_refresh()
+        self.transport.close()
+
+    def get_pool_stats(self):
+        """Return connection pool statistics.
+
+        The returned dict holds the number of ``requests`` sent, the number
+        of ``new_connections`` opened and the number of ``hits``, i.e.
+        requests served over an already established connection.
+        """
+        return self.transport.get_pool_stats()
 
     def _cs_request(self, *args, **kwargs):
         kargs = {}
-        kargs.setdefault('headers', kwargs.get('headers', {}))
+        kargs['headers'] = dict(kwargs.get('headers') or {})
         kargs['headers']['User-Agent'] = USER_AGENT
 
         if 'body' in kwargs:
             kargs['body'] = kwargs['body']
 
+        if kwargs.get('stream'):
+            kargs['stream'] = True
+
         if self.log_credentials:
             log_kargs = kargs
         else:
@@ -138,16 +485,79 @@ class HTTPClient(object):
             return kwargs
 
     def authenticate_and_fetch_endpoint_url(self):
-        if not self.auth_token:
-            self.authenticate()
-        elif not self.endpoint_url:
-            self.endpoint_url = self._get_endpoint_url()
+        if self.auth_token and self.endpoint_url:
+            if self._token_expiring():
+                self._refresh_token(self.auth_token, proactive=True)
+            return
+        with self._auth_lock:
+            if not self.auth_token:
+                self.authenticate()
+            elif not self.endpoint_url:
+                self.endpoint_url = self._get_cached_endpoint_url()
+
+    def _token_expires(self):
+        """Return the expiry timestamp of the token, None if unknown."""
+        auth_ref = getattr(self, 'auth_ref', None)
+        if (auth_ref is None or auth_ref.expires is None or
+                auth_ref.auth_token != self.auth_token):
+            return None
+        return auth_ref.expires.timestamp()
+
+    def _token_expiring(self):
+        if self.token_refresh_margin is None:
+            return False
+        expires = self._token_expires()
+        return (expires is not None and
+                expires - self.token_refresh_margin <= time.time())
+
+    def _refresh_token(self, token, proactive=False):
+        """Authenticate again unless token was already replaced.
+
+        The threads holding the same stale token wait for the first one to
+        authenticate and then use its token. Failures of a proactive
+        refresh are only logged as the current token is still valid.
+        """
+        with self._auth_lock:
+            if self.auth_token != token:
+                return
+            try:
+                self.authenticate()
+            except Exception as e:
+                if not proactive:
+                    raise
+                _logger.debug('Unable to refresh the token: %s', e)
+
+    def _schedule_refresh(self):
+        """Renew the token in the background shortly before it expires."""
+        if (not self.background_token_refresh or
+                self.token_refresh_margin is None):
+            return
+        expires = self._token_expires()
+        if expires is None:
+            return
+        delay = max(0, expires - self.token_refresh_margin - time.time())
+        timer = threading.Timer(delay, _refresh_token,
+                                (weakref.ref(self), self.auth_token))
+        timer.daemon = True
+        with self._auth_lock:
+            self._cancel_refresh()
+            self._refresh_timer = timer
+        timer.start()
+
+    def _cancel_refresh(self):
+        timer, self._refresh_timer = self._refresh_timer, None
+        if timer is not None:
+            timer.cancel()
 
     def request(self, url, method, body=None, headers=None, **kwargs):
-        """Request without authentication."""
+        """Request without authentication.
+
+        When ``stream`` is set the response body is not read and ``None`` is
+        returned in place of the body text.
+        """
 
         content_type = kwargs.pop('content_type', None) or 'application/json'
-        headers = headers or {}
+        headers = dict(headers or {})
         headers.setdefault('Accept', content_type)
 
         if body:
@@ -162,7 +572,7 @@ class HTTPClient(object):
         if osprofiler_web:
             headers.update(osprofiler_web.get_trace_id_headers())
 
-        resp = requests.request(
+        resp = self.transport.request(
             method,
             url,
             data=body,
@@ -170,8 +580,10 @@ class HTTPClient(object):
             verify=self.verify_cert,
             cert=self.cert,
             timeout=self.timeout,
-            **kwargs)
+            stream=kwargs.get('stream', False))
 
+        if kwargs.get('stream'):
+            return resp, None
         return resp, resp.text
 
     def _check_uri_length(self, action):
@@ -188,18 +600,19 @@ class HTTPClient(object):
         # Perform the request once. If we get a 401 back then it
         # might be because the auth token expired, so try to
         # re-authenticate and try again. If it still fails, bail.
+        # The headers of the caller are copied, they may be shared by
+        # several threads.
+        headers = kwargs.get('headers') or {}
+        token = self.auth_token
         try:
-            kwargs['headers'] = kwargs.get('headers') or {}
-            if self.auth_token is None:
-                self.auth_token = ""
-            kwargs['headers']['X-Auth-Token'] = self.auth_token
+            kwargs['headers'] = dict(headers, **{'X-Auth-Token': token or ""})
             resp, body = self._cs_request(self.endpoint_url + url, method,
                                           **kwargs)
             return resp, body
         except exceptions.Unauthorized:
-            self.authenticate()
-            kwargs['headers'] = kwargs.get('headers') or {}
-            kwargs['headers']['X-Auth-Token'] = self.auth_token
+            self._refresh_token(token)
+            kwargs['headers'] = dict(headers,
+                                     **{'X-Auth-Token': self.auth_token})
             resp, body = self._cs_request(
                 self.endpoint_url + url, method, **kwargs)
             return resp, body
@@ -259,9 +672,81 @@ class HTTPClient(object):
                         'using --os-url')
             raise exceptions.Unauthorized(message=message)
 
+    def _token_cache_key(self):
+        return self.token_cache.key(
+            'token', self.auth_url, self.user_id, self.username,
+            self.password, self.project_id, self.project_name,
+            self.region_name, self.service_type, self.endpoint_type,
+            self._endpoint_override)
+
+    def _authenticate_cached(self):
+        """Authenticate with a token of the cache if there is one.
+
+        A cached token equal to the current one, which was just rejected
+        by the server, is replaced.
+        """
+        key = self._token_cache_key()
+        rejected = self.auth_token
+        entry = self.token_cache.get(key)
+        if entry is None or entry['token'] == rejected:
+            with self.token_cache.lock(key):
+                # Another process may have refreshed it in the meantime
+                entry = self.token_cache.get(key)
+                if entry is None or entry['token'] == rejected:
+                    self._authenticate_keystone()
+                    entry = self._get_token_cache_entry()
+                    if entry is not None:
+                        self.token_cache.set(key, entry)
+                    return
+        if not self.endpoint_url:
+            self.endpoint_url = entry['endpoint_url']
+        self._extract_service_catalog(entry['access'])
+
+    def _get_token_cache_entry(self):
+        """Return the cache entry of the current token, None if unusable."""
+        auth_ref = self.auth_ref
+        if auth_ref.expires is None or not self.endpoint_url:
+            return None
+        # Keep what get_auth_ref() users need, but not the catalog as the
+        # endpoint is already resolved.
+        access_body = {'access': {
+            'token': {'id': auth_ref.auth_token,
+                      'expires': auth_ref.expires.isoformat(),
+                      'tenant': {'id': auth_ref.project_id,
+                                 'name': auth_ref.project_name}},
+            'user': {'id': auth_ref.user_id,
+                     'name': auth_ref.username,
+                     'roles': [{'name': role}
+                               for role in auth_ref.role_names]},
+            'serviceCatalog': []}}
+        return {'token': auth_ref.auth_token,
+                'expires': auth_ref.expires.timestamp(),
+                'endpoint_url': self.endpoint_url,
+                'access': access_body}
+
+    def _get_cached_endpoint_url(self):
+        if self.token_cache is None:
+            return self._get_endpoint_url()
+        key = self.token_cache.key(
+            'endpoint', self.auth_url, self.auth_token, self.region_name,
+            self.service_type, self.endpoint_type)
+        entry = self.token_cache.get(key)
+        if entry is not None:
+            return entry['endpoint_url']
+        endpoint_url = self._get_endpoint_url()
+        self.token_cache.set(key, {
+            'endpoint_url': endpoint_url,
+            'expires': time.time() + self.token_cache.endpoint_ttl})
+        return endpoint_url
+
     def authenticate(self):
         if self.auth_strategy == 'keystone':
-            self._authenticate_keystone()
+            with self._auth_lock:
+                if self.token_cache is None:
+                    self._authenticate_keystone()
+                else:
+                    self._authenticate_cached()
+                self._schedule_refresh()
         elif self.auth_strategy == 'noauth':
             self._authenticate_noauth()
         else:
@@ -310,7 +795,7 @@ class SessionClient(adapter.Adapter):
 
         content_type = kwargs.pop('content_type', None) or 'application/json'
 
-        headers = kwargs.get('headers') or {}
+        headers = dict(kwargs.get('headers') or {})
         headers.setdefault('Accept', content_type)
 
         # NOTE(dbelova): osprofiler_web.get_trace_id_headers does not add any
@@ -328,6 +813,8 @@ class SessionClient(adapter.Adapter):
 
         kwargs['headers'] = headers
         resp = super(SessionClient, self).request(*args, **kwargs)
+        if kwargs.get('stream'):
+            return resp, None
         return resp, resp.text
 
     def _check_uri_length(self, url):
@@ -381,6 +868,160 @@ class SessionClient(adapter.Adapter):
         return self.session.auth.get_auth_ref(self.session)
 
 
+class AsyncHTTPClient(object):
+    """asyncio HTTP client for the Neutron API, based on aiohttp.
+
+    The token and the endpoint are either given directly or obtained from
+    a keystoneauth session. The calls to keystone are blocking, so they run
+    in the default executor of the event loop; they only happen on the
+    first request and when the token is rejected.
+    """
+
+    def __init__(self, endpoint_url=None, token=None, session=None,
+                 auth=None, auth_strategy='keystone', service_type='network',
+                 endpoint_type='public', region_name=None, timeout=None,
+                 insecure=False, ca_cert=None, cert=None,
+                 global_request_id=None, pool_maxsize=None,
+                 log_credentials=None, **kwargs):
+        if aiohttp is None:
+            raise ImportError(_('aiohttp is required by the asyncio client'))
+        if session is None and not token and auth_strategy != 'noauth':
+            raise exceptions.Unauthorized(
+                message=_('The asyncio client requires a token or a '
+                          'keystoneauth session'))
+        self.endpoint_url = endpoint_url
+        self.auth_token = token
+        self.session = session
+        self.auth = auth
+        self.auth_strategy = auth_strategy
+        self.service_type = service_type
+        self.endpoint_type = endpoint_type
+        self.region_name = region_name
+        self.timeout = timeout
+        self.global_request_id = global_request_id
+        self.pool_maxsize = pool_maxsize
+        if insecure:
+            self._ssl = False
+        else:
+            self._ssl = ssl.create_default_context(cafile=ca_cert)
+            if isinstance(cert, tuple):
+                self._ssl.load_cert_chain(*cert)
+            elif cert:
+                self._ssl.load_cert_chain(cert)
+        self._session = None
+
+    async def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_maxsize or 100,
+                                             ssl=self._ssl)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self._session
+
+    async def close(self):
+        """Close the connections of the underlying aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(func, *args, **kwargs))
+
+    async def authenticate(self):
+        if self.session is None:
+            if not self.endpoint_url:
+                raise exceptions.Unauthorized(
+                    message=_('The endpoint must be specified when no '
+                              'keystoneauth session is used'))
+            return
+        self.auth_token = await self._run_blocking(self.session.get_token,
+                                                   self.auth)
+        if not self.endpoint_url:
+            self.endpoint_url = await self._run_blocking(
+                self.session.get_endpoint, self.auth,
+                service_type=self.service_type,
+                interface=self.endpoint_type,
+                region_name=self.region_name)
+
+    @staticmethod
+    def _convert_response(method, aresp, content):
+        """Build a requests.Response out of an aiohttp response."""
+        resp = requests.Response()
+        resp.status_code = aresp.status
+        resp.reason = aresp.reason
+        resp.headers = requests.structures.CaseInsensitiveDict(aresp.headers)
+        resp.url = str(aresp.url)
+        resp.encoding = aresp.charset or 'utf-8'
+        resp.request = requests.Request(method, resp.url).prepare()
+        resp._content = content
+        return resp
+
+    async def request(self, url, method, body=None, headers=None,
+                      content_type=None):
+        """Request without authentication."""
+        content_type = content_type or 'application/json'
+        headers = dict(headers or {})
+        headers.setdefault('Accept', content_type)
+        if body:
+            headers.setdefault('Content-Type', content_type)
+        if self.global_request_id:
+            headers.setdefault(REQ_ID_HEADER, self.global_request_id)
+        headers['User-Agent'] = USER_AGENT
+        if osprofiler_web:
+            headers.update(osprofiler_web.get_trace_id_headers())
+
+        utils.http_log_req(_logger, (url, method),
+                           {'headers': headers, 'body': body})
+        session = await self._get_session()
+        try:
+            async with session.request(method, url, data=body,
+                                       headers=headers) as aresp:
+                content = await aresp.read()
+        except aiohttp.ClientSSLError as e:
+            raise exceptions.SslCertificateValidationError(reason=str(e))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _logger.debug("throwing ConnectionFailed : %s", e)
+            raise exceptions.ConnectionFailed(reason=str(e))
+        resp = self._convert_response(method, aresp, content)
+        utils.http_log_resp(_logger, resp, resp.text)
+        return resp, resp.text
+
+    def _check_uri_length(self, action):
+        uri_len = len(self.endpoint_url) + len(action)
+        if uri_len > MAX_URI_LEN:
+            raise exceptions.RequestURITooLong(
+                excess=uri_len - MAX_URI_LEN)
+
+    async def do_request(self, url, method, body=None, headers=None):
+        if not self.endpoint_url or (self.session is not None and
+                                     not self.auth_token):
+            await self.authenticate()
+        self._check_uri_length(url)
+
+        headers = dict(headers or {})
+        if self.auth_token:
+            headers['X-Auth-Token'] = self.auth_token
+        resp, replybody = await self.request(self.endpoint_url + url, method,
+                                             body=body, headers=headers)
+        if resp.status_code == 401 and self.session is not None:
+            # The token might have expired, fetch a new one and retry once.
+            await self._run_blocking(self.session.invalidate, self.auth)
+            await self.authenticate()
+            headers['X-Auth-Token'] = self.auth_token
+            resp, replybody = await self.request(
+                self.endpoint_url + url, method, body=body, headers=headers)
+        if resp.status_code == 401:
+            raise exceptions.Unauthorized(message=replybody)
+        return resp, replybody
+
+    def get_auth_info(self):
+        return {'auth_token': self.auth_token,
+                'endpoint_url': self.endpoint_url}
+
+
 # FIXME(bklei): Should refactor this to use kwargs and only
 # explicitly list arguments that are not None.
 @debtcollector.renames.renamed_kwarg('tenant_id', 'project_id', replace=True)
@@ -405,6 +1046,13 @@ def construct_http_client(username=None,
                           service_type='network',
                           session=None,
                           global_request_id=None,
+                          pool_connections=None,
+                          pool_maxsize=None,
+                          pool_idle_timeout=None,
+                          transport=None,
+                          token_cache=None,
+                          token_refresh_margin=30,
+                          background_token_refresh=False,
                           **kwargs):
 
     if session:
@@ -436,4 +1084,11 @@ def construct_http_client(username=None,
                           cert=cert,
                           log_credentials=log_credentials,
                           auth_strategy=auth_strategy,
-                          global_request_id=global_request_id)
+                          global_request_id=global_request_id,
+                          pool_connections=pool_connections,
+                          pool_maxsize=pool_maxsize,
+                          pool_idle_timeout=pool_idle_timeout,
+                          transport=transport,
+                          token_cache=token_cache,
+                          token_refresh_margin=token_refresh_margin,
+                          background_token_refresh=background_token_refresh)
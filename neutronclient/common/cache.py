@@ -0,0 +1,180 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""In-memory caches used by the client."""
+
+import asyncio
+import collections
+import threading
+import time
+
+
+class TTLCache(object):
+    """A thread-safe LRU cache whose entries expire after a time to live.
+
+    :param maxsize: maximum number of entries. The least recently used entry
+                    is evicted when the cache is full.
+    :param ttl: number of seconds an entry stays valid, None for no expiry.
+    :param timer: callable returning the current time in seconds.
+    """
+
+    def __init__(self, maxsize=1024, ttl=60, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._data = collections.OrderedDict()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                return default
+            if expires is not None and expires <= self._timer():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            expires = None
+            if self.ttl is not None:
+                expires = self._timer() + self.ttl
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def invalidate(self, predicate):
+        """Drop the entries for which predicate(key, value) is true."""
+        with self._lock:
+            stale = [key for key, (_expires, value) in self._data.items()
+                     if predicate(key, value)]
+            for key in stale:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class _Flight(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Coalesce concurrent calls sharing the same key.
+
+    While a call is in flight, the callers asking for the same key wait for
+    it and share its outcome instead of making their own call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key, func, *args, **kwargs):
+        """Call func, or wait for the identical call in flight.
+
+        :returns: a tuple of the result and a boolean telling whether the
+                  result is shared with other callers, in which case it
+                  must not be modified.
+        :raises: the exception raised by the call.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.waiters += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+        try:
+            flight.result = func(*args, **kwargs)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+                shared = flight.waiters > 0
+            flight.done.set()
+        return flight.result, shared
+
+
+class _AsyncFlight(object):
+    def __init__(self):
+        self.future = asyncio.get_running_loop().create_future()
+        self.waiters = 0
+
+
+class AsyncSingleFlight(object):
+    """Coalesce the concurrent coroutines of an event loop sharing a key.
+
+    The asyncio counterpart of SingleFlight: the coroutines asking for a
+    key while a call is in flight await its outcome.
+    """
+
+    def __init__(self):
+        self._flights = {}
+
+    async def do(self, key, func, *args, **kwargs):
+        """Await func(), or the identical call in flight.
+
+        :returns: a tuple of the result and a boolean telling whether the
+                  result is shared with other callers, in which case it
+                  must not be modified.
+        :raises: the exception raised by the call.
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            flight.waiters += 1
+            # A cancelled waiter must not cancel the call of the others
+            return await asyncio.shield(flight.future), True
+        flight = self._flights[key] = _AsyncFlight()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            if flight.waiters:
+                flight.future.set_exception(e)
+            raise
+        else:
+            if flight.waiters:
+                flight.future.set_result(result)
+            return result, flight.waiters > 0
+        finally:
+            del self._flights[key]
+            # Cancel the waiters if the call itself was cancelled
+            if not flight.future.done():
+                flight.future.cancel()
@@ -69,6 +69,7 @@ class ClientManager(object):
                  raise_errors=True,
                  session=None,
                  auth=None,
+                 trust_uuids=False,
                  ):
         self._token = token
         self._url = url
@@ -93,6 +94,7 @@ class ClientManager(object):
         self._raise_errors = raise_errors
         self._session = session
         self._auth = auth
+        self._trust_uuids = trust_uuids
         return
 
     def initialize(self):
@@ -72,6 +72,8 @@ class NeutronClientException(NeutronException):
     status_code = 0
     req_ids_msg = _("Neutron server returns request_ids: %s")
     request_ids = []
+    # Headers of the error response, when there was one
+    response_headers = None
 
     def __init__(self, message=None, **kwargs):
         self.request_ids = kwargs.get('request_ids')
@@ -112,6 +114,15 @@ class Conflict(NeutronClientException):
     status_code = 409
 
 
+class RequestURITooLong(NeutronClientException):
+    """Raised when a request fails with HTTP error 414."""
+    status_code = 414
+
+    def __init__(self, **kwargs):
+        self.excess = kwargs.get('excess', 0)
+        super(RequestURITooLong, self).__init__(**kwargs)
+
+
 class InternalServerError(NeutronClientException):
     status_code = 500
 
@@ -126,6 +137,7 @@ HTTP_EXCEPTION_MAP = {
     403: Forbidden,
     404: NotFound,
     409: Conflict,
+    414: RequestURITooLong,
     500: InternalServerError,
     503: ServiceUnavailable,
 }
@@ -211,14 +223,6 @@ class AmbiguousEndpoints(NeutronClientException):
                 "%(matching_endpoints)")
 
 
-class RequestURITooLong(NeutronClientException):
-    """Raised when a request fails with HTTP error 414."""
-
-    def __init__(self, **kwargs):
-        self.excess = kwargs.get('excess', 0)
-        super(RequestURITooLong, self).__init__(**kwargs)
-
-
 class ConnectionFailed(NeutronClientException):
     message = _("Connection to neutron failed: %(reason)s")
 
@@ -235,6 +239,14 @@ class InvalidContentType(NeutronClientException):
     message = _("Invalid content type %(content_type)s.")
 
 
+class UnsupportedJSONEngine(NeutronClientException):
+    message = _("JSON engine %(engine)s is unknown or not installed.")
+
+
+class UnsupportedTransport(NeutronClientException):
+    message = _("Transport %(transport)s is unknown.")
+
+
 # Command line exceptions
 
 class NeutronCLIError(NeutronException):
@@ -255,6 +267,35 @@ class UnsupportedVersion(NeutronCLIError):
     pass
 
 
+class ResourceLookupError(NotFound):
+    """Raised when some names or IDs of a bulk lookup cannot be resolved.
+
+    The unresolved values are available from the ``not_found`` and
+    ``ambiguous`` attributes, the resolved ones from the ``found`` dict.
+    It is a NotFound, like the errors of the single resource lookups.
+    """
+
+    def __init__(self, resource, not_found=(), ambiguous=(), found=None,
+                 **kwargs):
+        self.resource = resource
+        self.not_found = list(not_found)
+        self.ambiguous = list(ambiguous)
+        self.found = found or {}
+        msgs = []
+        if self.not_found:
+            msgs.append(_("Unable to find %(resource)s with name or id "
+                          "'%(names)s'.") %
+                        {'resource': resource,
+                         'names': "', '".join(self.not_found)})
+        if self.ambiguous:
+            msgs.append(_("Multiple %(resource)s matches found for name "
+                          "'%(names)s', use an ID to be more specific.") %
+                        {'resource': resource,
+                         'names': "', '".join(self.ambiguous)})
+        super(ResourceLookupError, self).__init__(message='\n'.join(msgs),
+                                                  **kwargs)
+
+
 class NeutronClientNoUniqueMatch(NeutronCLIError):
     message = _("Multiple %(resource)s matches found for name '%(name)s',"
                 " use an ID to be more specific.")
@@ -0,0 +1,247 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Instrumentation of the requests sent by the clients."""
+
+import bisect
+import collections
+import json
+import threading
+import time
+
+
+class RequestEvent(collections.namedtuple(
+        'RequestEvent', ['method', 'path_template', 'path', 'status_code',
+                         'request_bytes', 'response_bytes', 'serialize_time',
+                         'throttle_time', 'network_time', 'deserialize_time',
+                         'retries', 'request_id', 'error'])):
+    """Description of a request, passed to the request observers.
+
+    :param method: HTTP method.
+    :param path_template: the ``*_path`` attribute of the client the path
+                          was built from, e.g. '/ports/%s', or None if
+                          unknown.
+    :param path: path of the request, without the version prefix and the
+                 query string.
+    :param status_code: status of the response, None if none was received.
+    :param request_bytes: size of the request body.
+    :param response_bytes: size of the response body, None if it was
+                           streamed.
+    :param serialize_time: seconds spent encoding the request body.
+    :param throttle_time: seconds spent waiting for the rate limiter.
+    :param network_time: seconds spent sending the request and receiving
+                         the response, authentication included.
+    :param deserialize_time: seconds spent decoding the response body.
+    :param retries: number of earlier attempts of this request.
+    :param request_id: the x-openstack-request-id of the response.
+    :param error: exception raised by the request, or None.
+    """
+
+    __slots__ = ()
+
+    @property
+    def elapsed(self):
+        """Total duration of the request in seconds."""
+        return (self.serialize_time + self.throttle_time +
+                self.network_time + self.deserialize_time)
+
+
+class Timing(object):
+    """Measure the successive phases of a request.
+
+    The first phase starts when the object is created, each call to
+    phase() ends the current one.
+    """
+
+    __slots__ = ('_current', '_start', 'durations')
+
+    def __init__(self, phase):
+        self._current = phase
+        self._start = time.perf_counter()
+        self.durations = {}
+
+    def phase(self, name):
+        now = time.perf_counter()
+        if self._current is not None:
+            self.durations[self._current] = (
+                self.durations.get(self._current, 0.0) + now - self._start)
+        self._current = name
+        self._start = now
+
+    def stop(self):
+        self.phase(None)
+
+    def get(self, name):
+        return self.durations.get(name, 0.0)
+
+
+# Upper bounds of the histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0)
+
+
+class Histogram(object):
+    """Histogram of durations with fixed buckets.
+
+    It is not thread-safe, the LatencyAggregator owning it serializes its
+    updates.
+
+    :param buckets: sorted upper bounds of the buckets in seconds. A last
+                    bucket counts the values above them.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """Estimate a quantile by interpolating within its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[i - 1] if i else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+    def as_dict(self):
+        return {'count': self.count,
+                'sum': self.sum,
+                'max': self.max,
+                'buckets': [[bound, count] for bound, count in
+                            zip(self.buckets + ('+Inf',), self.counts)],
+                'p50': self.quantile(0.5),
+                'p90': self.quantile(0.9),
+                'p99': self.quantile(0.99)}
+
+
+class _EndpointStats(object):
+
+    def __init__(self, buckets):
+        self.latency = Histogram(buckets)
+        self.network = Histogram(buckets)
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.statuses = collections.Counter()
+
+    def record(self, event):
+        self.latency.observe(event.elapsed)
+        self.network.observe(event.network_time)
+        if event.error is not None:
+            self.errors += 1
+        if event.retries:
+            self.retries += 1
+        self.request_bytes += event.request_bytes
+        self.response_bytes += event.response_bytes or 0
+        self.statuses[str(event.status_code)] += 1
+
+    def as_dict(self):
+        return {'latency': self.latency.as_dict(),
+                'network': self.network.as_dict(),
+                'errors': self.errors,
+                'retries': self.retries,
+                'request_bytes': self.request_bytes,
+                'response_bytes': self.response_bytes,
+                'statuses': dict(self.statuses)}
+
+
+class LatencyAggregator(object):
+    """Request observer keeping latency histograms per endpoint.
+
+    An endpoint is a method and a path template, e.g. ``GET /ports/%s``;
+    the requests whose template is unknown are grouped under the
+    ``unknown`` path. It may observe several clients and be read while
+    they send requests.
+
+    Example::
+
+        aggregator = metrics.LatencyAggregator()
+        neutron = client.Client(..., request_observers=[aggregator])
+        ...
+        print(aggregator.dumps())
+
+    :param buckets: upper bounds of the histogram buckets in seconds.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def __call__(self, event):
+        key = (event.method, event.path_template or 'unknown')
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _EndpointStats(self.buckets)
+            stats.record(event)
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    def snapshot(self):
+        """Return the statistics of each endpoint as a dict.
+
+        The keys are ``'<method> <path template>'``, the durations are in
+        seconds.
+        """
+        with self._lock:
+            return dict(('%s %s' % key, stats.as_dict())
+                        for key, stats in sorted(self._stats.items()))
+
+    def dumps(self):
+        """Return the snapshot as a JSON document."""
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def dump(self, fp):
+        """Write the snapshot as JSON to a file object."""
+        fp.write(self.dumps())
+
+    def prometheus(self, prefix='neutronclient'):
+        """Return the latencies in the Prometheus text exposition format."""
+        name = '%s_request_duration_seconds' % prefix
+        lines = ['# HELP %s Duration of the requests to Neutron.' % name,
+                 '# TYPE %s histogram' % name]
+        with self._lock:
+            for (method, path), stats in sorted(self._stats.items()):
+                labels = 'method="%s",path="%s"' % (
+                    method, path.replace('\\', '\\\\').replace('"', '\\"'))
+                histogram = stats.latency
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + ('+Inf',),
+                                        histogram.counts):
+                    cumulative += count
+                    lines.append('%s_bucket{%s,le="%s"} %d' % (
+                        name, labels, bound, cumulative))
+                lines.append('%s_sum{%s} %r' % (name, labels, histogram.sum))
+                lines.append('%s_count{%s} %d' % (name, labels,
+                                                  histogram.count))
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,205 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Client-side rate and concurrency limiting."""
+
+import contextlib
+import threading
+import time
+
+from keystoneauth1 import exceptions as ksa_exc
+
+from neutronclient.common import exceptions
+
+
+class TokenBucket(object):
+    """A thread-safe token bucket.
+
+    :param rate: number of tokens added per second.
+    :param burst: capacity of the bucket, one second worth of tokens by
+                  default.
+    :param timer: callable returning the current time in seconds.
+    :param sleep: callable used to wait for a token.
+    """
+
+    def __init__(self, rate, burst=None, timer=time.monotonic,
+                 sleep=time.sleep):
+        self.rate = float(rate)
+        self.burst = float(burst or max(1.0, self.rate))
+        self._timer = timer
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._last = timer()
+
+    def acquire(self):
+        """Take a token, waiting until one is available."""
+        while True:
+            with self._lock:
+                now = self._timer()
+                self._tokens = min(self.burst, self._tokens +
+                                   (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+
+class AIMDLimiter(object):
+    """Concurrency limit adapted by additive increase, multiplicative decrease.
+
+    The limit grows by ``increase`` after each window of ``limit`` requests
+    completed without overload, and is multiplied by ``decrease`` when a
+    request reports an overload or takes more than ``latency_tolerance``
+    times the lowest latency seen recently. It decreases at most once per
+    window so that a burst of errors is handled as a single signal.
+
+    :param initial: initial number of concurrent requests allowed.
+    :param minimum: lower bound of the limit.
+    :param maximum: upper bound of the limit.
+    :param increase: additive increase of the limit.
+    :param decrease: multiplicative decrease of the limit.
+    :param latency_tolerance: latency ratio, relative to the baseline,
+                              handled as an overload. None to ignore
+                              latencies.
+    """
+
+    # Relative drift of the latency baseline per request, so that it
+    # follows a server which got slower for good.
+    BASELINE_DRIFT = 1.001
+
+    def __init__(self, initial=8, minimum=1, maximum=256, increase=1,
+                 decrease=0.5, latency_tolerance=2.0):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._successes = 0
+        self._since_decrease = 0
+        self._baseline = None
+
+    @property
+    def inflight(self):
+        return self._inflight
+
+    def acquire(self):
+        """Wait until a request may be sent."""
+        with self._cond:
+            while self._inflight >= int(self.limit):
+                self._cond.wait()
+            self._inflight += 1
+
+    def _is_slow(self, latency):
+        if latency is None or self.latency_tolerance is None:
+            return False
+        if self._baseline is None or latency < self._baseline:
+            self._baseline = latency
+            return False
+        self._baseline *= self.BASELINE_DRIFT
+        return latency > self._baseline * self.latency_tolerance
+
+    def release(self, latency=None, overloaded=False):
+        """Report the completion of a request.
+
+        :param latency: duration of the request in seconds.
+        :param overloaded: the server reported being overloaded.
+        """
+        with self._cond:
+            self._inflight -= 1
+            self._since_decrease += 1
+            if overloaded or self._is_slow(latency):
+                self._successes = 0
+                if self._since_decrease >= int(self.limit):
+                    self.limit = max(self.minimum,
+                                     self.limit * self.decrease)
+                    self._since_decrease = 0
+            else:
+                self._successes += 1
+                if self._successes >= int(self.limit):
+                    self.limit = min(self.maximum,
+                                     self.limit + self.increase)
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+class _Outcome(object):
+    overloaded = False
+
+    def record(self, status_code):
+        if status_code in RateLimiter.OVERLOAD_STATUSES:
+            self.overloaded = True
+
+
+class RateLimiter(object):
+    """Rate and concurrency limiter shared by the threads using a client.
+
+    Requests first take a token from the bucket of their HTTP method, then
+    a slot from the adaptive concurrency limiter. Responses with a status
+    in OVERLOAD_STATUSES, connection failures and high latencies make the
+    concurrency limit shrink; it grows back while requests succeed.
+
+    :param rates: dict mapping HTTP methods to requests per second.
+    :param default_rate: requests per second of the other methods, None
+                         for no limit.
+    :param burst: size of the buckets, one second worth of requests by
+                  default.
+    :param concurrency: an AIMDLimiter, True for a default one, or None to
+                        only limit the rate.
+    :param timer: callable returning the current time in seconds.
+    """
+
+    OVERLOAD_STATUSES = (429, 503)
+
+    def __init__(self, rates=None, default_rate=None, burst=None,
+                 concurrency=True, timer=time.monotonic):
+        self._buckets = dict((method.upper(), TokenBucket(rate, burst))
+                             for method, rate in (rates or {}).items())
+        self._default_bucket = (TokenBucket(default_rate, burst)
+                                if default_rate else None)
+        if concurrency is True:
+            concurrency = AIMDLimiter()
+        self.concurrency = concurrency
+        self._timer = timer
+
+    @contextlib.contextmanager
+    def limit(self, method):
+        """Wait for the permission to send a request.
+
+        The yielded object has a ``record(status_code)`` method which must
+        be called with the status of the response.
+        """
+        bucket = self._buckets.get(method.upper(), self._default_bucket)
+        if bucket is not None:
+            bucket.acquire()
+        if self.concurrency is None:
+            yield _Outcome()
+            return
+        self.concurrency.acquire()
+        outcome = _Outcome()
+        start = self._timer()
+        try:
+            yield outcome
+        except (exceptions.ConnectionFailed, ksa_exc.ConnectionError):
+            outcome.overloaded = True
+            raise
+        finally:
+            self.concurrency.release(self._timer() - start,
+                                     outcome.overloaded)
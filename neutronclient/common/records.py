@@ -0,0 +1,102 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compact read-only records for large list results."""
+
+import collections.abc
+
+
+class _Schema(object):
+    """Keys of a set of rows, shared by all of them."""
+
+    __slots__ = ('keys', 'index')
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.index = dict((key, i) for i, key in enumerate(keys))
+
+
+class Row(collections.abc.Mapping):
+    """A read-only mapping storing its values in a tuple.
+
+    The keys are held by a schema shared with the other rows of the same
+    shape, so a row costs little more than the tuple of its values.
+    """
+
+    __slots__ = ('_schema', '_values')
+
+    def __init__(self, schema, values):
+        self._schema = schema
+        self._values = values
+
+    def __getitem__(self, key):
+        try:
+            return self._values[self._schema.index[key]]
+        except KeyError:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self._schema.index
+
+    def __iter__(self):
+        return iter(self._schema.keys)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return 'Row(%r)' % self.to_dict()
+
+    def __reduce__(self):
+        return _row_from_dict, (self.to_dict(),)
+
+    def to_dict(self):
+        """Return the row as a new dict."""
+        return dict(zip(self._schema.keys, self._values))
+
+
+def _row_from_dict(values):
+    return RowList([values])[0]
+
+
+class RowList(list):
+    """A list converting the dicts added to it into rows.
+
+    The rows of a list share one schema per distinct set of keys.
+    """
+
+    def __init__(self, iterable=()):
+        super(RowList, self).__init__()
+        self._schemas = {}
+        self.extend(iterable)
+
+    def _to_row(self, item):
+        if isinstance(item, Row):
+            return item
+        keys = tuple(item)
+        schema = self._schemas.get(keys)
+        if schema is None:
+            schema = self._schemas[keys] = _Schema(keys)
+        return Row(schema, tuple(item.values()))
+
+    def append(self, item):
+        super(RowList, self).append(self._to_row(item))
+
+    def extend(self, iterable):
+        super(RowList, self).extend(self._to_row(item) for item in iterable)
+
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
@@ -0,0 +1,156 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Retry policies of the client."""
+
+import datetime
+import email.utils
+import random
+import time
+
+from keystoneauth1 import exceptions as ksa_exc
+
+from neutronclient.common import exceptions
+
+
+_random = random.SystemRandom()
+
+
+def parse_retry_after(value):
+    """Return the delay in seconds requested by a Retry-After header.
+
+    Both the delay-seconds and the HTTP-date forms are accepted. None is
+    returned for a missing or malformed value.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max((date - now).total_seconds(), 0.0)
+
+
+class RetryPolicy(object):
+    """Decide whether and when a failed request is retried.
+
+    The n-th retry waits ``backoff * factor ** (n - 1)`` seconds, capped at
+    ``max_backoff``. With ``jitter`` the actual delay is drawn uniformly
+    between zero and that value so that clients do not retry in lockstep.
+
+    :param max_retries: number of retries after the first attempt.
+    :param backoff: delay before the first retry, in seconds.
+    :param factor: multiplier applied to the delay after each retry.
+    :param max_backoff: upper bound of the computed delay, in seconds.
+    :param jitter: randomize the delays (full jitter).
+    :param max_elapsed: give up when the next attempt would start more than
+                        this many seconds after the first one. None for no
+                        limit.
+    :param retry_statuses: HTTP status codes of the error responses which
+                           are retried. Connection failures are always
+                           retried.
+    :param respect_retry_after: wait at least as long as the Retry-After
+                                header of an error response asks for.
+    :param max_retry_after: upper bound of the delay taken from a
+                            Retry-After header, in seconds. None for
+                            ``max_backoff``.
+    :param timer: callable returning the current time in seconds.
+    """
+
+    DEFAULT_RETRY_STATUSES = (429, 502, 503, 504)
+
+    def __init__(self, max_retries=3, backoff=0.5, factor=2.0,
+                 max_backoff=30.0, jitter=True, max_elapsed=None,
+                 retry_statuses=DEFAULT_RETRY_STATUSES,
+                 respect_retry_after=True, max_retry_after=None,
+                 timer=time.monotonic):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.factor = factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.max_elapsed = max_elapsed
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.timer = timer
+
+    @classmethod
+    def fixed(cls, retries, interval):
+        """Policy retrying connection failures at a fixed interval."""
+        return cls(max_retries=retries, backoff=interval, factor=1,
+                   jitter=False, retry_statuses=(),
+                   respect_retry_after=False)
+
+    def is_retryable(self, exc):
+        if isinstance(exc, (exceptions.ConnectionFailed,
+                            ksa_exc.ConnectionError)):
+            return True
+        return (isinstance(exc, exceptions.NeutronClientException) and
+                exc.status_code in self.retry_statuses)
+
+    def get_delay(self, retry, exc=None):
+        """Return the number of seconds to wait before the given retry."""
+        delay = min(self.backoff * self.factor ** (retry - 1),
+                    self.max_backoff)
+        if self.jitter:
+            delay = _random.uniform(0, delay)
+        if self.respect_retry_after:
+            headers = getattr(exc, 'response_headers', None) or {}
+            retry_after = parse_retry_after(headers.get('Retry-After'))
+            if retry_after is not None:
+                # Do not let the server hold the client for hours
+                if self.max_retry_after is None:
+                    limit = self.max_backoff
+                else:
+                    limit = self.max_retry_after
+                delay = max(delay, min(retry_after, limit))
+        return delay
+
+    def start(self):
+        """Return the state tracking the retries of one request."""
+        return RetryState(self)
+
+
+class RetryState(object):
+    """Retries done for one request under a RetryPolicy."""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.retries = 0
+        self.started = policy.timer()
+
+    def next_delay(self, exc):
+        """Return the delay before retrying after ``exc``.
+
+        None is returned when the failure is not retryable or when the
+        policy is exhausted.
+        """
+        policy = self.policy
+        if not policy.is_retryable(exc) or self.retries >= policy.max_retries:
+            return None
+        delay = policy.get_delay(self.retries + 1, exc)
+        if (policy.max_elapsed is not None and
+                policy.timer() - self.started + delay > policy.max_elapsed):
+            return None
+        self.retries += 1
+        return delay
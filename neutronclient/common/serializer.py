@@ -13,11 +13,44 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import codecs
+import functools
+import json
+
 from oslo_serialization import jsonutils
+from oslo_utils import importutils
 
 from neutronclient._i18n import _
 from neutronclient.common import exceptions as exception
 
+orjson = importutils.try_import('orjson')
+ujson = importutils.try_import('ujson')
+
+DEFAULT_JSON_ENGINE = 'jsonutils'
+
+
+def _orjson_dumps(data, default=None):
+    return orjson.dumps(data, default=default).decode('utf-8')
+
+
+def _get_json_engine(engine):
+    """Return the (dumps, loads) functions of a JSON engine.
+
+    Supported engines are ``jsonutils`` (the default), ``stdlib``, and
+    ``orjson`` or ``ujson`` when they are installed. The ``loads`` functions
+    accept both str and UTF-8 encoded bytes.
+    """
+    engine = engine or DEFAULT_JSON_ENGINE
+    if engine == 'jsonutils':
+        return jsonutils.dumps, jsonutils.loads
+    elif engine == 'stdlib':
+        return json.dumps, json.loads
+    elif engine == 'orjson' and orjson:
+        return _orjson_dumps, orjson.loads
+    elif engine == 'ujson' and ujson:
+        return ujson.dumps, ujson.loads
+    raise exception.UnsupportedJSONEngine(engine=engine)
+
 
 class ActionDispatcher(object):
     """Maps method name to local methods through action name."""
@@ -45,10 +78,13 @@ class DictSerializer(ActionDispatcher):
 class JSONDictSerializer(DictSerializer):
     """Default JSON request body serialization."""
 
+    def __init__(self, engine=None):
+        self._dumps = _get_json_engine(engine)[0]
+
     def default(self, data):
         def sanitizer(obj):
             return str(obj)
-        return jsonutils.dumps(data, default=sanitizer)
+        return self._dumps(data, default=sanitizer)
 
 
 class TextDeserializer(ActionDispatcher):
@@ -63,9 +99,12 @@ class TextDeserializer(ActionDispatcher):
 
 class JSONDeserializer(TextDeserializer):
 
+    def __init__(self, engine=None):
+        self._loads = _get_json_engine(engine)[1]
+
     def _from_json(self, datastring):
         try:
-            return jsonutils.loads(datastring)
+            return self._loads(datastring)
         except ValueError:
             msg = _("Cannot understand JSON")
             raise exception.MalformedResponseBody(reason=msg)
@@ -74,26 +113,131 @@ class JSONDeserializer(TextDeserializer):
         return {'body': self._from_json(datastring)}
 
 
+class JSONCollectionStreamDeserializer(object):
+    """Incrementally decode a collection from a stream of JSON bytes.
+
+    Iterating over the deserializer yields the members of the ``collection``
+    array of a list response one at a time, so that only a single resource
+    and one chunk of the response body are held in memory. The other members
+    of the top level object, e.g. the ``<collection>_links`` used for
+    pagination, are available from ``extra`` once the iteration completed.
+    """
+
+    def __init__(self, chunks, collection):
+        self.collection = collection
+        self.extra = {}
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _malformed(self):
+        msg = _("Cannot understand JSON")
+        return exception.MalformedResponseBody(reason=msg)
+
+    def _fill(self):
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            data = self._text.decode(b'', final=True)
+        else:
+            data = self._text.decode(chunk)
+        self._buf = self._buf[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            buf = self._buf
+            pos = self._pos
+            while pos < len(buf) and buf[pos] in ' \t\n\r':
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                raise self._malformed()
+
+    def _next_char(self):
+        char = self._peek()
+        self._pos += 1
+        return char
+
+    def _decode_value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                if not self._fill():
+                    raise self._malformed()
+                continue
+            # A number or a literal ending the buffer may be truncated.
+            if (end == len(self._buf) and
+                    not isinstance(value, (dict, list, str)) and
+                    self._fill()):
+                continue
+            self._pos = end
+            return value
+
+    def __iter__(self):
+        if self._next_char() != '{':
+            raise self._malformed()
+        if self._peek() == '}':
+            return
+        while True:
+            key = self._decode_value()
+            if not isinstance(key, str) or self._next_char() != ':':
+                raise self._malformed()
+            if key == self.collection and self._peek() == '[':
+                self._pos += 1
+                if self._peek() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._decode_value()
+                        char = self._next_char()
+                        if char == ']':
+                            break
+                        if char != ',':
+                            raise self._malformed()
+            else:
+                self.extra[key] = self._decode_value()
+            char = self._next_char()
+            if char == '}':
+                return
+            if char != ',':
+                raise self._malformed()
+
+
 # NOTE(maru): this class is duplicated from neutron.wsgi
 class Serializer(object):
     """Serializes and deserializes dictionaries to certain MIME types."""
 
-    def __init__(self, metadata=None):
+    def __init__(self, metadata=None, engine=None):
         """Create a serializer based on the given WSGI environment.
 
         'metadata' is an optional dict mapping MIME types to information
         needed to serialize a dictionary to that type.
+        'engine' is the name of the JSON engine to use.
 
         """
         self.metadata = metadata or {}
-
-    def _get_serialize_handler(self, content_type):
-        handlers = {
-            'application/json': JSONDictSerializer(),
+        self._serialize_handlers = {
+            'application/json': JSONDictSerializer(engine),
+        }
+        self._deserialize_handlers = {
+            'application/json': JSONDeserializer(engine),
         }
 
+    def _get_serialize_handler(self, content_type):
         try:
-            return handlers[content_type]
+            return self._serialize_handlers[content_type]
         except Exception:
             raise exception.InvalidContentType(content_type=content_type)
 
@@ -110,11 +254,17 @@ class Serializer(object):
             datastring)
 
     def get_deserialize_handler(self, content_type):
-        handlers = {
-            'application/json': JSONDeserializer(),
-        }
-
         try:
-            return handlers[content_type]
+            return self._deserialize_handlers[content_type]
         except Exception:
             raise exception.InvalidContentType(content_type=content_type)
+
+
+@functools.lru_cache(maxsize=None)
+def get_serializer(engine=None):
+    """Return the shared Serializer instance using the given JSON engine.
+
+    Serializers hold no per-request state, so a single instance per engine
+    is reused by all clients.
+    """
+    return Serializer(engine=engine)
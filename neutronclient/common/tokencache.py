@@ -0,0 +1,198 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""On-disk cache of keystone tokens shared by processes."""
+
+import contextlib
+import hashlib
+import hmac
+import json
+import logging
+import os
+import stat
+import threading
+import time
+
+from oslo_utils import importutils
+
+fcntl = importutils.try_import('fcntl')
+
+_logger = logging.getLogger(__name__)
+
+_SECRET_LEN = 32
+
+
+def _default_directory():
+    base = (os.environ.get('XDG_CACHE_HOME') or
+            os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base, 'neutronclient', 'tokens')
+
+
+class TokenCache(object):
+    """Cache of tokens and endpoints stored in a private directory.
+
+    Each entry is a JSON file readable by its owner only and named after
+    an HMAC of the parameters it was obtained with, keyed by a random
+    secret stored in the directory, so that the names do not disclose
+    the credentials. Entries are not read from a directory accessible by
+    other users. Entries are replaced
+    atomically, and the processes refreshing the same entry serialize on
+    a lock file so that only one of them authenticates.
+
+    :param directory: directory of the cache, created with mode 0700.
+                      Defaults to ``$XDG_CACHE_HOME/neutronclient/tokens``.
+    :param margin: number of seconds before its expiry at which an entry
+                   is not used anymore.
+    :param endpoint_ttl: number of seconds an endpoint resolved for a
+                         user provided token is kept.
+    """
+
+    def __init__(self, directory=None, margin=120, endpoint_ttl=3600):
+        self.directory = directory or _default_directory()
+        self.margin = margin
+        self.endpoint_ttl = endpoint_ttl
+        self._secret = None
+        self._secret_lock = threading.Lock()
+
+    def key(self, *parts):
+        """Return the key of an entry obtained with the given parameters."""
+        data = json.dumps(parts, sort_keys=True).encode('utf-8')
+        return hmac.new(self._get_secret(), data, hashlib.sha256).hexdigest()
+
+    def _get_secret(self):
+        with self._secret_lock:
+            if self._secret is None:
+                try:
+                    self._secret = self._load_secret()
+                except (OSError, ValueError) as e:
+                    _logger.warning('Unable to read the token cache '
+                                    'secret: %s', e)
+                    # The entries are then only found again by this object
+                    self._secret = os.urandom(_SECRET_LEN)
+            return self._secret
+
+    def _load_secret(self):
+        self._ensure_directory()
+        self._check_directory()
+        path = self._path('secret', '')
+        tmp_path = self._path('secret', '.%d-%d.tmp' % (
+            os.getpid(), threading.get_ident()))
+        self._unlink(tmp_path)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(os.urandom(_SECRET_LEN))
+            # Unlike os.replace(), keeps the secret of a concurrent process
+            os.link(tmp_path, path)
+        except FileExistsError:
+            pass
+        finally:
+            self._unlink(tmp_path)
+        with open(path, 'rb') as f:
+            self._check_private(os.fstat(f.fileno()), path)
+            secret = f.read()
+        if len(secret) != _SECRET_LEN:
+            raise ValueError('%s is truncated' % path)
+        return secret
+
+    def _path(self, key, suffix='.json'):
+        return os.path.join(self.directory, key + suffix)
+
+    def _ensure_directory(self):
+        try:
+            os.makedirs(self.directory, mode=0o700)
+        except FileExistsError:
+            return
+        # The mode given to makedirs() is masked by the umask
+        os.chmod(self.directory, 0o700)
+
+    @staticmethod
+    def _check_private(info, path):
+        if os.name == 'posix' and (info.st_uid != os.getuid() or
+                                   stat.S_IMODE(info.st_mode) & 0o077):
+            raise OSError('%s is accessible by other users' % path)
+
+    def _check_directory(self):
+        self._check_private(os.stat(self.directory), self.directory)
+
+    def get(self, key):
+        """Return the entry of key, or None if it is missing or expiring."""
+        path = self._path(key)
+        try:
+            self._check_directory()
+            with open(path, 'r') as f:
+                self._check_private(os.fstat(f.fileno()), path)
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            _logger.warning('Ignoring the token cache: %s', e)
+            return None
+        except ValueError:
+            return None
+        if entry.get('expires', 0) - self.margin <= time.time():
+            return None
+        return entry
+
+    def set(self, key, entry):
+        """Store entry, which must have an ``expires`` timestamp."""
+        try:
+            self._ensure_directory()
+            self._check_directory()
+            tmp_path = self._path(key, '.%d-%d.tmp' % (
+                os.getpid(), threading.get_ident()))
+            # Left over by a crash, and maybe with other permissions
+            self._unlink(tmp_path)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                         0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            _logger.debug('Unable to write the token cache: %s', e)
+
+    def delete(self, key):
+        self._unlink(self._path(key))
+
+    @staticmethod
+    def _unlink(path):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        """Hold an exclusive lock on key across processes.
+
+        Without fcntl, e.g. on Windows, nothing is locked.
+        """
+        if fcntl is None:
+            yield
+            return
+        try:
+            self._ensure_directory()
+            self._check_directory()
+            fd = os.open(self._path(key, '.lock'), os.O_RDWR | os.O_CREAT,
+                         0o600)
+        except OSError as e:
+            _logger.debug('Unable to lock the token cache: %s', e)
+            yield
+            return
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
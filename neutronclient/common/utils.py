@@ -18,6 +18,7 @@
 """Utilities and helper functions."""
 
 import argparse
+import collections.abc
 import functools
 import hashlib
 import logging
@@ -94,7 +95,8 @@ def get_item_properties(item, fields, mixed_case_fields=(), formatters=None):
                 field_name = field.replace(' ', '_')
             else:
                 field_name = field.lower().replace(' ', '_')
-            if not hasattr(item, field_name) and isinstance(item, dict):
+            if (not hasattr(item, field_name) and
+                    isinstance(item, collections.abc.Mapping)):
                 data = item[field_name]
             else:
                 data = getattr(item, field_name, '')
@@ -48,7 +48,9 @@ def make_client(instance):
                             retries=instance._retries,
                             raise_errors=instance._raise_errors,
                             session=instance._session,
-                            auth=instance._auth)
+                            auth=instance._auth,
+                            trust_uuids=instance._trust_uuids,
+                            verify_trusted_uuids=instance._trust_uuids)
     return client
 
 
@@ -16,6 +16,7 @@
 
 import abc
 import argparse
+from concurrent import futures
 import functools
 import logging
 
@@ -58,6 +59,17 @@ def find_resourceid_by_name_or_id(client, resource, name_or_id,
                                        parent_id, fields='id')['id']
 
 
+def find_resourceids_by_names_or_ids(client, resource, names_or_ids,
+                                     project_id=None, cmd_resource=None,
+                                     parent_id=None):
+    """Resolve several names or IDs at once, preserving their order."""
+    if not names_or_ids:
+        return []
+    found = client.find_resources(resource, names_or_ids, project_id,
+                                  cmd_resource, parent_id, fields='id')
+    return [found[name_or_id]['id'] for name_or_id in names_or_ids]
+
+
 def add_show_list_common_argument(parser):
     parser.add_argument(
         '-D', '--show-details',
@@ -328,7 +340,11 @@ class NeutronCommand(command.Command, metaclass=NeutronCommandMeta):
 
     def run(self, parsed_args):
         self.log.debug('run(%s)', parsed_args)
-        return super(NeutronCommand, self).run(parsed_args)
+        result = super(NeutronCommand, self).run(parsed_args)
+        # UUIDs trusted without a lookup are checked once, in a batch,
+        # at the end of the command.
+        self.get_client().verify_trusted_uuids()
+        return result
 
     @property
     def cmd_resource(self):
@@ -500,6 +516,12 @@ class DeleteCommand(NeutronCommand):
             'id', metavar=self.resource.upper(),
             nargs='+' if self.bulk_delete else 1,
             help=help_str % self.help_resource)
+        if self.bulk_delete:
+            parser.add_argument(
+                '--concurrency', metavar='N', type=int, default=1,
+                help=_('Number of %s to delete in parallel. Names are then '
+                       'resolved in bulk. (default: 1)') %
+                self.help_resource)
         self.add_known_arguments(parser)
         return parser
 
@@ -510,7 +532,8 @@ class DeleteCommand(NeutronCommand):
                               "delete_%s" % self.cmd_resource)
 
         if self.bulk_delete:
-            self._bulk_delete(obj_deleter, neutron_client, parsed_args.id)
+            self._bulk_delete(obj_deleter, neutron_client, parsed_args.id,
+                              concurrency=parsed_args.concurrency)
         else:
             self.delete_item(obj_deleter, neutron_client, parsed_args.id)
             print((_('Deleted %(resource)s: %(id)s')
@@ -519,24 +542,32 @@ class DeleteCommand(NeutronCommand):
                   file=self.app.stdout)
         return
 
-    def _bulk_delete(self, obj_deleter, neutron_client, parsed_args_ids):
+    def _bulk_delete(self, obj_deleter, neutron_client, parsed_args_ids,
+                     concurrency=1):
         successful_delete = []
         non_existent = []
         multiple_ids = []
-        for item_id in parsed_args_ids:
-            try:
-                self.delete_item(obj_deleter, neutron_client, item_id)
-                successful_delete.append(item_id)
-            except exceptions.NotFound:
-                non_existent.append(item_id)
-            except exceptions.NeutronClientNoUniqueMatch:
-                multiple_ids.append(item_id)
+        failed = []
+        if concurrency > 1:
+            self._parallel_delete(obj_deleter, neutron_client,
+                                  parsed_args_ids, concurrency,
+                                  successful_delete, non_existent,
+                                  multiple_ids, failed)
+        else:
+            for item_id in parsed_args_ids:
+                try:
+                    self.delete_item(obj_deleter, neutron_client, item_id)
+                    successful_delete.append(item_id)
+                except exceptions.NotFound:
+                    non_existent.append(item_id)
+                except exceptions.NeutronClientNoUniqueMatch:
+                    multiple_ids.append(item_id)
         if successful_delete:
             print((_('Deleted %(resource)s(s): %(id)s'))
                   % {'id': ", ".join(successful_delete),
                      'resource': self.cmd_resource},
                   file=self.app.stdout)
-        if non_existent or multiple_ids:
+        if non_existent or multiple_ids or failed:
             err_msgs = []
             if non_existent:
                 err_msgs.append((_("Unable to find %(resource)s(s) with id(s) "
@@ -549,8 +580,49 @@ class DeleteCommand(NeutronCommand):
                                    "to be more specific.") %
                                  {'resource': self.cmd_resource,
                                   'id': ", ".join(multiple_ids)}))
+            for item_id, error in failed:
+                err_msgs.append((_("Failed to delete %(resource)s "
+                                   "'%(id)s': %(error)s") %
+                                 {'resource': self.cmd_resource,
+                                  'id': item_id, 'error': error}))
             raise exceptions.NeutronCLIError(message='\n'.join(err_msgs))
 
+    def _parallel_delete(self, obj_deleter, neutron_client, parsed_args_ids,
+                         concurrency, successful_delete, non_existent,
+                         multiple_ids, failed):
+        """Resolve names in bulk and delete on a bounded thread pool."""
+        item_ids = list(dict.fromkeys(parsed_args_ids))
+        if self.allow_names:
+            try:
+                found = neutron_client.find_resources(
+                    self.resource, item_ids, cmd_resource=self.cmd_resource,
+                    parent_id=self.parent_id, fields='id')
+            except exceptions.ResourceLookupError as e:
+                found = e.found
+                non_existent.extend(e.not_found)
+                multiple_ids.extend(e.ambiguous)
+            resolved = [(item_id, found[item_id]['id'])
+                        for item_id in item_ids if item_id in found]
+        else:
+            resolved = [(item_id, item_id) for item_id in item_ids]
+
+        def _delete(item):
+            item_id, _id = item
+            try:
+                self._delete_id(obj_deleter, _id)
+            except exceptions.NotFound:
+                return item_id, non_existent
+            except Exception as e:
+                return item_id, (failed, e)
+            return item_id, successful_delete
+
+        with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for item_id, outcome in executor.map(_delete, resolved):
+                if isinstance(outcome, tuple):
+                    outcome[0].append((item_id, outcome[1]))
+                else:
+                    outcome.append(item_id)
+
     def delete_item(self, obj_deleter, neutron_client, item_id):
         if self.allow_names:
             params = {'cmd_resource': self.cmd_resource,
@@ -562,11 +634,14 @@ class DeleteCommand(NeutronCommand):
         else:
             _id = item_id
 
+        self._delete_id(obj_deleter, _id)
+        return
+
+    def _delete_id(self, obj_deleter, _id):
         if self.parent_id:
             obj_deleter(_id, self.parent_id)
         else:
             obj_deleter(_id)
-        return
 
 
 class ListCommand(NeutronCommand, lister.Lister):
@@ -594,6 +669,21 @@ class ListCommand(NeutronCommand, lister.Lister):
     # For more details, see ListNetworks.filter_attrs.
     filter_attrs = []
 
+    # Attributes needed to display the columns which are not attributes
+    # returned by the server, e.g. columns computed in extend_list().
+    # Key is a column name and value is the list of attributes it uses.
+    field_dependencies = {}
+
+    # Whether the listed collection honours the fields query parameter.
+    # None means that only the collections listed by the default
+    # call_server() do, not the member actions and the nested collections
+    # listed by the commands overriding it or having a parent resource.
+    field_projection = None
+
+    # Whether the listed resources have a tenant_id attribute, which is
+    # requested along with the projected columns.
+    has_tenant_id = True
+
     default_attr_defs = {
         'name': {
             'help': _("Filter %s according to their name."),
@@ -698,10 +788,51 @@ class ListCommand(NeutronCommand, lister.Lister):
                 dirs = dirs[:len(keys)]
             if dirs:
                 search_opts.update({'sort_dir': dirs})
+        if 'fields' not in search_opts:
+            fields = self.get_projected_fields(parsed_args)
+            if fields:
+                search_opts['fields'] = fields
         data = self.call_server(neutron_client, search_opts, parsed_args)
         collection = neutron_client.get_resource_plural(self.resource)
         return data.get(collection, [])
 
+    def get_required_fields(self, fields):
+        """Return the attributes needed to display the given columns."""
+        required = []
+        for field in fields:
+            for dep in self.field_dependencies.get(field, [field]):
+                if dep not in required:
+                    required.append(dep)
+        return required
+
+    def _supports_field_projection(self):
+        if self.field_projection is not None:
+            return self.field_projection
+        return (type(self).call_server is ListCommand.call_server and
+                not self.parent_id)
+
+    def get_projected_fields(self, parsed_args):
+        """Return the fields to request when the user did not give any.
+
+        Only the attributes needed by the displayed columns, including the
+        ones used by formatters and extend_list(), are requested.
+        An empty list means that all the attributes are needed, or that
+        the collection does not support fields (see field_projection).
+        """
+        if parsed_args.show_details or not self._supports_field_projection():
+            return []
+        columns = parsed_args.columns or self.list_columns
+        if not columns:
+            return []
+        # id is used for pagination and tenant_id may be added to the
+        # displayed columns for admin users by setup_columns().
+        columns = list(columns)
+        if 'id' in self.list_columns:
+            columns.append('id')
+        if self.has_tenant_id:
+            columns.append('tenant_id')
+        return self.get_required_fields(columns)
+
     def extend_list(self, data, parsed_args):
         """Update a retrieved list.
 
@@ -29,6 +29,7 @@ class ListAgent(neutronV20.ListCommand):
     """List agents."""
 
     resource = 'agent'
+    has_tenant_id = False
     list_columns = ['id', 'agent_type', 'host', 'availability_zone', 'alive',
                     'admin_state_up', 'binary']
     _formatters = {'heartbeat_timestamp': _format_timestamp}
@@ -33,6 +33,7 @@ class ListAvailabilityZone(neutronv20.ListCommand):
     """List availability zones."""
 
     resource = 'availability_zone'
+    has_tenant_id = False
     list_columns = ['name', 'resource', 'state']
     pagination_support = True
     sorting_support = True
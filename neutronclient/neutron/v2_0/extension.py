@@ -21,6 +21,7 @@ class ListExt(cmd_base.ListCommand):
     """List all extensions."""
 
     resource = 'extension'
+    has_tenant_id = False
     list_columns = ['alias', 'name']
 
 
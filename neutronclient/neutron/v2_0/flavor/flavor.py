@@ -24,6 +24,7 @@ class ListFlavor(neutronV20.ListCommand):
     """List Neutron service flavors."""
 
     resource = 'flavor'
+    has_tenant_id = False
     list_columns = ['id', 'name', 'service_type', 'enabled']
     pagination_support = True
     sorting_support = True
@@ -24,6 +24,7 @@ class ListFlavorProfile(neutronV20.ListCommand):
     """List Neutron service flavor profiles."""
 
     resource = 'service_profile'
+    has_tenant_id = False
     list_columns = ['id', 'description', 'enabled', 'metainfo']
     pagination_support = True
     sorting_support = True
@@ -17,7 +17,6 @@
 import argparse
 
 from neutronclient._i18n import _
-from neutronclient.common import exceptions
 from neutronclient.common import utils
 from neutronclient.neutron import v2_0 as neutronV20
 from neutronclient.neutron.v2_0 import availability_zone
@@ -103,28 +102,13 @@ class ListNetwork(neutronV20.ListCommand):
         for n in data:
             if 'subnets' in n:
                 subnet_ids.extend(n['subnets'])
-
-        def _get_subnet_list(sub_ids):
-            search_opts['id'] = sub_ids
-            return neutron_client.list_subnets(
-                **search_opts).get('subnets', [])
-
-        try:
-            subnets = _get_subnet_list(subnet_ids)
-        except exceptions.RequestURITooLong as uri_len_exc:
-            # The URI is too long because of too many subnet_id filters
-            # Use the excess attribute of the exception to know how many
-            # subnet_id filters can be inserted into a single request
-            subnet_count = len(subnet_ids)
-            max_size = ((self.subnet_id_filter_len * subnet_count) -
-                        uri_len_exc.excess)
-            if self.pagination_support:
-                max_size -= self.marker_len
-            chunk_size = max_size // self.subnet_id_filter_len
-            subnets = []
-            for i in range(0, subnet_count, chunk_size):
-                subnets.extend(
-                    _get_subnet_list(subnet_ids[i: i + chunk_size]))
+        # NOTE: list_subnets() splits the request in several concurrent
+        # ones if the id filters do not fit in a single URI.
+        search_opts['id'] = subnet_ids
+        subnets = neutron_client.list_subnets(
+            marker_len=self.marker_len,
+            filter_len=self.subnet_id_filter_len,
+            **search_opts).get('subnets', [])
 
         subnet_dict = dict([(s['id'], s) for s in subnets])
         for n in data:
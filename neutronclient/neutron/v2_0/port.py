@@ -71,12 +71,14 @@ def _updatable_args2body(parsed_args, body, client):
                             'description'])
     ips = []
     if parsed_args.fixed_ip:
+        subnets = [ip_spec['subnet_id'] for ip_spec in parsed_args.fixed_ip
+                   if 'subnet_id' in ip_spec]
+        subnet_ids = dict(zip(subnets,
+                              neutronV20.find_resourceids_by_names_or_ids(
+                                  client, 'subnet', subnets)))
         for ip_spec in parsed_args.fixed_ip:
             if 'subnet_id' in ip_spec:
-                subnet_name_id = ip_spec['subnet_id']
-                _subnet_id = neutronV20.find_resourceid_by_name_or_id(
-                    client, 'subnet', subnet_name_id)
-                ip_spec['subnet_id'] = _subnet_id
+                ip_spec['subnet_id'] = subnet_ids[ip_spec['subnet_id']]
             ips.append(ip_spec)
     if ips:
         body['fixed_ips'] = ips
@@ -139,10 +141,14 @@ class UpdatePortSecGroupMixin(object):
         return neutronV20.find_resourceid_by_name_or_id(
             self.get_client(), 'security_group', secgroup)
 
+    def _resolv_sgids(self, secgroups):
+        return neutronV20.find_resourceids_by_names_or_ids(
+            self.get_client(), 'security_group', secgroups)
+
     def args2body_secgroup(self, parsed_args, port):
         if parsed_args.security_groups:
-            port['security_groups'] = [self._resolv_sgid(sg) for sg
-                                       in parsed_args.security_groups]
+            port['security_groups'] = self._resolv_sgids(
+                parsed_args.security_groups)
         elif parsed_args.no_security_groups:
             port['security_groups'] = []
 
@@ -13,45 +13,90 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 #
+import collections
+from concurrent import futures
+import functools
 import sys
+import time
 
 from neutronclient._i18n import _
 from neutronclient.neutron import v2_0 as neutronV20
 
 
+ROUTER_INTERFACE_OWNERS = ['network:router_interface',
+                           'network:router_interface_distributed']
+
+
 class Purge(neutronV20.NeutronCommand):
     """Delete all resources that belong to a given tenant."""
 
+    # The tiers of resources in the order in which they should be deleted,
+    # as tuples of (resource type, list filters, extra fields). Resources of
+    # a tier do not depend on each other and are deleted concurrently.
+    tiers = [
+        ('floatingip', {}, []),
+        ('port', {'device_owner': ROUTER_INTERFACE_OWNERS},
+         ['device_id', 'device_owner']),
+        ('port', {}, []),
+        ('router', {}, []),
+        ('network', {}, []),
+        ('security_group', {}, []),
+    ]
+
     def _pluralize(self, string):
         return string + 's'
 
-    def _get_resources(self, neutron_client, resource_types, tenant_id):
-        resources = []
-        for resource_type in resource_types:
-            resources.append([])
-            resource_type_plural = self._pluralize(resource_type)
-            opts = {'fields': ['id', 'tenant_id']}
-            if resource_type_plural == 'ports':
-                opts['fields'].append('device_id')
-                opts['fields'].append('device_owner')
-            function = getattr(neutron_client, 'list_%s' %
-                               resource_type_plural)
-            if callable(function):
-                returned_resources = function(**opts).get(resource_type_plural,
-                                                          [])
-                for resource in returned_resources:
-                    if resource['tenant_id'] == tenant_id:
-                        index = resource_types.index(resource_type)
-                        resources[index].append(resource)
-                        self.total_resources += 1
-        return resources
+    def _get_resources(self, neutron_client, resource_type, tenant_id,
+                       filters=None, fields=None):
+        """Iterate over the resources of a tenant.
+
+        They are filtered on the server side, pages are decoded as a stream
+        and only the fields needed for the deletion are requested. The
+        owner is checked again in case the server ignores the filter.
+        """
+        function = getattr(neutron_client, 'list_%s' %
+                           self._pluralize(resource_type))
+        opts = dict(filters or {})
+        opts['tenant_id'] = tenant_id
+        opts['fields'] = ['id', 'tenant_id'] + list(fields or [])
+        for resource in function(retrieve_all=False, stream=True, **opts):
+            if resource.get('tenant_id') == tenant_id:
+                yield resource
+
+    @staticmethod
+    def _not_attempted(resource_type, resources, attempted):
+        """Skip what an earlier tier failed to delete already."""
+        for resource in resources:
+            key = (resource_type, resource['id'])
+            if key not in attempted:
+                attempted.add(key)
+                yield resource
+
+    @staticmethod
+    def _map(executor, func, items, window):
+        """Like executor.map, with at most window calls pending.
+
+        An item is only submitted once the next one was read, so the last
+        resource of a page, which is the marker of the next page, is not
+        deleted before that page is requested.
+        """
+        pending = collections.deque()
+        last = missing = object()
+        for item in items:
+            if last is not missing:
+                pending.append(executor.submit(func, last))
+            last = item
+            while len(pending) > window:
+                yield pending.popleft().result()
+        if last is not missing:
+            pending.append(executor.submit(func, last))
+        while pending:
+            yield pending.popleft().result()
 
     def _delete_resource(self, neutron_client, resource_type, resource):
         resource_id = resource['id']
         if resource_type == 'port':
-            router_interface_owners = ['network:router_interface',
-                                       'network:router_interface_distributed']
-            if resource.get('device_owner', '') in router_interface_owners:
+            if resource.get('device_owner', '') in ROUTER_INTERFACE_OWNERS:
                 body = {'port_id': resource_id}
                 neutron_client.remove_interface_router(resource['device_id'],
                                                        body)
@@ -60,36 +105,51 @@ class Purge(neutronV20.NeutronCommand):
         if callable(function):
             function(resource_id)
 
-    def _purge_resources(self, neutron_client, resource_types,
-                         tenant_resources):
+    def _try_delete(self, neutron_client, resource_type, resource):
+        try:
+            self._delete_resource(neutron_client, resource_type, resource)
+        except Exception:
+            return False
+        return True
+
+    def _purge_resources(self, neutron_client, tenant_id, concurrency=1):
         deleted = {}
         failed = {}
+        elapsed = {}
         failures = False
-        for resources in tenant_resources:
-            index = tenant_resources.index(resources)
-            resource_type = resource_types[index]
-            failed[resource_type] = 0
-            deleted[resource_type] = 0
-            for resource in resources:
-                try:
-                    self._delete_resource(neutron_client, resource_type,
-                                          resource)
-                    deleted[resource_type] += 1
-                    self.deleted_resources += 1
-                except Exception:
-                    failures = True
-                    failed[resource_type] += 1
-                    self.total_resources -= 1
-                percent_complete = 100
-                if self.total_resources > 0:
-                    percent_complete = (self.deleted_resources /
-                                        float(self.total_resources)) * 100
-                sys.stdout.write("\rPurging resources: %d%% complete." %
-                                 percent_complete)
-                sys.stdout.flush()
-        return (deleted, failed, failures)
-
-    def _build_message(self, deleted, failed, failures):
+        attempted = set()
+        with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for resource_type, filters, fields in self.tiers:
+                deleted.setdefault(resource_type, 0)
+                failed.setdefault(resource_type, 0)
+                elapsed.setdefault(resource_type, 0.0)
+                start = time.monotonic()
+                resources = self._not_attempted(
+                    resource_type,
+                    self._get_resources(neutron_client, resource_type,
+                                        tenant_id, filters, fields),
+                    attempted)
+                results = self._map(
+                    executor,
+                    functools.partial(self._try_delete, neutron_client,
+                                      resource_type),
+                    resources, 2 * concurrency)
+                for done, success in enumerate(results, 1):
+                    if success:
+                        deleted[resource_type] += 1
+                    else:
+                        failures = True
+                        failed[resource_type] += 1
+                    sys.stdout.write("\rPurging %s: %d done." %
+                                     (self._pluralize(resource_type), done))
+                    sys.stdout.flush()
+                elapsed[resource_type] += time.monotonic() - start
+        rates = dict((resource_type, deleted[resource_type] / seconds)
+                     for resource_type, seconds in elapsed.items()
+                     if deleted[resource_type] and seconds > 0)
+        return (deleted, failed, failures, rates)
+
+    def _build_message(self, deleted, failed, failures, rates=None):
         msg = ''
         deleted_msg = []
         for resource, value in deleted.items():
@@ -116,6 +176,12 @@ class Purge(neutronV20.NeutronCommand):
 
         if msg:
             msg += '.'
+            if rates:
+                msg += ' Throughput:'
+                msg += ','.join(" %.1f %s/s" % (rate,
+                                                self._pluralize(resource))
+                                for resource, rate in rates.items())
+                msg += '.'
         else:
             msg = _('Tenant has no supported resources.')
 
@@ -126,25 +192,14 @@ class Purge(neutronV20.NeutronCommand):
         parser.add_argument(
             'tenant', metavar='TENANT',
             help=_('ID of Tenant owning the resources to be deleted.'))
+        parser.add_argument(
+            '--concurrency', metavar='N', type=int, default=4,
+            help=_('Number of resources of the same type to delete in '
+                   'parallel. (default: 4)'))
         return parser
 
     def take_action(self, parsed_args):
         neutron_client = self.get_client()
-
-        self.any_failures = False
-
-        # A list of the types of resources supported in the order in which
-        # they should be deleted.
-        resource_types = ['floatingip', 'port', 'router',
-                          'network', 'security_group']
-
-        deleted = {}
-        failed = {}
-        self.total_resources = 0
-        self.deleted_resources = 0
-        resources = self._get_resources(neutron_client, resource_types,
-                                        parsed_args.tenant)
-        deleted, failed, failures = self._purge_resources(neutron_client,
-                                                          resource_types,
-                                                          resources)
-        print('\n%s' % self._build_message(deleted, failed, failures))
+        deleted, failed, failures, rates = self._purge_resources(
+            neutron_client, parsed_args.tenant, parsed_args.concurrency)
+        print('\n%s' % self._build_message(deleted, failed, failures, rates))
@@ -58,6 +58,7 @@ class ListQoSRuleTypes(neutronv20.ListCommand):
     """List available qos rule types."""
 
     resource = 'rule_type'
+    has_tenant_id = False
     shadow_resource = 'qos_rule_type'
     pagination_support = True
     sorting_support = True
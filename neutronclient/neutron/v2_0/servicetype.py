@@ -21,6 +21,7 @@ class ListServiceProvider(neutronV20.ListCommand):
     """List service providers."""
 
     resource = 'service_provider'
+    has_tenant_id = False
     list_columns = ['service_type', 'name', 'default']
     _formatters = {}
     pagination_support = True
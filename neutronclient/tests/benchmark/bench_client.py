@@ -0,0 +1,103 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the construction time of v2.0 clients.
+
+Usage::
+
+    python -m neutronclient.tests.benchmark.bench_client \\
+        [--clients 2000] [--sample-extensions 20] [--json]
+
+The first client pays for the discovery of the client extensions, the
+following ones should not. ``--sample-extensions`` adds that many copies
+of the sample fox socket extension to the installed ones.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+import types
+from unittest import mock
+
+from neutronclient.common import extension
+from neutronclient.neutron.v2_0.contrib import _fox_sockets
+from neutronclient.v2_0 import client
+
+
+def _sample_extension(index):
+    """Return a module defining a resource like the fox socket sample."""
+    module = types.ModuleType('fox_sockets_%d' % index)
+    resource = 'fox_socket_%d' % index
+    attrs = {'__module__': module.__name__,
+             'resource': resource,
+             'resource_plural': resource + 's',
+             'object_path': '/%ss' % resource,
+             'resource_path': '/%ss/%%s' % resource}
+    module.Resource = type('Resource', (_fox_sockets.FoxInSocket,), attrs)
+    for verb in ('List', 'Create', 'Update', 'Delete', 'Show'):
+        base = getattr(extension, 'ClientExtension%s' % verb)
+        setattr(module, verb, type(verb, (base, module.Resource),
+                                   {'__module__': module.__name__}))
+    return module
+
+
+def run(clients, sample_extensions):
+    installed = list(extension._discover_via_entry_points())
+    modules = installed + [('fox_sockets_%d' % i, _sample_extension(i))
+                           for i in range(sample_extensions)]
+
+    class _Client(client.Client):
+        pass
+
+    client._load_extensions.cache_clear()
+    with mock.patch.object(extension, '_discover_via_entry_points',
+                           return_value=modules):
+        start = time.perf_counter()
+        _Client(token='benchmark', endpoint_url='http://localhost:9696')
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        for _i in range(clients):
+            _Client(token='benchmark', endpoint_url='http://localhost:9696')
+        elapsed = time.perf_counter() - start
+    client._load_extensions.cache_clear()
+    return {'clients': clients,
+            'sample_extensions': sample_extensions,
+            'first_client_ms': round(first * 1000, 3),
+            'per_client_us': round(elapsed / clients * 1e6, 2),
+            'clients_per_second': round(clients / elapsed, 1)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clients', type=int, default=2000)
+    parser.add_argument('--sample-extensions', type=int, default=20)
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+    # Every client logs a deprecation warning
+    logging.disable(logging.WARNING)
+
+    result = run(args.clients, args.sample_extensions)
+    if args.json:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+        return
+    for key, value in result.items():
+        print('%20s %s' % (key, value))
+
+
+if __name__ == '__main__':
+    main()
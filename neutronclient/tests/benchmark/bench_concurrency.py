@@ -0,0 +1,102 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Stress one client shared by a growing number of threads.
+
+Usage::
+
+    python -m neutronclient.tests.benchmark.bench_concurrency \\
+        [--requests-per-thread 50] [--threads 1,2,4,8,16,32,64] \\
+        [--latency 0.05] [--json]
+
+Every thread count runs against a single ``Client`` and a stand-in server
+answering after ``--latency`` seconds. The server runs in a child process
+so that it does not share the GIL with the client. As long as the client
+does not serialize its threads the throughput grows linearly with their
+number, which the ``efficiency`` column reports: the throughput divided by
+the number of threads times the throughput of a single thread. It drops
+once the client saturates one CPU, which happens at a few hundred requests
+per second.
+"""
+
+import argparse
+from concurrent import futures
+import json
+import logging
+import sys
+import time
+import uuid
+
+from neutronclient.tests.benchmark import fake_server
+from neutronclient.v2_0 import client
+
+
+def run(url, threads, requests_per_thread):
+    neutron = client.Client(token='benchmark', endpoint_url=url,
+                            pool_maxsize=threads)
+    port_ids = [str(uuid.uuid4())
+                for _i in range(threads * requests_per_thread)]
+
+    def _show(port_id):
+        if neutron.show_port(port_id)['port']['id'] != port_id:
+            raise AssertionError('Got the port of another thread')
+
+    with neutron:
+        # Open the connections before measuring
+        with futures.ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(_show, port_ids[:threads]))
+            start = time.perf_counter()
+            list(pool.map(_show, port_ids))
+            elapsed = time.perf_counter() - start
+    return {'threads': threads,
+            'requests': len(port_ids),
+            'seconds': round(elapsed, 4),
+            'requests_per_second': round(len(port_ids) / elapsed, 1)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests-per-thread', type=int, default=50)
+    parser.add_argument('--threads', default='1,2,4,8,16,32,64',
+                        help='Comma separated thread counts.')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='Latency of the stand-in server, in seconds.')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    thread_counts = [int(count) for count in args.threads.split(',')]
+    # Every client logs a deprecation warning
+    logging.disable(logging.WARNING)
+    with fake_server.server_process(latency=args.latency) as url:
+        results = [run(url, threads, args.requests_per_thread)
+                   for threads in thread_counts]
+    base = results[0]['requests_per_second'] / results[0]['threads']
+    for result in results:
+        result['efficiency'] = round(
+            result['requests_per_second'] / (result['threads'] * base), 3)
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+    columns = ['threads', 'requests', 'seconds', 'requests_per_second',
+               'efficiency']
+    print(' '.join('%20s' % c for c in columns))
+    for result in results:
+        print(' '.join('%20s' % result[c] for c in columns))
+
+
+if __name__ == '__main__':
+    main()
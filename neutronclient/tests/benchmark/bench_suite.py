@@ -0,0 +1,281 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Run the benchmarks of the client and report them as JSON.
+
+Usage::
+
+    python -m neutronclient.tests.benchmark.bench_suite \\
+        [--quick] [--filter list_ports] [--repeat 5] [--latency 0] \\
+        [--payload-size 0] [--output results.json] [--json]
+
+The requests go to a stand-in Neutron server run in a child process (see
+``fake_server``). Each benchmark is run ``--repeat`` times and reported
+with the mean, median, minimum, maximum and standard deviation of the
+duration of one operation, in milliseconds. ``--output`` writes the
+results, and the environment they were measured in, to a JSON file which
+can be compared between runs; ``--json`` prints that document instead of
+a table. ``--quick`` uses smaller collections, 10k ports rather than
+100k.
+"""
+
+import argparse
+import collections
+import functools
+import io
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from unittest import mock
+
+from neutronclient.common import exceptions
+from neutronclient.common import serializer
+from neutronclient.neutron.v2_0 import port
+from neutronclient.tests.benchmark import fake_server
+from neutronclient.v2_0 import client
+from neutronclient import version
+
+
+Benchmark = collections.namedtuple('Benchmark',
+                                   ['name', 'params', 'func', 'number'])
+
+
+def _client(url):
+    return client.Client(token='benchmark', endpoint_url=url)
+
+
+def _measure(benchmark, repeat):
+    """Time benchmark.func and return the statistics of one call in ms."""
+    benchmark.func()  # Warm up the connections and caches
+    timings = []
+    for _i in range(repeat):
+        start = time.perf_counter()
+        for _j in range(benchmark.number):
+            benchmark.func()
+        timings.append((time.perf_counter() - start) * 1000 /
+                       benchmark.number)
+    return {'name': benchmark.name,
+            'params': benchmark.params,
+            'unit': 'ms',
+            'repeat': repeat,
+            'number': benchmark.number,
+            'mean': round(statistics.mean(timings), 4),
+            'median': round(statistics.median(timings), 4),
+            'min': round(min(timings), 4),
+            'max': round(max(timings), 4),
+            'stdev': round(statistics.stdev(timings)
+                           if len(timings) > 1 else 0.0, 4)}
+
+
+def _suite(*names):
+    """Declare the names of the benchmarks a suite yields.
+
+    The suites are skipped, without starting their server, when none of
+    these names matches the filter.
+    """
+    def decorator(func):
+        func.benchmarks = names
+        return func
+    return decorator
+
+
+def _selected(suite, name_filter):
+    return not name_filter or any(name_filter in name
+                                  for name in suite.benchmarks)
+
+
+@_suite('client_construction')
+def client_construction(args):
+    url = 'http://127.0.0.1:9696'
+    yield Benchmark('client_construction', {}, lambda: _client(url), 200)
+
+
+@_suite('list_ports_unpaged', 'list_ports_unpaged_compact',
+        'list_ports_paged', 'list_ports_fields')
+def list_ports(args):
+    for rows in (1000, 10000 if args.quick else 100000):
+        with fake_server.server_process(
+                ports=rows, latency=args.latency,
+                payload_size=args.payload_size) as url:
+            neutron = _client(url)
+            params = {'rows': rows, 'payload_size': args.payload_size}
+            yield Benchmark('list_ports_unpaged', params,
+                            neutron.list_ports, 1)
+            yield Benchmark('list_ports_unpaged_compact', params,
+                            lambda: neutron.list_ports(compact=True), 1)
+            yield Benchmark('list_ports_paged',
+                            dict(params, page_size=args.page_size),
+                            lambda: neutron.list_ports(limit=args.page_size),
+                            1)
+            yield Benchmark('list_ports_fields', params,
+                            lambda: neutron.list_ports(fields=['id', 'name']),
+                            1)
+            neutron.close()
+
+
+@_suite('find_resource_by_id', 'find_resource_by_name')
+def find_resource(args):
+    rows = 1000
+    with fake_server.server_process(ports=rows,
+                                    latency=args.latency) as url:
+        neutron = _client(url)
+        target = fake_server.make_port(rows // 2)
+        params = {'rows': rows}
+        yield Benchmark('find_resource_by_id', params,
+                        lambda: neutron.find_resource('port', target['id']),
+                        50)
+        yield Benchmark('find_resource_by_name', params,
+                        lambda: neutron.find_resource('port', target['name']),
+                        50)
+        neutron.close()
+
+
+def _command(cmd_class, neutron, stdout):
+    app = mock.Mock(stdout=stdout)
+    cmd = cmd_class(app, None)
+    cmd.get_client = mock.Mock(return_value=neutron)
+    cmd.is_admin_role = mock.Mock(return_value=False)
+    return cmd
+
+
+@_suite('bulk_delete')
+def bulk_delete(args):
+    count = 100
+    names = [fake_server.make_port(i)['name'] for i in range(count)]
+    with fake_server.server_process(ports=count,
+                                    latency=args.latency) as url:
+        neutron = _client(url)
+        cmd = _command(port.DeletePort, neutron, io.StringIO())
+        parser = cmd.get_parser('port-delete')
+        for concurrency in (1, 16):
+            parsed_args = parser.parse_args(
+                names + ['--concurrency', str(concurrency)])
+            yield Benchmark('bulk_delete',
+                            {'ports': count, 'concurrency': concurrency},
+                            functools.partial(cmd.run, parsed_args), 1)
+        neutron.close()
+
+
+@_suite('json_serialize', 'json_deserialize')
+def json_serialization(args):
+    rows = 10000
+    body = {'ports': [fake_server.make_port(i, args.payload_size)
+                      for i in range(rows)]}
+    for engine in ('jsonutils', 'stdlib', 'orjson', 'ujson'):
+        try:
+            engine_serializer = serializer.get_serializer(engine)
+        except exceptions.UnsupportedJSONEngine:
+            continue
+        data = engine_serializer.serialize(body).encode('utf-8')
+        params = {'engine': engine, 'rows': rows}
+        yield Benchmark('json_serialize', params,
+                        functools.partial(engine_serializer.serialize, body),
+                        1)
+        yield Benchmark('json_deserialize', params,
+                        functools.partial(engine_serializer.deserialize,
+                                          data), 1)
+
+
+@_suite('list_command_render')
+def list_command_render(args):
+    rows = 1000
+    ports = [fake_server.make_port(i) for i in range(rows)]
+    neutron = mock.Mock()
+    neutron.list_ports.side_effect = lambda **kw: {'ports': list(ports)}
+    neutron.get_resource_plural.side_effect = lambda resource: resource + 's'
+    for formatter in ('table', 'value', 'json'):
+        stdout = io.StringIO()
+        cmd = _command(port.ListPort, neutron, stdout)
+        parsed_args = cmd.get_parser('port-list').parse_args(
+            ['-f', formatter])
+
+        def _render(cmd=cmd, parsed_args=parsed_args, stdout=stdout):
+            stdout.seek(0)
+            stdout.truncate()
+            cmd.run(parsed_args)
+        yield Benchmark('list_command_render',
+                        {'rows': rows, 'format': formatter}, _render, 1)
+
+
+SUITES = [client_construction, list_ports, find_resource, bulk_delete,
+          json_serialization, list_command_render]
+
+
+def run(args):
+    results = []
+    for suite in SUITES:
+        if not _selected(suite, args.filter):
+            continue
+        for benchmark in suite(args):
+            if args.filter and args.filter not in benchmark.name:
+                continue
+            results.append(_measure(benchmark, args.repeat))
+            if args.verbose:
+                print('%(name)s %(params)s: %(median).3f ms' % results[-1],
+                      file=sys.stderr)
+    return {'metadata': {
+        'neutronclient': version.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'quick': args.quick,
+        'latency': args.latency,
+        'payload_size': args.payload_size},
+        'benchmarks': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--quick', action='store_true',
+                        help='Use smaller collections.')
+    parser.add_argument('--filter',
+                        help='Only run the benchmarks containing this in '
+                             'their name.')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0,
+                        help='Latency of the stand-in server, in seconds.')
+    parser.add_argument('--payload-size', type=int, default=0,
+                        help='Size of the description of the ports.')
+    parser.add_argument('--page-size', type=int, default=500)
+    parser.add_argument('--output', help='Write the results to this file.')
+    parser.add_argument('--json', action='store_true')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args(argv)
+    # Every client logs a deprecation warning
+    logging.disable(logging.WARNING)
+
+    result = run(args)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+    if args.json:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+        return
+    columns = ['median', 'min', 'stdev']
+    print('%-60s %s' % ('benchmark', ' '.join('%12s' % c for c in columns)))
+    for bench in result['benchmarks']:
+        name = '%s %s' % (bench['name'], ' '.join(
+            '%s=%s' % item for item in sorted(bench['params'].items())))
+        print('%-60s %s' % (name, ' '.join('%12.3f' % bench[c]
+                                           for c in columns)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compare the HTTP transports on many concurrent small GETs.
+
+Usage::
+
+    python -m neutronclient.tests.benchmark.bench_transports \\
+        [--requests 2000] [--concurrency 32] [--latency 0.002] \\
+        [--url https://neutron.example.com:9696 --token TOKEN] [--json]
+
+Without ``--url`` a local stand-in server is started. It only speaks
+HTTP/1.1, so the HTTP/2 variant needs ``--url`` pointing at an HTTP/2
+capable (TLS) endpoint and the ``h2`` library.
+"""
+
+import argparse
+from concurrent import futures
+import json
+import sys
+import time
+import uuid
+
+from oslo_utils import importutils
+
+from neutronclient import client as http_client
+from neutronclient.tests.benchmark import fake_server
+from neutronclient.v2_0 import client
+
+h2 = importutils.try_import('h2')
+
+
+def _transports(concurrency):
+    transports = [('requests', lambda: http_client.RequestsTransport(
+        pool_maxsize=concurrency))]
+    if http_client.httpx:
+        transports.append(('httpx-http1', lambda: http_client.HTTPXTransport(
+            pool_maxsize=concurrency, http2=False)))
+        if h2:
+            transports.append(('httpx-http2',
+                               lambda: http_client.HTTPXTransport(
+                                   pool_maxsize=concurrency, http2=True)))
+    return transports
+
+
+def _percentile(values, percent):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def run(url, token, name, transport, requests, concurrency):
+    neutron = client.Client(token=token, endpoint_url=url,
+                            transport=transport)
+    port_ids = [str(uuid.uuid4()) for _i in range(requests)]
+
+    def _show(port_id):
+        start = time.perf_counter()
+        neutron.show_port(port_id)
+        return time.perf_counter() - start
+
+    with neutron:
+        start = time.perf_counter()
+        with futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = list(pool.map(_show, port_ids))
+        elapsed = time.perf_counter() - start
+        stats = neutron.httpclient.get_pool_stats()
+    return {'transport': name,
+            'requests': requests,
+            'concurrency': concurrency,
+            'seconds': round(elapsed, 4),
+            'requests_per_second': round(requests / elapsed, 1),
+            'p50_ms': round(_percentile(latencies, 50) * 1000, 3),
+            'p99_ms': round(_percentile(latencies, 99) * 1000, 3),
+            'new_connections': stats.get('new_connections')}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--latency', type=float, default=0.002,
+                        help='Latency of the stand-in server, in seconds.')
+    parser.add_argument('--url', help='Benchmark a real endpoint instead.')
+    parser.add_argument('--token', default='benchmark')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    def _run_all(url):
+        return [run(url, args.token, name, factory(), args.requests,
+                    args.concurrency)
+                for name, factory in _transports(args.concurrency)]
+
+    if args.url:
+        results = _run_all(args.url)
+    else:
+        with fake_server.FakeNeutronServer(latency=args.latency) as server:
+            results = _run_all(server.url)
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+    columns = ['transport', 'seconds', 'requests_per_second', 'p50_ms',
+               'p99_ms', 'new_connections']
+    print(' '.join('%20s' % c for c in columns))
+    for result in results:
+        print(' '.join('%20s' % result[c] for c in columns))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Stand-in Neutron server used by the benchmarks.
+
+It serves the ports of the v2.0 API:
+
+* ``GET /v2.0/ports`` supports the ``fields``, ``id`` and ``name`` query
+  parameters and the ``limit``/``marker`` pagination, with ``ports_links``
+  next links like Neutron.
+* ``GET /v2.0/ports/<id>`` returns the port. Unknown UUIDs are answered
+  with a generated port so that the benchmarks showing random ports need
+  no setup, other unknown IDs get a 404.
+* ``DELETE /v2.0/ports/<id>`` answers 204 without deleting anything, so
+  that runs can be repeated.
+"""
+
+import contextlib
+import http.server
+import json
+import multiprocessing
+import threading
+import time
+from urllib import parse as urlparse
+import uuid
+
+from oslo_utils import uuidutils
+
+
+def make_port(index, payload_size=0):
+    """Return a port like the ones of Neutron, named ``port-<index>``."""
+    return {'id': str(uuid.UUID(int=index + 1)),
+            'name': 'port-%d' % index,
+            'network_id': str(uuid.UUID(int=1 << 64)),
+            'tenant_id': 'benchmark',
+            'project_id': 'benchmark',
+            'mac_address': 'fa:16:3e:%02x:%02x:%02x' % (
+                (index >> 16) & 0xff, (index >> 8) & 0xff, index & 0xff),
+            'admin_state_up': True,
+            'status': 'ACTIVE',
+            'device_owner': '',
+            'fixed_ips': [{'subnet_id': str(uuid.UUID(int=2 << 64)),
+                           'ip_address': '10.%d.%d.%d' % (
+                               (index >> 16) & 0xff, (index >> 8) & 0xff,
+                               index & 0xff)}],
+            'description': 'x' * payload_size}
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def _parse(self):
+        url = urlparse.urlsplit(self.path)
+        parts = url.path.strip('/').split('/')
+        return url, parts, urlparse.parse_qs(url.query)
+
+    def _respond(self, status, body=None):
+        data = json.dumps(body).encode('utf-8') if body is not None else b''
+        self.send_response(status)
+        if body is not None:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('X-OpenStack-Request-ID',
+                         'req-%s' % uuid.uuid4())
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _wait(self):
+        self.server.count_request()
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+    def do_GET(self):
+        self._wait()
+        url, parts, query = self._parse()
+        if len(parts) == 3 and parts[:2] == ['v2.0', 'ports']:
+            port = self.server.find_port(parts[2])
+            if port is None:
+                self._respond(404, {'NeutronError': {
+                    'type': 'PortNotFound',
+                    'message': 'Port %s could not be found.' % parts[2],
+                    'detail': ''}})
+                return
+            self._respond(200, {'port': _select(port, query.get('fields'))})
+        elif parts == ['v2.0', 'ports']:
+            self._respond(200, self.server.list_ports(url, query))
+        else:
+            self._respond(404, {})
+
+    def do_DELETE(self):
+        self._wait()
+        _url, parts, _query = self._parse()
+        if (len(parts) == 3 and parts[:2] == ['v2.0', 'ports'] and
+                self.server.find_port(parts[2]) is not None):
+            self._respond(204)
+        else:
+            self._respond(404, {})
+
+    def log_message(self, *args):
+        pass
+
+
+def _select(port, fields):
+    if not fields:
+        return port
+    return dict((field, port[field]) for field in fields if field in port)
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency, ports, page_size, payload_size):
+        super(_Server, self).__init__(('127.0.0.1', 0), _Handler)
+        self.latency = latency
+        self.page_size = page_size
+        self.ports = [make_port(i, payload_size) for i in range(ports)]
+        self._by_id = dict((port['id'], i)
+                           for i, port in enumerate(self.ports))
+        self._by_name = dict((port['name'], i)
+                             for i, port in enumerate(self.ports))
+        self._count_lock = threading.Lock()
+        self.requests = 0
+
+    def count_request(self):
+        with self._count_lock:
+            self.requests += 1
+
+    def find_port(self, port_id):
+        index = self._by_id.get(port_id)
+        if index is not None:
+            return self.ports[index]
+        if uuidutils.is_uuid_like(port_id):
+            return dict(self.ports[0] if self.ports else make_port(0),
+                        id=port_id)
+        return None
+
+    def _filter(self, query):
+        indexes = None
+        for name, index in (('id', self._by_id), ('name', self._by_name)):
+            if name in query:
+                selected = set(index[value] for value in query[name]
+                               if value in index)
+                indexes = (selected if indexes is None
+                           else indexes & selected)
+        if indexes is None:
+            return self.ports
+        return [self.ports[i] for i in sorted(indexes)]
+
+    def list_ports(self, url, query):
+        ports = self._filter(query)
+        limit = int(query['limit'][0]) if 'limit' in query else None
+        limit = limit or self.page_size
+        body = {}
+        if limit:
+            start = 0
+            if 'marker' in query:
+                start = self._by_id.get(query['marker'][0], -1) + 1
+                if ports is not self.ports:
+                    start = next((i for i, port in enumerate(ports)
+                                  if self._by_id[port['id']] >= start),
+                                 len(ports))
+            page = ports[start:start + limit]
+            if start + limit < len(ports):
+                params = dict(query, limit=[str(limit)],
+                              marker=[page[-1]['id']])
+                body['ports_links'] = [{
+                    'rel': 'next',
+                    'href': 'http://%s%s?%s' % (
+                        self.host, url.path,
+                        urlparse.urlencode(params, doseq=True))}]
+            ports = page
+        fields = query.get('fields')
+        body['ports'] = [_select(port, fields) for port in ports]
+        return body
+
+    @property
+    def host(self):
+        return '%s:%d' % self.server_address[:2]
+
+
+class FakeNeutronServer(object):
+    """Threaded HTTP/1.1 keep-alive server answering like Neutron.
+
+    :param latency: seconds waited before each response
+    :param ports: number of ports returned by the port list
+    :param page_size: number of ports per page when the client gives no
+                      limit, None to return them all
+    :param payload_size: size in bytes of the description of the ports
+    """
+
+    def __init__(self, latency=0, ports=10, page_size=None, payload_size=0):
+        self._server = _Server(latency, ports, page_size, payload_size)
+        self._thread = None
+
+    @property
+    def url(self):
+        return 'http://%s' % self._server.host
+
+    @property
+    def ports(self):
+        return self._server.ports
+
+    @property
+    def requests(self):
+        """Number of requests received."""
+        return self._server.requests
+
+    def __enter__(self):
+        # A short poll interval makes shutdown() fast
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _serve(connection, kwargs):
+    with FakeNeutronServer(**kwargs) as server:
+        connection.send(server.url)
+        # Serve until the parent closes its end of the pipe
+        try:
+            connection.recv()
+        except EOFError:
+            pass
+
+
+@contextlib.contextmanager
+def server_process(**kwargs):
+    """Run a FakeNeutronServer in a child process and yield its URL.
+
+    The server then does not compete with the benchmarked client for the
+    GIL. Its ports are the ones of make_port().
+    """
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_serve, args=(child, kwargs),
+                                      daemon=True)
+    process.start()
+    try:
+        yield parent.recv()
+    finally:
+        parent.close()
+        process.join(5)
+        if process.is_alive():
+            process.terminate()
@@ -0,0 +1,364 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import ssl
+from unittest import mock
+
+import fixtures
+from oslo_serialization import jsonutils
+import requests
+from requests_mock.contrib import fixture as mock_fixture
+import testtools
+
+from neutronclient import client
+from neutronclient.common import cache
+from neutronclient.common import exceptions
+from neutronclient.common import ratelimit
+from neutronclient.tests.unit import test_client
+from neutronclient.v2_0 import async_client
+
+
+class FakeAsyncTransport(object):
+    """Asynchronous transport answering from requests_mock."""
+
+    endpoint_url = test_client.END_URL
+
+    def __init__(self):
+        self.closed = False
+
+    async def do_request(self, url, method, body=None, headers=None):
+        # Let the other tasks run like a real transport would
+        await asyncio.sleep(0)
+        resp = requests.request(method, self.endpoint_url + url, data=body,
+                                headers=headers)
+        return resp, resp.text
+
+    async def close(self):
+        self.closed = True
+
+
+class TestAsyncClient(testtools.TestCase):
+
+    def setUp(self):
+        super(TestAsyncClient, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.transport = FakeAsyncTransport()
+        with mock.patch.object(async_client.AsyncClient,
+                               '_construct_http_client',
+                               return_value=self.transport):
+            self.client = async_client.AsyncClient()
+
+    def _run(self, coro):
+        return asyncio.run(coro)
+
+    def test_list_all_pages(self):
+        test_client.ClientTestBase.register_pages(self)
+        res = self._run(self.client.list_ports(limit=2))
+        self.assertEqual(['p1', 'p2', 'p3', 'p4', 'p5'],
+                         [p['id'] for p in res['ports']])
+        self.assertEqual(['req-1', 'req-2', 'req-3'], res.request_ids)
+
+    def test_async_pagination(self):
+        test_client.ClientTestBase.register_pages(self)
+
+        async def _pages():
+            gen = self.client.list_ports(retrieve_all=False, limit=2)
+            pages = [[p['id'] for p in page['ports']]
+                     async for page in gen]
+            return pages, gen.request_ids
+        pages, request_ids = self._run(_pages())
+        self.assertEqual([['p1', 'p2'], ['p3', 'p4'], ['p5']], pages)
+        self.assertEqual(['req-1', 'req-2', 'req-3'], request_ids)
+
+    def test_show_update_delete(self):
+        port_url = test_client.PORTS_URL + '/p1'
+        self.requests.get(port_url, json={'port': {'id': 'p1'}})
+        self.requests.put(port_url, json={'port': {'id': 'p1', 'name': 'x'}})
+        self.requests.delete(port_url, status_code=204)
+
+        async def _calls():
+            shown = await self.client.show_port('p1')
+            updated = await self.client.update_port(
+                'p1', {'port': {'name': 'x'}}, revision_number=3)
+            await self.client.delete_port('p1')
+            return shown, updated
+        shown, updated = self._run(_calls())
+        self.assertEqual({'port': {'id': 'p1'}}, shown)
+        self.assertEqual('x', updated['port']['name'])
+        put = self.requests.request_history[1]
+        self.assertEqual('revision_number=3', put.headers['If-Match'])
+        self.assertEqual({'port': {'name': 'x'}}, jsonutils.loads(put.text))
+
+    def test_exception_mapping(self):
+        self.requests.get(test_client.PORTS_URL + '/p1', status_code=404,
+                          json={'NeutronError': {
+                              'type': 'PortNotFound',
+                              'message': 'Port p1 could not be found.',
+                              'detail': ''}})
+        e = self.assertRaises(exceptions.PortNotFoundClient, self._run,
+                              self.client.show_port('p1'))
+        self.assertEqual(404, e.status_code)
+
+    def test_find_resource(self):
+        self.requests.get(test_client.PORTS_URL,
+                          json={'ports': [{'id': 'p1', 'name': 'port1'}]})
+        res = self._run(self.client.find_resource('port', 'port1'))
+        self.assertEqual('p1', res['id'])
+        self.assertEqual('name=port1',
+                         self.requests.request_history[0].query)
+
+    def test_find_resources(self):
+        sg_ids = test_client.TestFindResources.sg_ids
+        sgs = [{'id': sg_ids[0], 'name': 'web'},
+               {'id': sg_ids[1], 'name': 'db'},
+               {'id': sg_ids[2], 'name': 'db'}]
+
+        def _list(request, context):
+            key = 'id' if 'id' in request.qs else 'name'
+            return {'security_groups': [sg for sg in sgs
+                                        if sg[key] in request.qs[key]]}
+        self.requests.get(test_client.END_URL + '/v2.0/security-groups',
+                          json=_list)
+        found = self._run(self.client.find_resources(
+            'security_group', [sg_ids[0], 'web']))
+        self.assertEqual(sg_ids[0], found['web']['id'])
+        self.assertEqual(2, self.requests.call_count)
+        e = self.assertRaises(exceptions.ResourceLookupError, self._run,
+                              self.client.find_resources(
+                                  'security_group', ['db', 'app']))
+        self.assertEqual(['app'], e.not_found)
+        self.assertEqual(['db'], e.ambiguous)
+
+    def test_verify_trusted_uuids(self):
+        net_id = test_client.TestTrustUUIDs.net_id
+        self.client.trust_uuids = self.client._verify_trusted = True
+        self.requests.get(test_client.END_URL + '/v2.0/networks',
+                          json={'networks': []})
+        res = self._run(self.client.find_resource('network', net_id,
+                                                  fields='id'))
+        self.assertEqual({'id': net_id}, res)
+        e = self.assertRaises(exceptions.NotFound, self._run,
+                              self.client.verify_trusted_uuids())
+        self.assertIn(net_id, str(e))
+        self.assertEqual([net_id], self.requests.last_request.qs['id'])
+
+    def test_stream_is_rejected(self):
+        self.assertRaises(exceptions.NeutronClientException,
+                          self.client.list_ports, stream=True)
+        self.assertEqual(0, self.requests.call_count)
+
+    def _register_uri_limit(self):
+        """Answer 414 to the lists filtering on more than 3 ids."""
+        def _list(request, context):
+            if len(request.qs['id']) > 3:
+                context.status_code = 414
+                return {}
+            return {'ports': [{'id': port_id}
+                              for port_id in request.qs['id']]}
+        self.requests.get(test_client.PORTS_URL, json=_list)
+        self.useFixture(fixtures.MockPatchObject(client, 'MAX_URI_LEN',
+                                                 300))
+
+    def test_uri_too_long_chunk_is_halved(self):
+        self._register_uri_limit()
+        port_ids = test_client.TestChunkedList.port_ids
+        res = self._run(self.client.list_ports(id=port_ids, fields='id'))
+        self.assertEqual(port_ids, [p['id'] for p in res['ports']])
+        sizes = [len(request.qs['id'])
+                 for request in self.requests.request_history]
+        # The rejected chunks were halved until they were accepted
+        self.assertTrue([size for size in sizes if size > 3])
+        self.assertEqual(len(port_ids),
+                         sum(size for size in sizes if size <= 3))
+
+    def test_uri_too_long_chunk_is_halved_by_pagination(self):
+        self._register_uri_limit()
+        port_ids = test_client.TestChunkedList.port_ids
+
+        async def _list():
+            gen = self.client.list_ports(retrieve_all=False, id=port_ids)
+            return [p['id'] async for page in gen for p in page['ports']]
+        self.assertEqual(port_ids, self._run(_list()))
+
+    def test_coalesce_requests(self):
+        self.requests.get(test_client.PORTS_URL,
+                          json={'ports': [{'id': 'p1'}]})
+        self.client._single_flight = cache.AsyncSingleFlight()
+
+        async def _list():
+            return await asyncio.gather(
+                *[self.client.list_ports(id='p1') for _i in range(3)])
+        results = self._run(_list())
+        self.assertEqual(1, self.requests.call_count)
+        self.assertEqual([{'ports': [{'id': 'p1'}]}] * 3, results)
+        results[0]['ports'].append('changed')
+        self.assertEqual([{'id': 'p1'}], results[1]['ports'])
+
+    def test_rate_limiter_is_rejected(self):
+        self.assertRaises(exceptions.NeutronClientException,
+                          async_client.AsyncClient, token='token',
+                          endpoint_url=test_client.END_URL,
+                          rate_limiter=ratelimit.RateLimiter())
+
+    def test_extension_methods_are_coroutines(self):
+        self.requests.get(test_client.END_URL + '/v2.0/fox-sockets',
+                          json={'fox_sockets': [{'id': 'f1'}]})
+        self.client.extend_list('fox_sockets', '/fox-sockets', None)
+        res = self._run(self.client.list_fox_sockets())
+        self.assertEqual([{'id': 'f1'}], res['fox_sockets'])
+
+    def test_async_context_manager_closes_transport(self):
+        async def _use():
+            async with self.client:
+                pass
+        self._run(_use())
+        self.assertTrue(self.transport.closed)
+
+
+class TestAsyncHTTPClient(testtools.TestCase):
+
+    @testtools.skipUnless(client.aiohttp, 'aiohttp is not installed')
+    def test_requires_token_or_session(self):
+        self.assertRaises(exceptions.Unauthorized, client.AsyncHTTPClient,
+                          endpoint_url=test_client.END_URL)
+
+    def test_convert_response(self):
+        aresp = mock.Mock(status=200, reason='OK', charset=None,
+                          headers={'x-openstack-request-id': 'req-1'},
+                          url=test_client.PORTS_URL)
+        resp = client.AsyncHTTPClient._convert_response('GET', aresp, b'{}')
+        self.assertEqual(200, resp.status_code)
+        self.assertEqual('req-1', resp.headers['X-OpenStack-Request-ID'])
+        self.assertEqual('{}', resp.text)
+
+
+class FakeAiohttpResponse(object):
+
+    def __init__(self, status, body=b'', url=test_client.PORTS_URL):
+        self.status = status
+        self.reason = 'OK' if status < 400 else 'Unauthorized'
+        self.headers = {'Content-Type': 'application/json'}
+        self.url = url
+        self.charset = None
+        self.body = body
+
+    async def read(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class FakeAiohttpSession(object):
+    """aiohttp session answering the requests with the given outcomes."""
+
+    closed = False
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    def request(self, method, url, data=None, headers=None):
+        self.requests.append((method, url, headers))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@testtools.skipUnless(client.aiohttp, 'aiohttp is not installed')
+class TestAsyncHTTPClientRequests(testtools.TestCase):
+
+    def setUp(self):
+        super(TestAsyncHTTPClientRequests, self).setUp()
+        self.ksa_session = mock.Mock()
+        self.ksa_session.get_token.side_effect = ['token1', 'token2']
+        self.ksa_session.get_endpoint.return_value = test_client.END_URL
+
+    def _request(self, http, *outcomes):
+        http._session = FakeAiohttpSession(*outcomes)
+        resp, body = asyncio.run(http.do_request('/v2.0/ports', 'GET'))
+        return resp, body, http._session.requests
+
+    def test_token_and_endpoint(self):
+        http = client.AsyncHTTPClient(token='token',
+                                      endpoint_url=test_client.END_URL)
+        resp, body, sent = self._request(
+            http, FakeAiohttpResponse(200, b'{"ports": []}'))
+        self.assertEqual(200, resp.status_code)
+        self.assertEqual('{"ports": []}', body)
+        method, url, headers = sent[0]
+        self.assertEqual(('GET', test_client.PORTS_URL), (method, url))
+        self.assertEqual('token', headers['X-Auth-Token'])
+        self.assertEqual(client.USER_AGENT, headers['User-Agent'])
+
+    def test_authenticate_with_session(self):
+        http = client.AsyncHTTPClient(session=self.ksa_session)
+        self._request(http, FakeAiohttpResponse(200, b'{}'))
+        self.assertEqual('token1', http.auth_token)
+        self.assertEqual(test_client.END_URL, http.endpoint_url)
+        self.ksa_session.get_endpoint.assert_called_once_with(
+            None, service_type='network', interface='public',
+            region_name=None)
+
+    def test_reauthenticate_once_on_401(self):
+        http = client.AsyncHTTPClient(session=self.ksa_session)
+        resp, _body, sent = self._request(
+            http, FakeAiohttpResponse(401), FakeAiohttpResponse(200, b'{}'))
+        self.assertEqual(200, resp.status_code)
+        self.ksa_session.invalidate.assert_called_once_with(None)
+        self.assertEqual(['token1', 'token2'],
+                         [headers['X-Auth-Token'] for _m, _u, headers
+                          in sent])
+
+    def test_unauthorized_after_reauthentication(self):
+        http = client.AsyncHTTPClient(session=self.ksa_session)
+        self.assertRaises(exceptions.Unauthorized, self._request, http,
+                          FakeAiohttpResponse(401), FakeAiohttpResponse(401))
+
+    def test_unauthorized_without_session(self):
+        http = client.AsyncHTTPClient(token='token',
+                                      endpoint_url=test_client.END_URL)
+        self.assertRaises(exceptions.Unauthorized, self._request, http,
+                          FakeAiohttpResponse(401))
+
+    def test_connection_errors(self):
+        http = client.AsyncHTTPClient(token='token',
+                                      endpoint_url=test_client.END_URL)
+        for error in (client.aiohttp.ServerDisconnectedError(),
+                      asyncio.TimeoutError()):
+            self.assertRaises(exceptions.ConnectionFailed, self._request,
+                              http, error)
+
+    def test_ssl_errors(self):
+        http = client.AsyncHTTPClient(token='token',
+                                      endpoint_url=test_client.END_URL)
+        error = client.aiohttp.ClientConnectorCertificateError(
+            mock.Mock(host='neutron', port=9696, ssl=None, is_ssl=True),
+            ssl.SSLCertVerificationError('certificate verify failed'))
+        self.assertRaises(exceptions.SslCertificateValidationError,
+                          self._request, http, error)
+
+    def test_uri_too_long(self):
+        http = client.AsyncHTTPClient(token='token',
+                                      endpoint_url=test_client.END_URL)
+        self.assertRaises(exceptions.RequestURITooLong,
+                          asyncio.run,
+                          http.do_request('/v2.0/ports?' + 'x' *
+                                          client.MAX_URI_LEN, 'GET'))
@@ -0,0 +1,171 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import threading
+import time
+
+import testtools
+
+from neutronclient.common import cache
+
+
+class TestTTLCache(testtools.TestCase):
+
+    def setUp(self):
+        super(TestTTLCache, self).setUp()
+        self.now = 0
+
+    def _cache(self, **kwargs):
+        return cache.TTLCache(timer=lambda: self.now, **kwargs)
+
+    def test_expiry(self):
+        c = self._cache(ttl=10)
+        c.set('a', 1)
+        self.now = 9
+        self.assertEqual(1, c.get('a'))
+        self.now = 10
+        self.assertIsNone(c.get('a'))
+        self.assertEqual(0, len(c))
+
+    def test_lru_eviction(self):
+        c = self._cache(maxsize=2)
+        c.set('a', 1)
+        c.set('b', 2)
+        c.get('a')
+        c.set('c', 3)
+        self.assertEqual(1, c.get('a'))
+        self.assertIsNone(c.get('b'))
+        self.assertEqual(3, c.get('c'))
+
+    def test_invalidate(self):
+        c = self._cache()
+        c.set('a', 1)
+        c.set('b', 2)
+        c.invalidate(lambda key, value: value == 2)
+        self.assertEqual(1, c.get('a'))
+        self.assertIsNone(c.get('b'))
+
+
+class TestSingleFlight(testtools.TestCase):
+
+    def _run_coalesced(self, flight, func, callers=3):
+        """Run func from several threads while the first call is blocked."""
+        release = threading.Event()
+        results = []
+        errors = []
+
+        def blocked():
+            release.wait(5)
+            return func()
+
+        def call():
+            try:
+                results.append(flight.do('key', blocked))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _i in range(callers)]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            with flight._lock:
+                entry = flight._flights.get('key')
+                if entry is not None and entry.waiters == callers - 1:
+                    break
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join()
+        return results, errors
+
+    def test_concurrent_calls_share_result(self):
+        calls = []
+        flight = cache.SingleFlight()
+        results, errors = self._run_coalesced(
+            flight, lambda: calls.append(1) or 'value')
+        self.assertEqual([], errors)
+        self.assertEqual(1, len(calls))
+        self.assertEqual([('value', True)] * 3, results)
+
+    def test_concurrent_calls_share_error(self):
+        def fail():
+            raise ValueError('boom')
+
+        results, errors = self._run_coalesced(cache.SingleFlight(), fail)
+        self.assertEqual([], results)
+        self.assertEqual(3, len(errors))
+        self.assertTrue(all(isinstance(e, ValueError) for e in errors))
+
+    def test_sequential_calls_are_not_shared(self):
+        flight = cache.SingleFlight()
+        self.assertEqual((1, False), flight.do('key', lambda: 1))
+        self.assertEqual((2, False), flight.do('key', lambda: 2))
+
+
+class TestAsyncSingleFlight(testtools.TestCase):
+
+    def _gather(self, func, callers=3):
+        flight = cache.AsyncSingleFlight()
+
+        async def _run():
+            return await asyncio.gather(
+                *[flight.do('key', func) for _i in range(callers)],
+                return_exceptions=True)
+        return asyncio.run(_run())
+
+    def test_concurrent_calls_share_result(self):
+        calls = []
+
+        async def func():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return 'value'
+        self.assertEqual([('value', True)] * 3, self._gather(func))
+        self.assertEqual(1, len(calls))
+
+    def test_concurrent_calls_share_error(self):
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError('boom')
+        results = self._gather(fail)
+        self.assertEqual(3, len(results))
+        self.assertTrue(all(isinstance(e, ValueError) for e in results))
+
+    def test_cancelled_waiter_does_not_cancel_the_call(self):
+        flight = cache.AsyncSingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.01)
+            return 'value'
+
+        async def _run():
+            leader = asyncio.ensure_future(flight.do('key', func))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(flight.do('key', func))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            return await leader
+        self.assertEqual(('value', True), asyncio.run(_run()))
+
+    def test_sequential_calls_are_not_shared(self):
+        flight = cache.AsyncSingleFlight()
+
+        async def _run():
+            async def value():
+                return 1
+            return [await flight.do('key', value) for _i in range(2)]
+        self.assertEqual([(1, False)] * 2, asyncio.run(_run()))
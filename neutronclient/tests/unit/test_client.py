@@ -0,0 +1,830 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from concurrent import futures
+import re
+import threading
+import time
+
+import fixtures
+from oslo_serialization import jsonutils
+import requests
+from requests_mock.contrib import fixture as mock_fixture
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.common import metrics
+from neutronclient.common import ratelimit
+from neutronclient.common import records
+from neutronclient.common import retry
+from neutronclient.neutron.v2_0.contrib import _fox_sockets
+from neutronclient.v2_0 import client
+
+
+AUTH_TOKEN = 'test_token'
+END_URL = 'http://test.test:9696'
+PORTS_URL = END_URL + '/v2.0/ports'
+
+
+def _page(ports, next_marker=None, request_id=None):
+    body = {'ports': [{'id': p} for p in ports]}
+    if next_marker:
+        body['ports_links'] = [
+            {'rel': 'next',
+             'href': PORTS_URL + '?limit=2&marker=%s' % next_marker}]
+    headers = {}
+    if request_id:
+        headers['x-openstack-request-id'] = request_id
+    return {'text': jsonutils.dumps(body), 'headers': headers}
+
+
+class ClientTestBase(testtools.TestCase):
+
+    def setUp(self):
+        super(ClientTestBase, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.client = client.Client(token=AUTH_TOKEN, endpoint_url=END_URL)
+
+    def register_pages(self):
+        self.requests.get(PORTS_URL, [
+            _page(['p1', 'p2'], next_marker='p2', request_id='req-1'),
+            _page(['p3', 'p4'], next_marker='p4', request_id='req-2'),
+            _page(['p5'], request_id='req-3')])
+
+
+class TestClientPagination(ClientTestBase):
+
+    def test_list_all_pages(self):
+        self.register_pages()
+        res = self.client.list_ports(limit=2)
+        self.assertEqual(['p1', 'p2', 'p3', 'p4', 'p5'],
+                         [p['id'] for p in res['ports']])
+        self.assertEqual(['req-1', 'req-2', 'req-3'], res.request_ids)
+
+    def test_list_all_pages_prefetch(self):
+        self.register_pages()
+        res = self.client.list_ports(limit=2, prefetch=2)
+        self.assertEqual(['p1', 'p2', 'p3', 'p4', 'p5'],
+                         [p['id'] for p in res['ports']])
+        self.assertEqual(['req-1', 'req-2', 'req-3'], res.request_ids)
+        self.assertEqual(3, self.requests.call_count)
+        self.assertNotIn('prefetch', self.requests.request_history[0].qs)
+
+    def test_list_generator_prefetch(self):
+        self.register_pages()
+        gen = self.client.list_ports(retrieve_all=False, prefetch=1)
+        pages = [[p['id'] for p in page['ports']] for page in gen]
+        self.assertEqual([['p1', 'p2'], ['p3', 'p4'], ['p5']], pages)
+        self.assertEqual(['req-1', 'req-2', 'req-3'], gen.request_ids)
+
+    def test_prefetch_propagates_errors(self):
+        self.requests.get(PORTS_URL, [
+            _page(['p1', 'p2'], next_marker='p2'),
+            {'status_code': 404, 'text': 'not found'}])
+        gen = self.client.list_ports(retrieve_all=False, prefetch=2)
+        self.assertEqual(['p1', 'p2'], [p['id'] for p in next(gen)['ports']])
+        self.assertRaises(exceptions.NotFound, next, gen)
+
+
+class TestClientStreaming(ClientTestBase):
+
+    def test_list_stream_generator(self):
+        self.register_pages()
+        gen = self.client.list_ports(retrieve_all=False, stream=True)
+        self.assertEqual(['p1', 'p2', 'p3', 'p4', 'p5'],
+                         [p['id'] for p in gen])
+        self.assertEqual(['req-1', 'req-2', 'req-3'], gen.request_ids)
+        self.assertNotIn('stream', self.requests.request_history[0].qs)
+
+    def test_list_stream_retrieve_all(self):
+        self.register_pages()
+        res = self.client.list_ports(stream=True)
+        self.assertEqual(['p1', 'p2', 'p3', 'p4', 'p5'],
+                         [p['id'] for p in res['ports']])
+        self.assertEqual(['req-1', 'req-2', 'req-3'], res.request_ids)
+
+    def test_list_stream_error(self):
+        self.requests.get(PORTS_URL, status_code=404, text='not found')
+        gen = self.client.list_ports(retrieve_all=False, stream=True)
+        self.assertRaises(exceptions.NotFound, next, gen)
+
+    def test_list_stream_malformed(self):
+        self.requests.get(PORTS_URL, text='{"ports": [{"id": "p1"}, ')
+        gen = self.client.list_ports(retrieve_all=False, stream=True)
+        self.assertEqual('p1', next(gen)['id'])
+        self.assertRaises(exceptions.MalformedResponseBody, next, gen)
+
+
+class TestFindResourceCache(testtools.TestCase):
+
+    net_id = 'a8b5d9f4-1c55-4c2a-9b8e-3b6c7f3e2d10'
+    networks_url = END_URL + '/v2.0/networks'
+
+    def setUp(self):
+        super(TestFindResourceCache, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.client = client.Client(token=AUTH_TOKEN, endpoint_url=END_URL,
+                                    find_cache_ttl=60)
+        body = {'networks': [{'id': self.net_id, 'name': 'net1'}]}
+        self.requests.get(self.networks_url, text=jsonutils.dumps(body))
+
+    def test_resolution_is_cached(self):
+        for _i in range(3):
+            net = self.client.find_resource('network', 'net1')
+            self.assertEqual(self.net_id, net['id'])
+        # One lookup by id is skipped as 'net1' is not an UUID.
+        self.assertEqual(1, self.requests.call_count)
+
+    def test_cached_result_is_a_copy(self):
+        self.client.find_resource('network', 'net1')['id'] = 'changed'
+        net = self.client.find_resource('network', 'net1')
+        self.assertEqual(self.net_id, net['id'])
+
+    def test_write_invalidates_resource_type(self):
+        self.requests.put(self.networks_url + '/' + self.net_id,
+                          text=jsonutils.dumps({'network': {}}))
+        self.requests.post(END_URL + '/v2.0/ports',
+                           text=jsonutils.dumps({'port': {}}))
+        self.client.find_resource('network', 'net1')
+        self.client.create_port({'port': {}})
+        self.client.find_resource('network', 'net1')
+        self.assertEqual(2, self.requests.call_count)
+        self.client.update_network(self.net_id, {'network': {}})
+        self.client.find_resource('network', 'net1')
+        self.assertEqual(4, self.requests.call_count)
+
+
+class TestTrustUUIDs(testtools.TestCase):
+
+    net_id = 'a8b5d9f4-1c55-4c2a-9b8e-3b6c7f3e2d10'
+    other_id = '0f2b4c3e-7a1d-4b5e-8c9f-1a2b3c4d5e6f'
+    networks_url = END_URL + '/v2.0/networks'
+
+    def setUp(self):
+        super(TestTrustUUIDs, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.client = client.Client(token=AUTH_TOKEN, endpoint_url=END_URL,
+                                    trust_uuids=True,
+                                    verify_trusted_uuids=True)
+
+    def test_uuid_is_trusted_for_id_lookup(self):
+        net = self.client.find_resource('network', self.net_id, fields='id')
+        self.assertEqual({'id': self.net_id}, net)
+        net = self.client.find_resource_by_id('network', self.net_id,
+                                              fields='id')
+        self.assertEqual({'id': self.net_id}, net)
+        self.assertEqual(0, self.requests.call_count)
+
+    def test_uuid_is_looked_up_for_other_fields(self):
+        body = {'networks': [{'id': self.net_id, 'name': 'net1'}]}
+        self.requests.get(self.networks_url, text=jsonutils.dumps(body))
+        net = self.client.find_resource('network', self.net_id)
+        self.assertEqual('net1', net['name'])
+        self.assertEqual(1, self.requests.call_count)
+
+    def test_trusted_uuid_is_normalised(self):
+        self.requests.get(self.networks_url,
+                          json={'networks': [{'id': self.net_id}]})
+        net = self.client.find_resource('network', self.net_id.upper(),
+                                        fields='id')
+        self.assertEqual({'id': self.net_id}, net)
+        self.client.verify_trusted_uuids()
+
+    def test_uuid_prefixed_name_is_not_trusted(self):
+        name = self.net_id + '-backup'
+        body = {'networks': [{'id': self.other_id, 'name': name}]}
+        self.requests.get(self.networks_url + '?name=' + name + '&fields=id',
+                          text=jsonutils.dumps(body))
+        self.requests.get(self.networks_url + '?id=' + name + '&fields=id',
+                          text=jsonutils.dumps({'networks': []}))
+        net = self.client.find_resource('network', name, fields='id')
+        self.assertEqual(self.other_id, net['id'])
+        found = self.client.find_resources('network', [name], fields='id')
+        self.assertEqual(self.other_id, found[name]['id'])
+        self.client.verify_trusted_uuids()
+
+    def test_verify_trusted_uuids(self):
+        body = {'networks': [{'id': self.net_id}]}
+        self.requests.get(self.networks_url, text=jsonutils.dumps(body))
+        for net_id in (self.net_id, self.other_id):
+            self.client.find_resource('network', net_id, fields='id')
+        e = self.assertRaises(exceptions.NotFound,
+                              self.client.verify_trusted_uuids)
+        self.assertIn(self.other_id, str(e))
+        self.assertNotIn(self.net_id, str(e))
+        self.assertEqual(1, self.requests.call_count)
+        self.assertEqual(sorted([self.net_id, self.other_id]),
+                         self.requests.last_request.qs['id'])
+        # Pending UUIDs are verified only once.
+        self.client.verify_trusted_uuids()
+        self.assertEqual(1, self.requests.call_count)
+
+    def test_request_on_trusted_uuid_confirms_it(self):
+        self.requests.delete(self.networks_url + '/' + self.net_id,
+                             status_code=204)
+        self.client.find_resource('network', self.net_id, fields='id')
+        self.client.delete_network(self.net_id)
+        self.client.verify_trusted_uuids()
+        self.assertEqual(1, self.requests.call_count)
+
+
+class TestFindResources(testtools.TestCase):
+
+    sg_ids = ['a8b5d9f4-1c55-4c2a-9b8e-3b6c7f3e2d1%d' % i for i in range(3)]
+    sgs_url = END_URL + '/v2.0/security-groups'
+
+    def setUp(self):
+        super(TestFindResources, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.client = client.Client(token=AUTH_TOKEN, endpoint_url=END_URL)
+        sgs = [{'id': self.sg_ids[0], 'name': 'web'},
+               {'id': self.sg_ids[1], 'name': 'db'},
+               {'id': self.sg_ids[2], 'name': 'db'}]
+
+        def _list(request, context):
+            qs = request.qs
+            if 'id' in qs:
+                match = [sg for sg in sgs if sg['id'] in qs['id']]
+            else:
+                match = [sg for sg in sgs if sg['name'] in qs['name']]
+            return {'security_groups': match}
+
+        self.requests.get(self.sgs_url, json=_list)
+
+    def test_find_resources(self):
+        found = self.client.find_resources(
+            'security_group', [self.sg_ids[1], 'web', self.sg_ids[1]])
+        self.assertEqual({self.sg_ids[1]: 'db', 'web': 'web'},
+                         dict((k, v['name']) for k, v in found.items()))
+        self.assertEqual(2, self.requests.call_count)
+        self.assertEqual([self.sg_ids[1]],
+                         self.requests.request_history[0].qs['id'])
+        self.assertEqual(['web'], self.requests.request_history[1].qs['name'])
+
+    def test_find_resources_normalises_ids(self):
+        upper = self.sg_ids[1].upper()
+        found = self.client.find_resources('security_group',
+                                           [upper, self.sg_ids[1]])
+        self.assertEqual(self.sg_ids[1], found[upper]['id'])
+        self.assertEqual(self.sg_ids[1], found[self.sg_ids[1]]['id'])
+        self.assertEqual(1, self.requests.call_count)
+        self.assertIn('id=%s' % self.sg_ids[1],
+                      self.requests.last_request.url)
+        self.assertNotIn(upper, self.requests.last_request.url)
+
+    def test_find_resources_reports_all_errors(self):
+        e = self.assertRaises(exceptions.ResourceLookupError,
+                              self.client.find_resources, 'security_group',
+                              ['web', 'db', 'app', 'cache'])
+        self.assertEqual(['app', 'cache'], e.not_found)
+        self.assertEqual(['db'], e.ambiguous)
+        self.assertIsInstance(e, exceptions.NotFound)
+        self.assertEqual(404, e.status_code)
+        self.assertEqual(1, self.requests.call_count)
+
+    def test_find_resources_chunks_long_uris(self):
+        self.useFixture(fixtures.MockPatchObject(client.client,
+                                                 'MAX_URI_LEN', 200))
+        found = self.client.find_resources('security_group', self.sg_ids,
+                                           fields='id')
+        self.assertEqual(self.sg_ids, sorted(found))
+        self.assertGreater(self.requests.call_count, 1)
+        for request in self.requests.request_history:
+            self.assertLessEqual(len(request.url), 200)
+
+
+class TestChunkedList(ClientTestBase):
+
+    port_ids = ['a8b5d9f4-1c55-4c2a-9b8e-3b6c7f3e2d%02d' % i
+                for i in range(10)]
+
+    def setUp(self):
+        super(TestChunkedList, self).setUp()
+        self.useFixture(fixtures.MockPatchObject(client.client,
+                                                 'MAX_URI_LEN', 300))
+        self.requests.get(PORTS_URL, json=self._list)
+
+    def _list(self, request, context):
+        context.headers['x-openstack-request-id'] = 'req-%s' % (
+            request.qs['id'][0][-2:])
+        return {'ports': [{'id': port_id} for port_id in request.qs['id']]}
+
+    def test_long_filter_is_split(self):
+        res = self.client.list_ports(id=self.port_ids, fields='id')
+        self.assertEqual(self.port_ids, [p['id'] for p in res['ports']])
+        self.assertGreater(self.requests.call_count, 1)
+        self.assertEqual(self.requests.call_count, len(res.request_ids))
+        for request in self.requests.request_history:
+            self.assertLessEqual(len(request.url), 300)
+            self.assertEqual(['id'], request.qs['fields'])
+
+    def test_long_filter_is_split_compact(self):
+        res = self.client.list_ports(id=self.port_ids, compact=True)
+        self.assertIsInstance(res['ports'], records.RowList)
+        self.assertEqual(self.port_ids, [p['id'] for p in res['ports']])
+
+    def test_long_filter_is_split_generator(self):
+        gen = self.client.list_ports(retrieve_all=False, id=self.port_ids)
+        ports = [p['id'] for page in gen for p in page['ports']]
+        self.assertEqual(self.port_ids, ports)
+        self.assertGreater(self.requests.call_count, 1)
+
+    def test_short_filter_is_not_split(self):
+        res = self.client.list_ports(id=self.port_ids[:2])
+        self.assertEqual(self.port_ids[:2], [p['id'] for p in res['ports']])
+        self.assertEqual(1, self.requests.call_count)
+
+    def test_split_again_when_endpoint_is_unknown(self):
+        self.client.httpclient.endpoint_url = None
+        self.client.httpclient.authenticate_and_fetch_endpoint_url = (
+            self._set_endpoint)
+        res = self.client.list_ports(id=self.port_ids)
+        self.assertEqual(self.port_ids, [p['id'] for p in res['ports']])
+
+    def _set_endpoint(self):
+        self.client.httpclient.endpoint_url = END_URL
+
+    def test_filter_len_and_marker_len(self):
+        res = self.client.list_ports(id=self.port_ids)
+        self.assertEqual(2, self.requests.call_count)
+        res = self.client.list_ports(id=self.port_ids, filter_len=100,
+                                     marker_len=0)
+        self.assertEqual(self.port_ids, [p['id'] for p in res['ports']])
+        self.assertEqual(2 + 5, self.requests.call_count)
+
+    def _fail_first_request(self):
+        self.useFixture(fixtures.MockPatch('time.sleep'))
+        self.client.retry_policy = retry.RetryPolicy(jitter=False)
+        lock = threading.Lock()
+        calls = []
+
+        def _list(request, context):
+            with lock:
+                calls.append(request)
+                first = len(calls) == 1
+            if first:
+                context.status_code = 503
+                return {}
+            return self._list(request, context)
+
+        self.requests.get(PORTS_URL, json=_list)
+
+    def test_retries_are_counted(self):
+        self._fail_first_request()
+        res = self.client.list_ports(id=self.port_ids)
+        self.assertEqual(self.port_ids, [p['id'] for p in res['ports']])
+        self.assertEqual(1, res.retries)
+
+    def test_retries_are_counted_when_streaming(self):
+        self._fail_first_request()
+        res = self.client.list_ports(id=self.port_ids, stream=True)
+        self.assertEqual(self.port_ids, [p['id'] for p in res['ports']])
+        self.assertEqual(1, res.retries)
+
+    def test_retries_are_counted_by_stream_generator(self):
+        self._fail_first_request()
+        gen = self.client.list_ports(retrieve_all=False, stream=True,
+                                     id=self.port_ids)
+        self.assertEqual(self.port_ids, [p['id'] for p in gen])
+        self.assertEqual(1, gen.retries)
+        self.assertEqual(['req-00', 'req-05'], gen.request_ids)
+
+    def test_retries_are_counted_when_halving_chunks(self):
+        self._fail_first_request()
+        self.client.httpclient.endpoint_url = None
+        self.client.httpclient.authenticate_and_fetch_endpoint_url = (
+            self._set_endpoint)
+        # Without room for a marker the first chunk is too long once the
+        # endpoint is known and gets halved
+        self.client.max_workers = 1
+        res = self.client.list_ports(id=self.port_ids, marker_len=0)
+        self.assertEqual(self.port_ids, [p['id'] for p in res['ports']])
+        self.assertEqual([3, 3, 4, 3], [len(request.qs['id']) for request
+                                        in self.requests.request_history])
+        self.assertEqual(1, res.retries)
+
+
+class TestRetryPolicy(ClientTestBase):
+
+    def setUp(self):
+        super(TestRetryPolicy, self).setUp()
+        self.sleep = self.useFixture(fixtures.MockPatch('time.sleep')).mock
+
+    def test_retry_after_is_honored(self):
+        self.client.retry_policy = retry.RetryPolicy(backoff=0.1,
+                                                     jitter=False)
+        self.requests.get(PORTS_URL, [
+            {'status_code': 503, 'headers': {'Retry-After': '2'},
+             'text': 'overloaded'},
+            _page(['p1'], request_id='req-1')])
+        res = self.client.list_ports()
+        self.assertEqual([{'id': 'p1'}], res['ports'])
+        self.assertEqual(1, res.retries)
+        self.sleep.assert_called_once_with(2.0)
+
+    def test_non_retryable_status_is_raised(self):
+        self.client.retry_policy = retry.RetryPolicy()
+        self.requests.get(PORTS_URL, status_code=409, text='conflict')
+        self.assertRaises(exceptions.Conflict, self.client.list_ports)
+        self.sleep.assert_not_called()
+
+    def test_exhausted_policy_raises_last_error(self):
+        self.client.retry_policy = retry.RetryPolicy(max_retries=2,
+                                                     jitter=False)
+        self.requests.get(PORTS_URL, status_code=503, text='overloaded')
+        self.assertRaises(exceptions.ServiceUnavailable,
+                          self.client.list_ports)
+        self.assertEqual(3, self.requests.call_count)
+
+    def test_legacy_retries_only_connection_failures(self):
+        self.client.retries = 2
+        self.requests.get(PORTS_URL, status_code=503, text='overloaded')
+        self.assertRaises(exceptions.ServiceUnavailable,
+                          self.client.list_ports)
+        self.assertEqual(1, self.requests.call_count)
+
+
+class TestRateLimiter(ClientTestBase):
+
+    def test_overload_shrinks_concurrency(self):
+        concurrency = ratelimit.AIMDLimiter(initial=4,
+                                            latency_tolerance=None)
+        self.client.rate_limiter = ratelimit.RateLimiter(
+            concurrency=concurrency)
+        self.requests.get(PORTS_URL, status_code=503, text='overloaded')
+        for _i in range(4):
+            self.assertRaises(exceptions.ServiceUnavailable,
+                              self.client.list_ports)
+        self.assertEqual(2, concurrency.limit)
+        self.assertEqual(0, concurrency.inflight)
+
+    def test_streamed_requests_are_limited(self):
+        self.client.rate_limiter = ratelimit.RateLimiter(rates={'GET': 1})
+        acquire = self.useFixture(fixtures.MockPatchObject(
+            self.client.rate_limiter._buckets['GET'], 'acquire')).mock
+        self.register_pages()
+        res = self.client.list_ports(limit=2, stream=True)
+        self.assertEqual(5, len(res['ports']))
+        self.assertEqual(3, acquire.call_count)
+
+    def test_streamed_overload_shrinks_concurrency(self):
+        concurrency = ratelimit.AIMDLimiter(initial=4,
+                                            latency_tolerance=None)
+        self.client.rate_limiter = ratelimit.RateLimiter(
+            concurrency=concurrency)
+        self.requests.get(PORTS_URL, status_code=429, text='overloaded')
+        for _i in range(4):
+            self.assertRaises(exceptions.NeutronClientException,
+                              self.client.list_ports, stream=True)
+        self.assertEqual(2, concurrency.limit)
+        self.assertEqual(0, concurrency.inflight)
+
+
+class TestCoalescedRequests(ClientTestBase):
+
+    def setUp(self):
+        super(TestCoalescedRequests, self).setUp()
+        self.client = client.Client(token=AUTH_TOKEN, endpoint_url=END_URL,
+                                    coalesce_requests=True)
+
+    def test_coalescing_key(self):
+        key = self.client._coalescing_key
+        self.assertEqual(key('/ports', {'id': ['b', 'a'], 'name': 'x'}),
+                         key('/ports', {'name': 'x', 'id': ['a', 'b']}))
+        self.assertNotEqual(
+            key('/ports', {'sort_key': ['name', 'id']}),
+            key('/ports', {'sort_key': ['id', 'name']}))
+        self.assertNotEqual(key('/ports', None), key('/networks', None))
+
+    def test_concurrent_gets_are_coalesced(self):
+        release = threading.Event()
+
+        def slow_response(request, context):
+            release.wait(5)
+            context.headers['x-openstack-request-id'] = 'req-1'
+            return {'ports': [{'id': 'p1'}]}
+
+        self.requests.get(PORTS_URL, json=slow_response)
+        results = []
+        threads = [threading.Thread(
+            target=lambda: results.append(self.client.list_ports()))
+            for _i in range(4)]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + 5
+        flights = self.client._single_flight._flights
+        while time.monotonic() < deadline:
+            if any(f.waiters == 3 for f in list(flights.values())):
+                break
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(1, self.requests.call_count)
+        self.assertEqual(4, len(results))
+        for res in results:
+            self.assertEqual({'ports': [{'id': 'p1'}]}, res)
+            self.assertEqual(['req-1'], res.request_ids)
+        # Every caller may modify its own copy
+        self.assertEqual(4, len(set(id(res['ports']) for res in results)))
+
+    def test_sequential_gets_are_not_coalesced(self):
+        self.requests.get(PORTS_URL, json={'ports': []})
+        self.client.list_ports()
+        self.client.list_ports()
+        self.assertEqual(2, self.requests.call_count)
+
+
+class TestResponseCache(ClientTestBase):
+
+    PORT_URL = PORTS_URL + '/p1'
+
+    def setUp(self):
+        super(TestResponseCache, self).setUp()
+        self.client = client.Client(token=AUTH_TOKEN, endpoint_url=END_URL,
+                                    response_cache_size=10)
+
+    def _port(self, revision=1, name='a'):
+        return {'json': {'port': {'id': 'p1', 'name': name,
+                                  'revision_number': revision}}}
+
+    def test_not_modified_reuses_cached_body(self):
+        self.requests.get(self.PORT_URL, [
+            dict(self._port(), headers={'ETag': '"abc"'}),
+            {'status_code': 304,
+             'headers': {'x-openstack-request-id': 'req-2'}}])
+        first = self.client.show_port('p1')
+        first['port']['name'] = 'modified by the caller'
+        second = self.client.show_port('p1')
+        self.assertNotIn('If-None-Match',
+                         self.requests.request_history[0].headers)
+        self.assertEqual('"abc"',
+                         self.requests.request_history[1].headers[
+                             'If-None-Match'])
+        self.assertEqual('a', second['port']['name'])
+        self.assertEqual(['req-2'], second.request_ids)
+
+    def test_revision_number_validator(self):
+        self.requests.get(self.PORT_URL, [
+            self._port(revision=3), self._port(revision=4, name='b')])
+        self.client.show_port('p1')
+        second = self.client.show_port('p1')
+        self.assertEqual('revision_number=3',
+                         self.requests.request_history[1].headers[
+                             'If-None-Match'])
+        self.assertEqual('b', second['port']['name'])
+
+    def test_server_ignoring_conditional_get(self):
+        # Like Neutron, answer 200 with the resource whatever the headers
+        self.requests.get(self.PORT_URL, [
+            self._port(revision=3), self._port(revision=3),
+            self._port(revision=4, name='b')])
+        self.client.show_port('p1')
+        second = self.client.show_port('p1')
+        third = self.client.show_port('p1')
+        self.assertEqual(3, self.requests.call_count)
+        self.assertEqual('a', second['port']['name'])
+        self.assertEqual('b', third['port']['name'])
+        self.assertEqual('revision_number=3',
+                         self.requests.request_history[2].headers[
+                             'If-None-Match'])
+
+    def test_query_parameters_are_cached_apart(self):
+        self.requests.get(self.PORT_URL, json=self._port()['json'])
+        self.client.show_port('p1')
+        self.client.show_port('p1', fields='name')
+        self.assertNotIn('If-None-Match',
+                         self.requests.request_history[1].headers)
+
+    def test_lists_are_not_cached(self):
+        self.requests.get(PORTS_URL, json={'ports': []})
+        self.client.list_ports()
+        self.client.list_ports()
+        self.assertNotIn('If-None-Match',
+                         self.requests.request_history[1].headers)
+
+    def test_write_invalidates(self):
+        self.requests.get(self.PORT_URL, json=self._port()['json'])
+        self.requests.put(self.PORT_URL, json=self._port()['json'])
+        self.client.show_port('p1')
+        self.client.update_port('p1', {'port': {'name': 'a'}})
+        self.client.show_port('p1')
+        self.assertNotIn('If-None-Match',
+                         self.requests.request_history[2].headers)
+
+
+class TestCompactList(ClientTestBase):
+
+    def test_list_all_pages_compact(self):
+        self.register_pages()
+        res = self.client.list_ports(limit=2, compact=True)
+        self.assertIsInstance(res['ports'], records.RowList)
+        self.assertEqual(['p1', 'p2', 'p3', 'p4', 'p5'],
+                         [p['id'] for p in res['ports']])
+        self.assertEqual(['req-1', 'req-2', 'req-3'], res.request_ids)
+        self.assertNotIn('compact', self.requests.request_history[0].qs)
+
+    def test_stream_compact(self):
+        self.register_pages()
+        res = self.client.list_ports(limit=2, stream=True, compact=True)
+        self.assertIsInstance(res['ports'][0], records.Row)
+        self.assertEqual(5, len(res['ports']))
+
+
+class TestExtensionRegistry(testtools.TestCase):
+
+    def setUp(self):
+        super(TestExtensionRegistry, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.discover = self.useFixture(fixtures.MockPatch(
+            'neutronclient.common.extension._discover_via_entry_points',
+            return_value=[('fox_sockets', _fox_sockets)])).mock
+        client._load_extensions.cache_clear()
+        self.addCleanup(client._load_extensions.cache_clear)
+
+        class _Client(client.Client):
+            pass
+        self.client_class = _Client
+
+    def _client(self):
+        return self.client_class(token=AUTH_TOKEN, endpoint_url=END_URL)
+
+    def test_extensions_are_discovered_once(self):
+        first = self._client()
+        second = self._client()
+        self.assertEqual(1, self.discover.call_count)
+        self.assertIn('list_fox_sockets', vars(self.client_class))
+        self.assertNotIn('list_fox_sockets', vars(first))
+        self.assertEqual('/fox_sockets/%s', second.fox_socket_path)
+        self.assertEqual('fox_sockets',
+                         second.get_resource_plural('fox_socket'))
+        self.assertNotIn('fox_sockets', client.Client.EXTED_PLURALS)
+        info = second.resources.get('fox_socket')
+        self.assertEqual('/fox_sockets', info.collection_path)
+        self.assertIsNone(
+            client.Client._get_resource_registry().get('fox_socket'))
+
+    def test_extension_methods(self):
+        self.requests.get(END_URL + '/v2.0/fox_sockets',
+                          json={'fox_sockets': [{'id': 'f1'}]})
+        self.requests.get(END_URL + '/v2.0/fox_sockets/f1',
+                          json={'fox_socket': {'id': 'f1'}})
+        neutron = self._client()
+        self.assertEqual([{'id': 'f1'}],
+                         neutron.list_fox_sockets()['fox_sockets'])
+        self.assertEqual({'id': 'f1'},
+                         neutron.show_fox_socket('f1')['fox_socket'])
+
+    def test_extend_with_module_keeps_class_plurals(self):
+        self.discover.return_value = []
+        neutron = self._client()
+        plurals = self.client_class.EXTED_PLURALS
+        neutron._extend_client_with_module(_fox_sockets, '2.0')
+        self.assertEqual('fox_socket',
+                         neutron.EXTED_PLURALS['fox_sockets'])
+        self.assertIs(plurals, self.client_class.EXTED_PLURALS)
+        self.assertNotIn('fox_sockets', plurals)
+
+    def test_extend_instance(self):
+        neutron = self._client()
+        neutron.extend_show('fox', '/foxes/%s', None)
+        self.requests.get(END_URL + '/v2.0/foxes/f1',
+                          json={'fox': {'id': 'f1'}})
+        self.assertEqual({'id': 'f1'}, neutron.show_fox('f1')['fox'])
+        self.assertFalse(hasattr(self._client(), 'show_fox'))
+
+
+class TestSharedClient(ClientTestBase):
+
+    def setUp(self):
+        super(TestSharedClient, self).setUp()
+        self.requests.get(
+            re.compile(PORTS_URL + '/'),
+            json=lambda request, context: {
+                'port': {'id': request.path.rsplit('/', 1)[1]}})
+
+    def test_headers_of_caller_are_not_modified(self):
+        headers = {'X-Custom': 'value'}
+        self.client.get('/ports/p1', headers=headers)
+        self.assertEqual({'X-Custom': 'value'}, headers)
+        sent = self.requests.last_request.headers
+        self.assertEqual('value', sent['X-Custom'])
+        self.assertEqual(AUTH_TOKEN, sent['X-Auth-Token'])
+
+    def test_threads_sharing_a_client(self):
+        ids = ['port-%d' % i for i in range(200)]
+        with futures.ThreadPoolExecutor(32) as executor:
+            results = list(executor.map(
+                lambda port_id: self.client.show_port(port_id)['port']['id'],
+                ids))
+        self.assertEqual(ids, results)
+
+
+class TestRequestObservers(ClientTestBase):
+
+    def setUp(self):
+        super(TestRequestObservers, self).setUp()
+        self.events = []
+        self.client.add_request_observer(self.events.append)
+
+    def test_event(self):
+        self.requests.get(PORTS_URL + '/p1', json={'port': {'id': 'p1'}},
+                          headers={'x-openstack-request-id': 'req-1'})
+        self.client.show_port('p1', fields='id')
+        event, = self.events
+        self.assertEqual('GET', event.method)
+        self.assertEqual('/ports/%s', event.path_template)
+        self.assertEqual('/ports/p1', event.path)
+        self.assertEqual(200, event.status_code)
+        self.assertEqual('req-1', event.request_id)
+        self.assertEqual(0, event.request_bytes)
+        self.assertEqual(len(b'{"port": {"id": "p1"}}'), event.response_bytes)
+        self.assertEqual(0, event.retries)
+        self.assertIsNone(event.error)
+        self.assertGreater(event.network_time, 0)
+        self.assertGreaterEqual(event.elapsed, event.network_time)
+
+    def test_request_body_and_error(self):
+        self.requests.post(PORTS_URL, status_code=409,
+                           json={'NeutronError': {'type': 'Conflict',
+                                                  'message': 'conflict',
+                                                  'detail': ''}})
+        body = {'port': {'name': 'p'}}
+        self.assertRaises(exceptions.Conflict, self.client.create_port, body)
+        event, = self.events
+        self.assertEqual('/ports', event.path_template)
+        self.assertEqual(409, event.status_code)
+        self.assertIsInstance(event.error, exceptions.Conflict)
+        self.assertEqual(len(jsonutils.dumps(body)), event.request_bytes)
+
+    def test_retries_are_counted(self):
+        self.useFixture(fixtures.MockPatch('time.sleep'))
+        self.client.retry_policy = retry.RetryPolicy(jitter=False)
+        self.requests.get(PORTS_URL, [
+            {'status_code': 503, 'text': 'overloaded'}, _page(['p1'])])
+        self.client.list_ports()
+        self.assertEqual([503, 200], [e.status_code for e in self.events])
+        self.assertEqual([0, 1], [e.retries for e in self.events])
+
+    def test_connection_failure(self):
+        self.requests.get(PORTS_URL, exc=requests.exceptions.ConnectTimeout)
+        self.assertRaises(exceptions.ConnectionFailed,
+                          self.client.list_ports)
+        event, = self.events
+        self.assertIsNone(event.status_code)
+        self.assertIsInstance(event.error, exceptions.ConnectionFailed)
+
+    def test_streamed_list(self):
+        self.register_pages()
+        res = self.client.list_ports(limit=2, stream=True)
+        self.assertEqual(5, len(res['ports']))
+        self.assertEqual(['req-1', 'req-2', 'req-3'],
+                         [e.request_id for e in self.events])
+        for event in self.events:
+            self.assertEqual('/ports', event.path_template)
+            self.assertEqual(200, event.status_code)
+            self.assertIsNone(event.response_bytes)
+            self.assertIsNone(event.error)
+
+    def test_streamed_list_error(self):
+        self.requests.get(PORTS_URL, status_code=404, text='not found')
+        self.assertRaises(exceptions.NotFound, self.client.list_ports,
+                          stream=True)
+        event, = self.events
+        self.assertEqual(404, event.status_code)
+        self.assertEqual(len('not found'), event.response_bytes)
+        self.assertIsInstance(event.error, exceptions.NotFound)
+
+    def test_failing_observer_is_ignored(self):
+        def _fail(event):
+            raise ValueError()
+        self.client.add_request_observer(_fail)
+        self.requests.get(PORTS_URL, **_page(['p1']))
+        self.client.list_ports()
+        self.assertEqual(1, len(self.events))
+        self.client.remove_request_observer(_fail)
+        self.client.remove_request_observer(self.events.append)
+        self.client.list_ports()
+        self.assertEqual(1, len(self.events))
+
+    def test_aggregator(self):
+        aggregator = metrics.LatencyAggregator()
+        neutron = client.Client(token=AUTH_TOKEN, endpoint_url=END_URL,
+                                request_observers=[aggregator])
+        self.requests.get(PORTS_URL, **_page(['p1']))
+        neutron.list_ports()
+        neutron.list_ports()
+        self.assertEqual(
+            2, aggregator.snapshot()['GET /ports']['latency']['count'])
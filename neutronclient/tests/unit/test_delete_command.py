@@ -0,0 +1,69 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import io
+from unittest import mock
+
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.neutron import v2_0 as neutronV20
+
+
+class FakeDeleteNetwork(neutronV20.DeleteCommand):
+    resource = 'network'
+
+
+class TestBulkDelete(testtools.TestCase):
+
+    def setUp(self):
+        super(TestBulkDelete, self).setUp()
+        self.client = mock.Mock()
+        self.app = mock.Mock(stdout=io.StringIO())
+        self.cmd = FakeDeleteNetwork(self.app, None)
+        self.cmd.get_client = mock.Mock(return_value=self.client)
+
+    def _run(self, *args):
+        parser = self.cmd.get_parser('delete_network')
+        self.cmd.take_action(parser.parse_args(list(args)))
+
+    def test_parallel_delete_resolves_names_in_bulk(self):
+        self.client.find_resources.return_value = {
+            'net1': {'id': 'id1'}, 'net2': {'id': 'id2'}}
+        self._run('--concurrency', '2', 'net1', 'net2')
+        self.client.find_resources.assert_called_once_with(
+            'network', ['net1', 'net2'], cmd_resource='network',
+            parent_id=None, fields='id')
+        self.client.delete_network.assert_has_calls(
+            [mock.call('id1'), mock.call('id2')], any_order=True)
+        self.assertIn('Deleted network(s): net1, net2',
+                      self.app.stdout.getvalue())
+        self.client.find_resourceid_by_name_or_id.assert_not_called()
+
+    def test_parallel_delete_reports_all_errors(self):
+        self.client.find_resources.side_effect = (
+            exceptions.ResourceLookupError(
+                'network', not_found=['missing'], ambiguous=['dup'],
+                found={'net1': {'id': 'id1'}, 'net2': {'id': 'id2'}}))
+
+        def _delete(_id):
+            if _id == 'id2':
+                raise exceptions.Conflict(message='in use')
+        self.client.delete_network.side_effect = _delete
+
+        e = self.assertRaises(exceptions.NeutronCLIError, self._run,
+                              '--concurrency', '4',
+                              'net1', 'missing', 'dup', 'net2')
+        self.assertIn("with id(s) 'missing'", str(e))
+        self.assertIn("for name(s) 'dup'", str(e))
+        self.assertIn("Failed to delete network 'net2': in use", str(e))
+        self.assertIn('Deleted network(s): net1', self.app.stdout.getvalue())
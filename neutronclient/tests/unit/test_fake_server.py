@@ -0,0 +1,61 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.tests.benchmark import fake_server
+from neutronclient.v2_0 import client
+
+
+class TestFakeNeutronServer(testtools.TestCase):
+    """The benchmarks rely on the server behaving like Neutron."""
+
+    def setUp(self):
+        super(TestFakeNeutronServer, self).setUp()
+        self.server = self._start_server(ports=25, page_size=10)
+        self.client = client.Client(token='token',
+                                    endpoint_url=self.server.url)
+        self.addCleanup(self.client.close)
+
+    def _start_server(self, **kwargs):
+        server = fake_server.FakeNeutronServer(**kwargs)
+        server.__enter__()
+        self.addCleanup(server.__exit__, None, None, None)
+        return server
+
+    def test_pagination(self):
+        ports = self.client.list_ports()['ports']
+        self.assertEqual([p['id'] for p in self.server.ports],
+                         [p['id'] for p in ports])
+        self.assertEqual(3, self.server.requests)
+        ports = self.client.list_ports(limit=7)['ports']
+        self.assertEqual(25, len(ports))
+        self.assertEqual(7, self.server.requests)
+
+    def test_filters_and_fields(self):
+        ports = self.client.list_ports(name=['port-3', 'port-20'],
+                                       fields=['id', 'name'])['ports']
+        self.assertEqual([{'id': fake_server.make_port(3)['id'],
+                           'name': 'port-3'},
+                          {'id': fake_server.make_port(20)['id'],
+                           'name': 'port-20'}], ports)
+        ids = [p['id'] for p in self.server.ports[:15]]
+        ports = self.client.list_ports(id=ids, limit=4)['ports']
+        self.assertEqual(ids, [p['id'] for p in ports])
+
+    def test_find_and_delete(self):
+        port = self.client.find_resource('port', 'port-4')
+        self.assertEqual(fake_server.make_port(4)['id'], port['id'])
+        self.client.delete_port(port['id'])
+        self.assertRaises(exceptions.NotFound,
+                          self.client.delete_port, 'port-4')
@@ -14,7 +14,12 @@
 #    under the License.
 
 import abc
+import datetime
+import http.server
+import ssl
+import threading
 
+import fixtures
 from oslo_utils import uuidutils
 import osprofiler.profiler
 import osprofiler.web
@@ -155,3 +160,285 @@ class TestHTTPClientWithReqId(TestHTTPClientMixin, testtools.TestCase):
         }
         self.requests.register_uri(METHOD, URL, request_headers=headers)
         self.http.request(URL, METHOD)
+
+
+AUTH_URL = 'http://keystone.test:5000/v2.0'
+ENDPOINT_URL = 'http://neutron.test:9696'
+
+
+def _token_body(token, expires_in):
+    expires = datetime.datetime.now(datetime.timezone.utc) + \
+        datetime.timedelta(seconds=expires_in)
+    return {'access': {
+        'token': {'id': token, 'expires': expires.isoformat(),
+                  'tenant': {'id': 'project-id', 'name': 'project'}},
+        'user': {'id': 'user-id', 'name': 'user', 'roles': []},
+        'serviceCatalog': [{
+            'type': 'network', 'name': 'neutron',
+            'endpoints': [{'region': 'RegionOne',
+                           'publicURL': ENDPOINT_URL}]}]}}
+
+
+class TestTokenRefresh(testtools.TestCase):
+
+    def setUp(self):
+        super(TestTokenRefresh, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.tokens = iter('token-%d' % i for i in range(1, 100))
+        self.expires_in = 3600
+        self.auth = self.requests.post(AUTH_URL + '/tokens', json=(
+            lambda request, context: _token_body(next(self.tokens),
+                                                 self.expires_in)))
+        self.valid_token = None
+
+        def _ports(request, context):
+            if request.headers['X-Auth-Token'] != self.valid_token:
+                context.status_code = 401
+                return {}
+            return {'ports': []}
+
+        self.requests.get(ENDPOINT_URL + '/v2.0/ports', json=_ports)
+
+    def _client(self, **kwargs):
+        http = client.HTTPClient(
+            username='user', password='secret', project_name='project',
+            auth_url=AUTH_URL, region_name='RegionOne', **kwargs)
+        self.addCleanup(http.close)
+        return http
+
+    def test_concurrent_rejections_authenticate_once(self):
+        http = self._client(token='expired', endpoint_url=ENDPOINT_URL)
+        self.valid_token = 'token-1'
+        threads = [threading.Thread(target=http.do_request,
+                                    args=('/v2.0/ports', 'GET'))
+                   for _i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(1, self.auth.call_count)
+        self.assertEqual('token-1', http.auth_token)
+
+    def test_expiring_token_is_renewed_before_request(self):
+        self.expires_in = 10
+        http = self._client()
+        self.valid_token = 'token-1'
+        http.do_request('/v2.0/ports', 'GET')
+        self.valid_token = 'token-2'
+        http.do_request('/v2.0/ports', 'GET')
+        self.assertEqual(2, self.auth.call_count)
+        self.assertEqual('token-2', http.auth_token)
+
+    def test_failed_proactive_refresh_keeps_token(self):
+        self.expires_in = 10
+        http = self._client()
+        self.valid_token = 'token-1'
+        http.do_request('/v2.0/ports', 'GET')
+        self.requests.post(AUTH_URL + '/tokens', status_code=500)
+        http.do_request('/v2.0/ports', 'GET')
+        self.assertEqual('token-1', http.auth_token)
+
+    def test_refresh_disabled(self):
+        self.expires_in = 10
+        http = self._client(token_refresh_margin=None)
+        self.valid_token = 'token-1'
+        http.do_request('/v2.0/ports', 'GET')
+        http.do_request('/v2.0/ports', 'GET')
+        self.assertEqual(1, self.auth.call_count)
+
+    def test_background_refresh(self):
+        http = self._client(background_token_refresh=True,
+                            token_refresh_margin=60)
+        http.authenticate()
+        timer = http._refresh_timer
+        self.assertTrue(timer.daemon)
+        self.assertAlmostEqual(3540, timer.interval, delta=5)
+        timer.cancel()
+        timer.function(*timer.args)
+        self.assertEqual('token-2', http.auth_token)
+        self.assertIsNot(timer, http._refresh_timer)
+        http.close()
+        self.assertIsNone(http._refresh_timer)
+
+
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path.endswith('/slow'):
+            self.server.slow_started.set()
+            self.server.slow_release.wait(5)
+        body = b'{}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHTTPClientConnectionPool(testtools.TestCase):
+
+    def setUp(self):
+        super(TestHTTPClientConnectionPool, self).setUp()
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0),
+                                                 _KeepAliveHandler)
+        server.slow_started = threading.Event()
+        server.slow_release = threading.Event()
+        self.server = server
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(server.slow_release.set)
+        self.url = 'http://127.0.0.1:%d' % server.server_address[1]
+
+    def test_connection_is_reused(self):
+        with client.HTTPClient(token=AUTH_TOKEN,
+                               endpoint_url=self.url) as http:
+            for _i in range(3):
+                http.do_request('/v2.0/networks', METHOD)
+            self.assertEqual({'requests': 3, 'new_connections': 1,
+                              'hits': 2}, http.get_pool_stats())
+        self.assertIsNone(http.transport._session)
+
+    def test_idle_connections_are_recycled(self):
+        http = client.HTTPClient(token=AUTH_TOKEN, endpoint_url=self.url,
+                                 pool_idle_timeout=0.01)
+        self.addCleanup(http.close)
+        http.do_request('/v2.0/networks', METHOD)
+        http.transport._session_last_used -= 1
+        http.do_request('/v2.0/networks', METHOD)
+        self.assertEqual(2, http.get_pool_stats()['new_connections'])
+
+    def test_session_in_use_is_not_closed(self):
+        http = client.HTTPClient(token=AUTH_TOKEN, endpoint_url=self.url,
+                                 pool_idle_timeout=0.01)
+        self.addCleanup(http.close)
+        results = []
+        slow = threading.Thread(target=lambda: results.append(
+            http.do_request('/v2.0/slow', METHOD)))
+        slow.start()
+        self.assertTrue(self.server.slow_started.wait(5))
+        session = http.transport._session
+        close = self.useFixture(fixtures.MockPatchObject(
+            session, 'close', wraps=session.close)).mock
+        http.transport._session_last_used -= 1
+        http.do_request('/v2.0/networks', METHOD)
+        self.assertIsNot(session, http.transport._session)
+        close.assert_not_called()
+        self.server.slow_release.set()
+        slow.join(5)
+        self.assertEqual(200, results[0][0].status_code)
+        close.assert_called_once_with()
+
+
+class _RecordingTransport(client.RequestsTransport):
+
+    def __init__(self):
+        super(_RecordingTransport, self).__init__()
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url))
+        return super(_RecordingTransport, self).request(method, url,
+                                                        **kwargs)
+
+
+class TestTransports(testtools.TestCase):
+
+    def setUp(self):
+        super(TestTransports, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+
+    def test_default_transport(self):
+        http = client.HTTPClient(token=AUTH_TOKEN, endpoint_url=END_URL)
+        self.assertIsInstance(http.transport, client.RequestsTransport)
+
+    def test_custom_transport_is_used(self):
+        transport = _RecordingTransport()
+        http = client.HTTPClient(token=AUTH_TOKEN, endpoint_url=END_URL,
+                                 transport=transport)
+        self.requests.get(URL, text=BODY)
+        resp, resp_text = http.request(URL, METHOD)
+        self.assertEqual(BODY, resp_text)
+        self.assertEqual([(METHOD, URL)], transport.calls)
+
+    def test_incomplete_transport(self):
+        class _Transport(client.Transport):
+            def close(self):
+                pass
+        self.assertRaises(TypeError, _Transport)
+
+    def test_unknown_transport(self):
+        self.assertRaises(exceptions.UnsupportedTransport,
+                          client.HTTPClient, token=AUTH_TOKEN,
+                          endpoint_url=END_URL, transport='carrier-pigeon')
+
+    @testtools.skipUnless(client.httpx, 'httpx is not installed')
+    def test_httpx_transport_by_name(self):
+        http = client.HTTPClient(token=AUTH_TOKEN, endpoint_url=END_URL,
+                                 transport='httpx')
+        self.addCleanup(http.close)
+        self.assertIsInstance(http.transport, client.HTTPXTransport)
+
+
+@testtools.skipUnless(client.httpx, 'httpx is not installed')
+class TestHTTPXTransport(testtools.TestCase):
+
+    def setUp(self):
+        super(TestHTTPXTransport, self).setUp()
+        self.transport = client.HTTPXTransport(http2=False)
+        self.addCleanup(self.transport.close)
+        self.http = client.HTTPClient(token=AUTH_TOKEN,
+                                      endpoint_url='http://test.test:1234',
+                                      transport=self.transport)
+
+    def _mock_server(self, handler):
+        """Answer the requests of the transport with handler."""
+        xclient = client.httpx.Client(
+            transport=client.httpx.MockTransport(handler))
+        self.addCleanup(xclient.close)
+        self.transport._get_client = lambda verify, cert: xclient
+
+    def test_request(self):
+        def handler(request):
+            self.assertEqual(AUTH_TOKEN, request.headers['X-Auth-Token'])
+            return client.httpx.Response(
+                200, text=BODY,
+                headers={'x-openstack-request-id': 'req-1'})
+        self._mock_server(handler)
+        resp, resp_text = self.http.do_request('/v2.0/test', METHOD)
+        self.assertEqual(200, resp.status_code)
+        self.assertEqual(BODY, resp_text)
+        self.assertEqual('req-1', resp.headers['X-OpenStack-Request-ID'])
+        self.assertEqual({'requests': 1}, self.transport.get_pool_stats())
+
+    def test_stream(self):
+        self._mock_server(
+            lambda request: client.httpx.Response(200, content=b'x' * 10))
+        resp, _text = self.http.do_request('/v2.0/test', METHOD,
+                                           stream=True)
+        self.assertEqual(b'x' * 10, b''.join(resp.iter_content(4)))
+        resp.close()
+
+    def _raise(self, error):
+        def handler(request):
+            try:
+                raise error
+            except Exception as e:
+                raise client.httpx.ConnectError(str(e),
+                                                request=request) from e
+        self._mock_server(handler)
+
+    def test_ssl_error(self):
+        self._raise(ssl.SSLCertVerificationError('certificate verify failed'))
+        self.assertRaises(exceptions.SslCertificateValidationError,
+                          self.http.do_request, '/v2.0/test', METHOD)
+
+    def test_connection_error(self):
+        self._raise(ConnectionRefusedError('refused'))
+        self.assertRaises(exceptions.ConnectionFailed,
+                          self.http.do_request, '/v2.0/test', METHOD)
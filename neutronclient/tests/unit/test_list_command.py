@@ -0,0 +1,165 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import io
+from unittest import mock
+
+import fixtures
+import testtools
+
+from neutronclient.neutron.v2_0 import agent
+from neutronclient.neutron.v2_0 import agentscheduler
+from neutronclient.neutron.v2_0.bgp import dragentscheduler
+from neutronclient.neutron.v2_0 import extension
+from neutronclient.neutron.v2_0.fw import firewallrule
+from neutronclient.neutron.v2_0.lb.v2 import member
+from neutronclient.neutron.v2_0 import network
+from neutronclient.neutron.v2_0 import port
+from neutronclient.neutron.v2_0 import securitygroup
+
+
+class TestFieldProjection(testtools.TestCase):
+
+    def _list(self, cmd_class, *args):
+        resource_plural = cmd_class.resource + 's'
+        client = mock.Mock()
+        client.get_resource_plural.side_effect = lambda r: r + 's'
+        lister = getattr(client, 'list_%s' % resource_plural)
+        lister.return_value = {resource_plural: []}
+        app = mock.Mock(stdout=io.StringIO())
+        cmd = cmd_class(app, None)
+        cmd.get_client = mock.Mock(return_value=client)
+        cmd.is_admin_role = mock.Mock(return_value=False)
+        parser = cmd.get_parser('list')
+        cmd.take_action(parser.parse_args(list(args)))
+        return lister.call_args[1]
+
+    def test_default_columns_are_projected(self):
+        search_opts = self._list(port.ListPort)
+        self.assertEqual(['id', 'name', 'mac_address', 'fixed_ips',
+                          'tenant_id'], search_opts['fields'])
+
+    def test_selected_columns_are_projected(self):
+        search_opts = self._list(port.ListPort, '-c', 'id', '-c', 'status')
+        self.assertEqual(['id', 'status', 'tenant_id'],
+                         search_opts['fields'])
+
+    def test_explicit_fields_are_kept(self):
+        search_opts = self._list(port.ListPort, '-F', 'name')
+        self.assertEqual(['name'], search_opts['fields'])
+
+    def test_show_details_is_not_projected(self):
+        search_opts = self._list(port.ListPort, '-D')
+        self.assertNotIn('fields', search_opts)
+
+    def test_computed_columns_need_their_dependencies(self):
+        search_opts = self._list(firewallrule.ListFirewallRule)
+        fields = search_opts['fields']
+        self.assertNotIn('summary', fields)
+        for field in ('protocol', 'source_ip_address', 'source_port',
+                      'destination_ip_address', 'destination_port',
+                      'action', 'firewall_policy_id'):
+            self.assertIn(field, fields)
+
+    def test_display_names_are_translated(self):
+        search_opts = self._list(securitygroup.ListSecurityGroupRule,
+                                 '--no-nameconv')
+        fields = search_opts['fields']
+        for field in ('security_group_id', 'remote_ip_prefix',
+                      'remote_group_id', 'protocol', 'port_range_min'):
+            self.assertIn(field, fields)
+        self.assertNotIn('remote', fields)
+
+    def test_resource_without_tenant_id(self):
+        search_opts = self._list(agent.ListAgent, '-c', 'host')
+        self.assertEqual(['host', 'id'], search_opts['fields'])
+
+    def test_resource_without_id_and_tenant_id(self):
+        search_opts = self._list(extension.ListExt)
+        self.assertEqual(['alias', 'name'], search_opts['fields'])
+
+    def test_nested_collection_is_not_projected(self):
+        cmd = member.ListMember(mock.Mock(), None)
+        cmd.parent_id = 'pool-id'
+        self.assertFalse(cmd._supports_field_projection())
+
+
+class TestAgentSchedulerColumns(testtools.TestCase):
+    """-c on the commands listing the agents hosting a resource."""
+
+    def setUp(self):
+        super(TestAgentSchedulerColumns, self).setUp()
+        self.useFixture(fixtures.MockPatch(
+            'neutronclient.neutron.v2_0.find_resourceid_by_name_or_id',
+            return_value='resource-id'))
+
+    def _list(self, cmd_class, method, result, *args):
+        client = mock.Mock()
+        client.get_resource_plural.side_effect = lambda r: r + 's'
+        lister = getattr(client, method)
+        lister.return_value = result
+        stdout = io.StringIO()
+        cmd = cmd_class(mock.Mock(stdout=stdout), None)
+        cmd.get_client = mock.Mock(return_value=client)
+        cmd.is_admin_role = mock.Mock(return_value=False)
+        parser = cmd.get_parser('list')
+        cmd.run(parser.parse_args(['-f', 'value', '-c', 'host'] +
+                                  list(args)))
+        self.assertNotIn('fields', lister.call_args[1])
+        self.assertEqual('agent-host\n', stdout.getvalue())
+
+    def _agent(self):
+        return {'id': 'agent-id', 'host': 'agent-host', 'alive': True,
+                'admin_state_up': True}
+
+    def test_dhcp_agents_hosting_network(self):
+        self._list(agentscheduler.ListDhcpAgentsHostingNetwork,
+                   'list_dhcp_agent_hosting_networks',
+                   {'agents': [self._agent()]}, 'net1')
+
+    def test_l3_agents_hosting_router(self):
+        self._list(agentscheduler.ListL3AgentsHostingRouter,
+                   'list_l3_agent_hosting_routers',
+                   {'agents': [self._agent()]}, 'router1')
+
+    def test_lbaas_agent_hosting_pool(self):
+        self._list(agentscheduler.GetLbaasAgentHostingPool,
+                   'get_lbaas_agent_hosting_pool',
+                   {'agent': self._agent()}, 'pool1')
+
+    def test_lbaas_agent_hosting_loadbalancer(self):
+        self._list(agentscheduler.GetLbaasAgentHostingLoadBalancer,
+                   'get_lbaas_agent_hosting_loadbalancer',
+                   {'agent': self._agent()}, 'lb1')
+
+    def test_dragents_hosting_bgp_speaker(self):
+        self._list(dragentscheduler.ListDRAgentsHostingBGPSpeaker,
+                   'list_dragents_hosting_bgp_speaker',
+                   {'agents': [self._agent()]}, 'speaker1')
+
+
+class TestNetworkSubnets(testtools.TestCase):
+
+    def test_subnet_lookup_lengths(self):
+        client = mock.Mock()
+        client.list_subnets.return_value = {
+            'subnets': [{'id': 'subnet-id', 'cidr': '10.0.0.0/24'}]}
+        cmd = network.ListNetwork(mock.Mock(), None)
+        cmd.get_client = mock.Mock(return_value=client)
+        cmd.subnet_id_filter_len = 50
+        data = [{'id': 'net-id', 'subnets': ['subnet-id']}]
+        cmd.extend_list(data, mock.Mock(page_size=None))
+        client.list_subnets.assert_called_once_with(
+            marker_len=44, filter_len=50, fields=['id', 'cidr'],
+            id=['subnet-id'])
+        self.assertEqual([{'id': 'subnet-id', 'cidr': '10.0.0.0/24'}],
+                         data[0]['subnets'])
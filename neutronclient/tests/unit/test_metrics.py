@@ -0,0 +1,101 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import io
+import json
+
+import testtools
+
+from neutronclient.common import metrics
+
+
+def _event(path_template='/ports/%s', network_time=0.02, status_code=200,
+           **kwargs):
+    values = dict(method='GET', path_template=path_template,
+                  path='/ports/p1', status_code=status_code,
+                  request_bytes=0, response_bytes=100, serialize_time=0.0,
+                  throttle_time=0.0, network_time=network_time,
+                  deserialize_time=0.001, retries=0, request_id='req-1',
+                  error=None)
+    values.update(kwargs)
+    return metrics.RequestEvent(**values)
+
+
+class TestHistogram(testtools.TestCase):
+
+    def test_quantiles(self):
+        histogram = metrics.Histogram(buckets=(0.1, 0.2))
+        for value in (0.05, 0.05, 0.15, 0.5):
+            histogram.observe(value)
+        self.assertEqual([2, 1, 1], histogram.counts)
+        self.assertEqual(4, histogram.count)
+        self.assertAlmostEqual(0.1, histogram.quantile(0.5))
+        self.assertAlmostEqual(0.2, histogram.quantile(0.75))
+        self.assertAlmostEqual(0.5, histogram.quantile(1))
+
+    def test_empty(self):
+        self.assertIsNone(metrics.Histogram().quantile(0.5))
+
+
+class TestTiming(testtools.TestCase):
+
+    def test_phases(self):
+        timing = metrics.Timing('serialize')
+        timing.phase('network')
+        timing.stop()
+        self.assertGreaterEqual(timing.get('serialize'), 0)
+        self.assertGreaterEqual(timing.get('network'), 0)
+        self.assertEqual(0.0, timing.get('deserialize'))
+
+
+class TestLatencyAggregator(testtools.TestCase):
+
+    def setUp(self):
+        super(TestLatencyAggregator, self).setUp()
+        self.aggregator = metrics.LatencyAggregator()
+
+    def test_snapshot_per_endpoint(self):
+        self.aggregator(_event())
+        self.aggregator(_event(status_code=404, error=Exception(),
+                               retries=1))
+        self.aggregator(_event(path_template=None))
+        snapshot = self.aggregator.snapshot()
+        self.assertEqual(['GET /ports/%s', 'GET unknown'], sorted(snapshot))
+        stats = snapshot['GET /ports/%s']
+        self.assertEqual(2, stats['latency']['count'])
+        self.assertEqual(1, stats['errors'])
+        self.assertEqual(1, stats['retries'])
+        self.assertEqual(200, stats['response_bytes'])
+        self.assertEqual({'200': 1, '404': 1}, stats['statuses'])
+        self.assertAlmostEqual(0.042, stats['latency']['sum'])
+
+    def test_dump(self):
+        self.aggregator(_event())
+        out = io.StringIO()
+        self.aggregator.dump(out)
+        self.assertEqual(self.aggregator.snapshot(),
+                         json.loads(out.getvalue()))
+        self.aggregator.reset()
+        self.assertEqual({}, self.aggregator.snapshot())
+
+    def test_prometheus(self):
+        self.aggregator(_event(network_time=0.02))
+        text = self.aggregator.prometheus()
+        self.assertIn('neutronclient_request_duration_seconds_bucket{'
+                      'method="GET",path="/ports/%s",le="0.025"} 1', text)
+        self.assertIn('neutronclient_request_duration_seconds_bucket{'
+                      'method="GET",path="/ports/%s",le="0.01"} 0', text)
+        self.assertIn('neutronclient_request_duration_seconds_count{'
+                      'method="GET",path="/ports/%s"} 1', text)
@@ -0,0 +1,114 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+import fixtures
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.neutron.v2_0 import purge
+
+
+class TestPurge(testtools.TestCase):
+
+    def setUp(self):
+        super(TestPurge, self).setUp()
+        self.useFixture(fixtures.MockPatch('sys.stdout'))
+        self.cmd = purge.Purge(mock.Mock(), None)
+        self.client = mock.Mock()
+        self.calls = []
+        interfaces = [{'id': 'port1', 'tenant_id': 'tenant',
+                       'device_id': 'router1',
+                       'device_owner': 'network:router_interface'}]
+        self.resources = {
+            'floatingips': [{'id': 'fip1', 'tenant_id': 'tenant'}],
+            'ports': [{'id': 'port1', 'tenant_id': 'tenant'},
+                      {'id': 'port2', 'tenant_id': 'tenant'}],
+            'routers': [{'id': 'router1', 'tenant_id': 'tenant'}],
+            'networks': [{'id': 'net1', 'tenant_id': 'tenant'}],
+            'security_groups': [{'id': 'sg1', 'tenant_id': 'tenant'}],
+        }
+
+        def _lister(collection):
+            def _list(**params):
+                self.calls.append(('list', collection))
+                self.assertEqual('tenant', params['tenant_id'])
+                self.assertIn('tenant_id', params['fields'])
+                self.assertTrue(params['stream'])
+                resources = (interfaces if 'device_owner' in params
+                             else self.resources[collection])
+                for resource in resources:
+                    self.calls.append(('read', resource['id']))
+                    yield resource
+            return _list
+
+        def _deleter(resource):
+            def _delete(_id, body=None):
+                self.calls.append((resource, _id))
+                if body:
+                    raise exceptions.Conflict()
+            return _delete
+
+        for collection in self.resources:
+            setattr(self.client, 'list_%s' % collection, _lister(collection))
+        for resource in ('floatingip', 'port', 'router', 'network',
+                         'security_group'):
+            setattr(self.client, 'delete_%s' % resource, _deleter(resource))
+        self.client.remove_interface_router = _deleter('interface')
+
+    def test_purge_by_tier(self):
+        deleted, failed, failures, rates = self.cmd._purge_resources(
+            self.client, 'tenant', concurrency=2)
+        self.assertEqual(
+            [('list', 'floatingips'), ('read', 'fip1'),
+             ('floatingip', 'fip1'),
+             ('list', 'ports'), ('read', 'port1'), ('interface', 'router1'),
+             ('list', 'ports'), ('read', 'port1'), ('read', 'port2'),
+             ('port', 'port2'),
+             ('list', 'routers'), ('read', 'router1'), ('router', 'router1'),
+             ('list', 'networks'), ('read', 'net1'), ('network', 'net1'),
+             ('list', 'security_groups'), ('read', 'sg1'),
+             ('security_group', 'sg1')],
+            self.calls)
+        self.assertEqual({'floatingip': 1, 'port': 1, 'router': 1,
+                          'network': 1, 'security_group': 1}, deleted)
+        self.assertEqual(1, failed['port'])
+        self.assertTrue(failures)
+        self.assertIn('Throughput:',
+                      self.cmd._build_message(deleted, failed, failures,
+                                              rates))
+
+    def test_other_tenants_are_skipped(self):
+        # As listed by a server ignoring the tenant_id filter
+        self.resources['networks'].append({'id': 'net2',
+                                           'tenant_id': 'other'})
+        deleted, failed, failures, rates = self.cmd._purge_resources(
+            self.client, 'tenant')
+        self.assertEqual(1, deleted['network'])
+        self.assertNotIn(('network', 'net2'), self.calls)
+
+    def test_resources_are_deleted_while_listed(self):
+        ports = ['port%d' % i for i in range(100)]
+        self.resources['ports'] = [{'id': port_id, 'tenant_id': 'tenant'}
+                                   for port_id in ports]
+        self.cmd._purge_resources(self.client, 'tenant', concurrency=2)
+        start = len(self.calls) - self.calls[::-1].index(('list', 'ports'))
+        calls = self.calls[start:self.calls.index(('list', 'routers'))]
+        self.assertLess(calls.index(('port', 'port0')),
+                        calls.index(('read', 'port99')))
+        # A port is deleted once the next one is read, so the marker of
+        # a page still exists when the page is requested. port1 is a
+        # router interface.
+        for i in [0] + list(range(2, 99)):
+            self.assertLess(calls.index(('read', 'port%d' % (i + 1))),
+                            calls.index(('port', 'port%d' % i)))
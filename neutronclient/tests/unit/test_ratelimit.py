@@ -0,0 +1,130 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from concurrent import futures
+import threading
+import time
+
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.common import ratelimit
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(testtools.TestCase):
+
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        bucket = ratelimit.TokenBucket(rate=2, burst=2, timer=clock,
+                                       sleep=clock.sleep)
+        for _i in range(4):
+            bucket.acquire()
+        self.assertEqual([0.5, 0.5], clock.sleeps)
+
+
+class TestAIMDLimiter(testtools.TestCase):
+
+    def test_additive_increase(self):
+        limiter = ratelimit.AIMDLimiter(initial=2, latency_tolerance=None)
+        for _i in range(2):
+            limiter.acquire()
+            limiter.release()
+        self.assertEqual(3, limiter.limit)
+
+    def test_multiplicative_decrease_once_per_window(self):
+        limiter = ratelimit.AIMDLimiter(initial=4, latency_tolerance=None)
+        for _i in range(4):
+            limiter.acquire()
+        for _i in range(4):
+            limiter.release(overloaded=True)
+        self.assertEqual(2, limiter.limit)
+        for _i in range(2):
+            limiter.acquire()
+            limiter.release(overloaded=True)
+        self.assertEqual(1, limiter.limit)
+
+    def test_latency_signal(self):
+        limiter = ratelimit.AIMDLimiter(initial=1, minimum=1)
+        limiter.acquire()
+        limiter.release(latency=0.01)
+        self.assertEqual(2, limiter.limit)
+        for _i in range(2):
+            limiter.acquire()
+            limiter.release(latency=0.1)
+        self.assertEqual(1, limiter.limit)
+
+    def test_concurrency_is_bounded(self):
+        limiter = ratelimit.AIMDLimiter(initial=3, maximum=3,
+                                        latency_tolerance=None)
+        peak = []
+        lock = threading.Lock()
+
+        def _work(_i):
+            limiter.acquire()
+            try:
+                with lock:
+                    peak.append(limiter.inflight)
+                time.sleep(0.001)
+            finally:
+                limiter.release()
+        with futures.ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(_work, range(50)))
+        self.assertLessEqual(max(peak), 3)
+
+
+class TestRateLimiter(testtools.TestCase):
+
+    def test_overload_statuses_are_reported(self):
+        concurrency = ratelimit.AIMDLimiter(initial=2,
+                                            latency_tolerance=None)
+        limiter = ratelimit.RateLimiter(concurrency=concurrency)
+        for status in (503, 429):
+            with limiter.limit('GET') as outcome:
+                outcome.record(status)
+        self.assertEqual(1, concurrency.limit)
+
+    def test_connection_failures_are_reported(self):
+        concurrency = ratelimit.AIMDLimiter(initial=1,
+                                            latency_tolerance=None)
+        limiter = ratelimit.RateLimiter(concurrency=concurrency)
+        limiter.concurrency.limit = 2
+
+        def _fail():
+            with limiter.limit('GET'):
+                raise exceptions.ConnectionFailed(reason='refused')
+        self.assertRaises(exceptions.ConnectionFailed, _fail)
+        self.assertRaises(exceptions.ConnectionFailed, _fail)
+        self.assertEqual(1, concurrency.limit)
+        self.assertEqual(0, concurrency.inflight)
+
+    def test_per_method_buckets(self):
+        limiter = ratelimit.RateLimiter(rates={'post': 1}, burst=1,
+                                        concurrency=None)
+        self.assertIn('POST', limiter._buckets)
+        self.assertIsNone(limiter._default_bucket)
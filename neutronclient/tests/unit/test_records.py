@@ -0,0 +1,66 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import copy
+import pickle
+
+import testtools
+
+from neutronclient.common import records
+
+
+class TestRowList(testtools.TestCase):
+
+    def setUp(self):
+        super(TestRowList, self).setUp()
+        self.rows = records.RowList([{'id': 'p1', 'name': 'a'},
+                                     {'id': 'p2', 'name': 'b'},
+                                     {'id': 'p3'}])
+
+    def test_mapping_access(self):
+        row = self.rows[0]
+        self.assertEqual('p1', row['id'])
+        self.assertEqual('a', row.get('name'))
+        self.assertIsNone(row.get('missing'))
+        self.assertIn('name', row)
+        self.assertEqual(['id', 'name'], list(row))
+        self.assertEqual({'id': 'p1', 'name': 'a'}, row)
+        self.assertEqual({'id': 'p1', 'name': 'a'}, row.to_dict())
+        self.assertRaises(KeyError, row.__getitem__, 'missing')
+
+    def test_rows_share_schemas(self):
+        self.assertIs(self.rows[0]._schema, self.rows[1]._schema)
+        self.assertIsNot(self.rows[0]._schema, self.rows[2]._schema)
+        self.assertEqual({'id': 'p3'}, self.rows[2])
+
+    def test_rows_are_read_only(self):
+        def _set(row):
+            row['id'] = 'x'
+
+        self.assertRaises(TypeError, _set, self.rows[0])
+        self.assertRaises(AttributeError, setattr, self.rows[0], 'id', 'x')
+
+    def test_extend_keeps_rows(self):
+        other = records.RowList([{'id': 'p4', 'name': 'd'}])
+        self.rows.extend(other)
+        self.rows.append({'id': 'p5', 'name': 'e'})
+        self.assertIs(other[0], self.rows[3])
+        self.assertEqual(['p1', 'p2', 'p3', 'p4', 'p5'],
+                         [row['id'] for row in self.rows])
+
+    def test_copy_and_pickle(self):
+        self.assertEqual(self.rows[0], copy.deepcopy(self.rows[0]))
+        self.assertEqual(self.rows[1],
+                         pickle.loads(pickle.dumps(self.rows[1])))
@@ -0,0 +1,89 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import testtools
+
+from neutronclient.v2_0 import client
+from neutronclient.v2_0 import registry
+
+
+class TestResourceRegistry(testtools.TestCase):
+
+    def setUp(self):
+        super(TestResourceRegistry, self).setUp()
+        self.registry = registry.ResourceRegistry.from_client_class(
+            client.Client)
+
+    def test_plurals_match_exted_plurals(self):
+        for plural, singular in client.Client.EXTED_PLURALS.items():
+            self.assertEqual(plural, self.registry.plural(singular))
+            self.assertEqual(singular, self.registry.singular(plural))
+        self.assertEqual('ports', self.registry.plural('port'))
+        self.assertEqual('unknowns', self.registry.plural('unknown'))
+        self.assertIsNone(self.registry.singular('unknowns'))
+
+    def test_paths_match_client_attributes(self):
+        info = self.registry.get('security_groups')
+        self.assertEqual('security_group', info.singular)
+        self.assertEqual(client.Client.security_groups_path,
+                         info.collection_path)
+        self.assertEqual(client.Client.security_group_path,
+                         info.resource_path)
+
+    def test_parents(self):
+        info = self.registry.get('lbaas_member')
+        self.assertEqual('lbaas_pool', info.parent)
+        self.assertIsNone(self.registry.get('lbaas_pool').parent)
+        self.assertIn(info, self.registry.children('lbaas_pool'))
+
+    def test_with_resources(self):
+        fox = registry.ResourceInfo('fox', 'foxes', '/foxes', '/foxes/%s',
+                                    filters=['name'])
+        cub = registry.ResourceInfo('cub', collection_path='/foxes/%s/cubs')
+        extended = self.registry.with_resources([fox, cub])
+        self.assertNotIn('fox', self.registry)
+        self.assertEqual('foxes', extended.plural('fox'))
+        self.assertEqual(frozenset(['name']), extended.get('foxes').filters)
+        self.assertEqual('fox', extended.get('cubs').parent)
+        self.assertEqual(len(self.registry) + 2, len(extended))
+
+
+class TestPathMatcher(testtools.TestCase):
+
+    def setUp(self):
+        super(TestPathMatcher, self).setUp()
+        self.matcher = registry.PathMatcher.from_client(client.Client)
+
+    def test_collection_and_resource_paths(self):
+        self.assertEqual('/ports', self.matcher.match('/ports'))
+        self.assertEqual('/ports/%s', self.matcher.match('/ports/p1'))
+        self.assertEqual('/ports/%s',
+                         self.matcher.match('/ports/p1?fields=id'))
+
+    def test_literal_segments_are_preferred(self):
+        matcher = registry.PathMatcher(['/routers/%s/%s',
+                                        '/routers/%s/add_router_interface'])
+        self.assertEqual('/routers/%s/add_router_interface',
+                         matcher.match('/routers/r1/add_router_interface'))
+        self.assertEqual('/routers/%s/%s',
+                         matcher.match('/routers/r1/other'))
+
+    def test_named_format_specifiers(self):
+        self.assertEqual(
+            client.Client.disassociate_pool_health_monitors_path,
+            self.matcher.match('/lb/pools/p1/health_monitors/h1'))
+
+    def test_unknown_path(self):
+        self.assertIsNone(self.matcher.match('/unknown/path/here/x'))
@@ -0,0 +1,85 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.common import retry
+
+
+def _error(status_code, retry_after=None):
+    exc = exceptions.NeutronClientException(status_code=status_code)
+    if retry_after is not None:
+        exc.response_headers = {'Retry-After': retry_after}
+    return exc
+
+
+class TestRetryPolicy(testtools.TestCase):
+
+    def test_exponential_backoff(self):
+        policy = retry.RetryPolicy(backoff=1, factor=2, max_backoff=5,
+                                   jitter=False)
+        self.assertEqual([1, 2, 4, 5],
+                         [policy.get_delay(n) for n in range(1, 5)])
+
+    def test_jitter(self):
+        policy = retry.RetryPolicy(backoff=1, factor=2)
+        for _i in range(20):
+            self.assertTrue(0 <= policy.get_delay(3) <= 4)
+
+    def test_retry_after(self):
+        policy = retry.RetryPolicy(backoff=1, jitter=False)
+        self.assertEqual(7, policy.get_delay(1, _error(503, '7')))
+        # A date in the past does not shorten the backoff
+        self.assertEqual(1, policy.get_delay(
+            1, _error(503, 'Wed, 21 Oct 2015 07:28:00 GMT')))
+
+    def test_retry_after_is_capped(self):
+        policy = retry.RetryPolicy(backoff=1, max_backoff=10, jitter=False)
+        self.assertEqual(10, policy.get_delay(1, _error(503, '3600')))
+        policy = retry.RetryPolicy(backoff=1, max_backoff=10, jitter=False,
+                                   max_retry_after=60)
+        self.assertEqual(60, policy.get_delay(1, _error(503, '3600')))
+        self.assertEqual(20, policy.get_delay(1, _error(503, '20')))
+
+    def test_retryable(self):
+        policy = retry.RetryPolicy()
+        self.assertTrue(policy.is_retryable(
+            exceptions.ConnectionFailed(reason='x')))
+        self.assertTrue(policy.is_retryable(_error(503)))
+        self.assertTrue(policy.is_retryable(_error(429)))
+        self.assertFalse(policy.is_retryable(_error(409)))
+        self.assertFalse(policy.is_retryable(ValueError()))
+
+    def test_state_stops_after_max_retries(self):
+        state = retry.RetryPolicy(max_retries=2, jitter=False).start()
+        self.assertIsNotNone(state.next_delay(_error(503)))
+        self.assertIsNotNone(state.next_delay(_error(503)))
+        self.assertIsNone(state.next_delay(_error(503)))
+        self.assertEqual(2, state.retries)
+
+    def test_state_stops_after_max_elapsed(self):
+        now = [0]
+        policy = retry.RetryPolicy(backoff=1, jitter=False, max_elapsed=2.5,
+                                   timer=lambda: now[0])
+        state = policy.start()
+        self.assertEqual(1, state.next_delay(_error(503)))
+        now[0] = 1
+        self.assertIsNone(state.next_delay(_error(503)))
+
+    def test_parse_retry_after(self):
+        self.assertEqual(3, retry.parse_retry_after('3'))
+        self.assertIsNone(retry.parse_retry_after('soon'))
+        self.assertIsNone(retry.parse_retry_after(None))
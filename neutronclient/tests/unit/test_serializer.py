@@ -0,0 +1,86 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from oslo_serialization import jsonutils
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.common import serializer
+
+
+class TestJSONCollectionStreamDeserializer(testtools.TestCase):
+
+    def _chunks(self, data, size):
+        return [data[i:i + size] for i in range(0, len(data), size)]
+
+    def test_decode_in_small_chunks(self):
+        links = [{'rel': 'next', 'href': 'http://test/v2.0/ports?marker=x'}]
+        body = {'ports_links': links,
+                'ports': [{'id': str(i), 'name': u'pért',
+                           'mtu': 1500, 'up': True} for i in range(20)],
+                'count': 20}
+        data = jsonutils.dump_as_bytes(body)
+        for size in (1, 2, 7, 64, len(data)):
+            decoder = serializer.JSONCollectionStreamDeserializer(
+                self._chunks(data, size), 'ports')
+            self.assertEqual(body['ports'], list(decoder))
+            self.assertEqual({'ports_links': links, 'count': 20},
+                             decoder.extra)
+
+    def test_decode_empty_collection(self):
+        decoder = serializer.JSONCollectionStreamDeserializer(
+            [b'{"ports": [] }'], 'ports')
+        self.assertEqual([], list(decoder))
+
+    def test_decode_truncated(self):
+        decoder = serializer.JSONCollectionStreamDeserializer(
+            [b'{"ports": [{"id": "a"}, {"id"'], 'ports')
+        self.assertRaises(exceptions.MalformedResponseBody, list, decoder)
+
+
+class TestSerializerEngines(testtools.TestCase):
+
+    def _test_round_trip(self, engine):
+        ser = serializer.get_serializer(engine)
+        body = {'network': {'name': u'nét', 'mtu': 1500, 'shared': False}}
+        data = ser.serialize(body)
+        self.assertIsInstance(data, str)
+        self.assertEqual(body, ser.deserialize(data)['body'])
+        self.assertEqual(body,
+                         ser.deserialize(data.encode('utf-8'))['body'])
+
+    def test_default_engine(self):
+        self._test_round_trip(None)
+
+    def test_stdlib_engine(self):
+        self._test_round_trip('stdlib')
+
+    def test_orjson_engine(self):
+        if not serializer.orjson:
+            self.skipTest('orjson is not installed')
+        self._test_round_trip('orjson')
+
+    def test_serializer_is_shared(self):
+        self.assertIs(serializer.get_serializer('stdlib'),
+                      serializer.get_serializer('stdlib'))
+
+    def test_unknown_engine(self):
+        self.assertRaises(exceptions.UnsupportedJSONEngine,
+                          serializer.get_serializer, 'nojson')
+
+    def test_malformed_body(self):
+        ser = serializer.get_serializer('stdlib')
+        self.assertRaises(exceptions.MalformedResponseBody,
+                          ser.deserialize, b'{"network": ')
@@ -0,0 +1,190 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import hashlib
+import json
+import os
+import stat
+import time
+
+import fixtures
+from requests_mock.contrib import fixture as mock_fixture
+import testtools
+
+from neutronclient import client
+from neutronclient.common import tokencache
+
+
+AUTH_URL = 'http://keystone.test:5000/v2.0'
+ENDPOINT_URL = 'http://neutron.test:9696'
+
+
+def _token_body(token, expires='2099-01-01T00:00:00Z'):
+    return {'access': {
+        'token': {'id': token, 'expires': expires,
+                  'tenant': {'id': 'project-id', 'name': 'project'}},
+        'user': {'id': 'user-id', 'name': 'user',
+                 'roles': [{'name': 'admin'}]},
+        'serviceCatalog': [{
+            'type': 'network', 'name': 'neutron',
+            'endpoints': [{'region': 'RegionOne',
+                           'publicURL': ENDPOINT_URL}]}]}}
+
+
+class TestTokenCache(testtools.TestCase):
+
+    def setUp(self):
+        super(TestTokenCache, self).setUp()
+        self.directory = self.useFixture(fixtures.TempDir()).path
+        self.cache = tokencache.TokenCache(
+            os.path.join(self.directory, 'tokens'), margin=10)
+
+    def test_set_and_get(self):
+        key = self.cache.key('a', 'b')
+        self.assertIsNone(self.cache.get(key))
+        self.cache.set(key, {'expires': time.time() + 60, 'token': 't'})
+        self.assertEqual('t', self.cache.get(key)['token'])
+        path = os.path.join(self.cache.directory, key + '.json')
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(path).st_mode))
+        self.assertEqual(0o700,
+                         stat.S_IMODE(os.stat(self.cache.directory).st_mode))
+
+    def test_expiring_entry_is_ignored(self):
+        key = self.cache.key('a')
+        self.cache.set(key, {'expires': time.time() + 5, 'token': 't'})
+        self.assertIsNone(self.cache.get(key))
+
+    def test_keys_depend_on_all_parts(self):
+        self.assertNotEqual(self.cache.key('a', 'b'),
+                            self.cache.key('a', 'c'))
+
+    def test_keys_do_not_disclose_the_parts(self):
+        key = self.cache.key('a', 'password')
+        data = json.dumps(('a', 'password')).encode('utf-8')
+        self.assertNotEqual(hashlib.sha256(data).hexdigest(), key)
+        other = tokencache.TokenCache(self.cache.directory)
+        self.assertEqual(key, other.key('a', 'password'))
+        elsewhere = tokencache.TokenCache(
+            os.path.join(self.directory, 'other'))
+        self.assertNotEqual(key, elsewhere.key('a', 'password'))
+        path = os.path.join(self.cache.directory, 'secret')
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(path).st_mode))
+
+    def test_directory_is_private_despite_umask(self):
+        umask = os.umask(0o277)
+        try:
+            self.cache.set(self.cache.key('a'),
+                           {'expires': time.time() + 60, 'token': 't'})
+        finally:
+            os.umask(umask)
+        self.assertEqual(0o700,
+                         stat.S_IMODE(os.stat(self.cache.directory).st_mode))
+
+    def test_directory_accessible_by_others_is_ignored(self):
+        key = self.cache.key('a')
+        self.cache.set(key, {'expires': time.time() + 60, 'token': 't'})
+        os.chmod(self.cache.directory, 0o755)
+        self.assertIsNone(self.cache.get(key))
+        self.cache.set(self.cache.key('b'),
+                       {'expires': time.time() + 60, 'token': 't'})
+        os.chmod(self.cache.directory, 0o700)
+        self.assertIsNone(self.cache.get(self.cache.key('b')))
+        self.assertEqual('t', self.cache.get(key)['token'])
+
+    def test_file_readable_by_others_is_ignored(self):
+        key = self.cache.key('a')
+        self.cache.set(key, {'expires': time.time() + 60, 'token': 't'})
+        os.chmod(os.path.join(self.cache.directory, key + '.json'), 0o644)
+        self.assertIsNone(self.cache.get(key))
+
+    def test_lock(self):
+        with self.cache.lock(self.cache.key('a')):
+            pass
+
+
+class TestHTTPClientTokenCache(testtools.TestCase):
+
+    def setUp(self):
+        super(TestHTTPClientTokenCache, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        directory = self.useFixture(fixtures.TempDir()).path
+        self.cache = tokencache.TokenCache(directory)
+        self.requests.post(AUTH_URL + '/tokens', [
+            {'json': _token_body('token-1')},
+            {'json': _token_body('token-2')}])
+        self.requests.get(ENDPOINT_URL + '/v2.0/ports', json={'ports': []})
+
+    def _client(self, **kwargs):
+        return client.HTTPClient(
+            username='user', password='secret', project_name='project',
+            auth_url=AUTH_URL, region_name='RegionOne',
+            token_cache=self.cache, **kwargs)
+
+    def _auth_requests(self):
+        return [r for r in self.requests.request_history
+                if r.url.endswith('/tokens')]
+
+    def test_token_is_reused_by_new_clients(self):
+        self._client().do_request('/v2.0/ports', 'GET')
+        http = self._client()
+        http.do_request('/v2.0/ports', 'GET')
+        self.assertEqual(1, len(self._auth_requests()))
+        self.assertEqual('token-1', http.auth_token)
+        self.assertEqual(ENDPOINT_URL, http.endpoint_url)
+        self.assertEqual(['admin'], http.get_auth_ref().role_names)
+        self.assertEqual('project-id', http.get_auth_info()['auth_tenant_id'])
+
+    def test_other_credentials_do_not_share_tokens(self):
+        self._client().do_request('/v2.0/ports', 'GET')
+        http = self._client()
+        http.password = 'other'
+        http.do_request('/v2.0/ports', 'GET')
+        self.assertEqual(2, len(self._auth_requests()))
+
+    def test_rejected_token_is_replaced(self):
+        self._client().do_request('/v2.0/ports', 'GET')
+        self.requests.get(ENDPOINT_URL + '/v2.0/ports', [
+            {'status_code': 401}, {'json': {'ports': []}}])
+        http = self._client()
+        http.do_request('/v2.0/ports', 'GET')
+        self.assertEqual('token-2', http.auth_token)
+        self.assertEqual('token-2',
+                         self.cache.get(http._token_cache_key())['token'])
+
+    def test_refreshed_token_replaces_cache_entry(self):
+        http = self._client()
+        http.do_request('/v2.0/ports', 'GET')
+        self.requests.get(ENDPOINT_URL + '/v2.0/ports', [
+            {'status_code': 401}, {'json': {'ports': []}}])
+        http.do_request('/v2.0/ports', 'GET')
+        self.assertEqual('token-2', http.auth_token)
+        entries = [name for name in os.listdir(self.cache.directory)
+                   if name.endswith('.json')]
+        self.assertEqual([http._token_cache_key() + '.json'], entries)
+        self.assertEqual('token-2',
+                         self.cache.get(http._token_cache_key())['token'])
+
+    def test_endpoint_of_user_token_is_cached(self):
+        self.requests.get(AUTH_URL + '/tokens/user-token/endpoints', json={
+            'endpoints': [{'type': 'network', 'region': 'RegionOne',
+                           'publicURL': ENDPOINT_URL}]})
+        for _i in range(2):
+            http = client.HTTPClient(token='user-token', auth_url=AUTH_URL,
+                                     region_name='RegionOne',
+                                     token_cache=self.cache)
+            http.do_request('/v2.0/ports', 'GET')
+        endpoint_requests = [r for r in self.requests.request_history
+                             if r.url.endswith('/endpoints')]
+        self.assertEqual(1, len(endpoint_requests))
@@ -20,6 +20,7 @@ from oslo_utils import netutils
 import testtools
 
 from neutronclient.common import exceptions
+from neutronclient.common import records
 from neutronclient.common import utils
 
 
@@ -148,6 +149,11 @@ class TestUtils(testtools.TestCase):
         act = utils.get_item_properties(item, fields, formatters=formatters)
         self.assertEqual(('test_name', 'test_id', 'test', 'pass'), act)
 
+    def test_get_mapping_item_properties(self):
+        item = records.RowList([{'name': 'test_name', 'id': 'test_id'}])[0]
+        actual = utils.get_item_properties(item, ('name', 'id'))
+        self.assertEqual(('test_name', 'test_id'), actual)
+
     def test_is_cidr(self):
         self.assertTrue(netutils.is_valid_cidr('10.10.10.0/24'))
         self.assertFalse(netutils.is_valid_cidr('10.10.10..0/24'))
@@ -0,0 +1,387 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+import asyncio
+import functools
+import logging
+
+from neutronclient._i18n import _
+from neutronclient import client
+from neutronclient.common import cache
+from neutronclient.common import exceptions
+from neutronclient.common import metrics
+from neutronclient.v2_0 import client as client_v2
+
+
+_logger = logging.getLogger(__name__)
+
+
+class _AsyncGeneratorWithMeta(client_v2._RequestIdMixin):
+    """Asynchronous iterator over the pages of a collection."""
+
+    def __init__(self, paginate_func, collection, path, **params):
+        self.paginate_func = paginate_func
+        self.collection = collection
+        self.path = path
+        self.params = params
+        self.generator = None
+        self._request_ids_setup()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.generator:
+            self.generator = self.paginate_func(self.collection, self.path,
+                                                **self.params)
+        page = await self.generator.__anext__()
+        self._append_request_ids(page.request_ids)
+        self._retries += page.retries
+        return page
+
+
+class AsyncClient(client_v2.Client):
+    """asyncio client for the OpenStack Neutron v2.0 API.
+
+    It exposes the methods of :class:`neutronclient.v2_0.client.Client`,
+    including the ones registered by client extensions, as coroutines
+    running on an aiohttp transport. A token and an endpoint, or a
+    keystoneauth session, must be given; the other arguments are the same
+    as for ``Client``, except ``rate_limiter`` which is not supported.
+    ``coalesce_requests`` shares the identical GET requests of concurrent
+    tasks.
+
+    ``list_*`` methods called with ``retrieve_all=False`` return an
+    asynchronous iterator over the pages of the collection.
+
+    Example::
+
+        from neutronclient.v2_0 import async_client
+
+        async with async_client.AsyncClient(session=sess) as neutron:
+            nets = await neutron.list_networks()
+            async for page in neutron.list_ports(retrieve_all=False):
+                ...
+    """
+
+    def __init__(self, **kwargs):
+        if kwargs.get('rate_limiter') is not None:
+            # Its limits block the calling thread, i.e. the event loop
+            raise exceptions.NeutronClientException(
+                message=_('The asyncio client does not support '
+                          'rate_limiter'))
+        super(AsyncClient, self).__init__(**kwargs)
+        if self._single_flight is not None:
+            self._single_flight = cache.AsyncSingleFlight()
+
+    def _construct_http_client(self, **kwargs):
+        return client.AsyncHTTPClient(**kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the connections of the underlying HTTP client."""
+        await self.httpclient.close()
+
+    async def do_request(self, method, action, body=None, headers=None,
+                         params=None):
+        path = action
+        timing = metrics.Timing('serialize')
+        resp = replybody = error = None
+        try:
+            action = self._build_action(action, params)
+
+            if body:
+                body = self.serialize(body)
+            headers, cached = self._conditional_headers(method, action, body,
+                                                        headers)
+
+            timing.phase('network')
+            resp, replybody = await self.httpclient.do_request(
+                action, method, body=body, headers=headers)
+            timing.phase('deserialize')
+            return self._handle_conditional_response(method, action, resp,
+                                                     replybody, cached)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if self._request_observers:
+                timing.stop()
+                self._notify_request(method, path, body, resp, replybody,
+                                     timing, error)
+
+    async def retry_request(self, method, action, body=None,
+                            headers=None, params=None):
+        """Call do_request with the default retry configuration.
+
+        Only idempotent requests should retry failed connection attempts.
+        :raises: ConnectionFailed if the maximum # of retries is exceeded
+        """
+        return await self._retry_call(self.do_request, method, action,
+                                      body=body, headers=headers,
+                                      params=params)
+
+    async def _retry_call(self, func, *args, **kwargs):
+        state = self._get_retry_policy().start()
+        while True:
+            retry_count = client_v2._retry_count.set(state.retries)
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                delay = state.next_delay(e)
+                if delay is None:
+                    error = self._retry_failed(state, e)
+                    if error is e:
+                        raise
+                    raise error
+                _logger.debug('Retrying request to Neutron service in '
+                              '%.2f seconds', delay)
+                await asyncio.sleep(delay)
+            else:
+                if isinstance(result, client_v2._RequestIdMixin):
+                    result._retries = state.retries
+                return result
+            finally:
+                client_v2._retry_count.reset(retry_count)
+
+    async def delete(self, action, body=None, headers=None, params=None):
+        try:
+            return await self.retry_request("DELETE", action, body=body,
+                                            headers=headers, params=params)
+        finally:
+            self._invalidate_caches(action)
+
+    async def get(self, action, body=None, headers=None, params=None):
+        if self._single_flight is None or body or headers:
+            return await self.retry_request("GET", action, body=body,
+                                            headers=headers, params=params)
+        result, shared = await self._single_flight.do(
+            self._coalescing_key(action, params), self.retry_request,
+            "GET", action, params=params)
+        return client_v2._copy_with_meta(result) if shared else result
+
+    async def post(self, action, body=None, headers=None, params=None):
+        # Do not retry POST requests to avoid the orphan objects problem.
+        try:
+            return await self.do_request("POST", action, body=body,
+                                         headers=headers, params=params)
+        finally:
+            self._invalidate_caches(action)
+
+    async def put(self, action, body=None, headers=None, params=None):
+        try:
+            return await self.retry_request("PUT", action, body=body,
+                                            headers=headers, params=params)
+        finally:
+            self._invalidate_caches(action)
+
+    def list(self, collection, path, retrieve_all=True, prefetch=0,
+             stream=False, compact=False, marker_len=None, filter_len=None,
+             **params):
+        """Fetch a collection, following pagination links.
+
+        With ``retrieve_all`` a coroutine returning the whole collection is
+        returned, otherwise an asynchronous iterator over its pages.
+        ``prefetch`` is accepted for compatibility with ``Client`` and
+        ignored; the response bodies are not streamed and ``stream`` is
+        rejected. ``compact`` stores the resources of a whole collection as
+        ``neutronclient.common.records.Row`` mappings. ``marker_len`` and
+        ``filter_len`` tune the splitting of long list filters like with
+        ``Client``.
+        """
+        if stream:
+            raise exceptions.NeutronClientException(
+                message=_('The asyncio client does not support streamed '
+                          'lists'))
+        split = self._split_list_params(path, params, marker_len,
+                                        filter_len)
+        list_chunk = None
+        if split:
+            list_chunk = functools.partial(self._list_chunk, collection,
+                                           path, compact, split[0],
+                                           marker_len=marker_len,
+                                           filter_len=filter_len)
+        if retrieve_all:
+            return self._list_all(collection, path, compact, split,
+                                  list_chunk, params)
+        if split:
+            paginate = functools.partial(self._chunked_pagination,
+                                         split[1], list_chunk)
+        else:
+            paginate = self._pagination
+        return _AsyncGeneratorWithMeta(paginate, collection, path, **params)
+
+    async def _list_chunk(self, collection, path, compact, key, chunk,
+                          params, marker_len=None, filter_len=None):
+        """List the resources matching one chunk of a split filter.
+
+        Like with ``Client`` the chunk is split in halves again if the URI
+        turns out to be too long.
+        """
+        try:
+            return await self.list(collection, path, True, 0, False,
+                                   compact, marker_len, filter_len,
+                                   **dict(params, **{key: chunk}))
+        except exceptions.RequestURITooLong as e:
+            halves = self._halve_chunk(chunk, e)
+        return self._merge_lists(
+            collection,
+            [await self._list_chunk(collection, path, compact, key, half,
+                                    params, marker_len, filter_len)
+             for half in halves],
+            compact)
+
+    async def _list_all(self, collection, path, compact, split, list_chunk,
+                        params):
+        if split:
+            # Fetch the chunks of a split filter concurrently.
+            semaphore = asyncio.Semaphore(self.max_workers)
+
+            async def _list_chunk(chunk):
+                async with semaphore:
+                    return await list_chunk(chunk, params)
+            results = await asyncio.gather(*[_list_chunk(chunk)
+                                             for chunk in split[1]])
+        else:
+            results = [r async for r in
+                       self._pagination(collection, path, **params)]
+        return self._merge_lists(collection, results, compact)
+
+    async def _pagination(self, collection, path, **params):
+        if params.get('page_reverse', False):
+            linkrel = 'previous'
+        else:
+            linkrel = 'next'
+        while params is not None:
+            res = await self.get(path, params=params)
+            yield res
+            params = self._next_page_params(res, collection, linkrel)
+
+    async def _chunked_pagination(self, chunks, list_chunk, collection,
+                                  path, **params):
+        for chunk in chunks:
+            yield await list_chunk(chunk, params)
+
+    async def _list_resources(self, cmd_resource, parent_id, **params):
+        obj_lister = getattr(
+            self, "list_%s" % self.get_resource_plural(cmd_resource))
+        if parent_id:
+            return await obj_lister(parent_id, **params)
+        return await obj_lister(**params)
+
+    async def find_resources(self, resource, names_or_ids, project_id=None,
+                             cmd_resource=None, parent_id=None, fields=None):
+        """Resolve several names or IDs of one resource type in bulk.
+
+        See :meth:`neutronclient.v2_0.client.ClientBase.find_resources`.
+        """
+        if not cmd_resource:
+            cmd_resource = resource
+        collection = self.get_resource_plural(resource)
+        if isinstance(fields, str):
+            fields = [fields]
+        found, pending, ids = self._start_lookup(
+            resource, names_or_ids, cmd_resource, parent_id, fields)
+        if ids:
+            data = await self._list_resources(
+                cmd_resource, parent_id,
+                **self._lookup_params('id', ids, project_id, fields))
+            self._match_ids(ids, data[collection], found)
+        names = [value for value in pending if value not in found]
+        ambiguous = []
+        if names:
+            data = await self._list_resources(
+                cmd_resource, parent_id,
+                **self._lookup_params('name', names, project_id, fields))
+            ambiguous = self._match_names(names, data[collection], found)
+        return self._finish_lookup(resource, pending, found, ambiguous)
+
+    async def verify_trusted_uuids(self):
+        """Check that the UUIDs trusted without a server call do exist.
+
+        :raises: NotFound listing the UUIDs which could not be found
+        """
+        missing = []
+        for (resource, cmd_resource, parent_id), ids in (
+                self._pop_trusted_uuids()):
+            data = await self._list_resources(cmd_resource, parent_id,
+                                              id=sorted(ids), fields='id')
+            missing.extend(self._missing_uuids(resource, ids, data))
+        self._raise_missing_uuids(missing)
+
+    async def find_resource_by_id(self, resource, resource_id,
+                                  cmd_resource=None, parent_id=None,
+                                  fields=None):
+        trusted = self._trust_uuid(resource, resource_id, cmd_resource,
+                                   parent_id, fields)
+        if trusted:
+            return trusted
+        collection = self.get_resource_plural(resource)
+        params = self._id_lookup_params(resource_id, fields)
+        if params is not None:
+            data = await self._list_resources(cmd_resource or resource,
+                                              parent_id, **params)
+            if data and data[collection]:
+                return data[collection][0]
+        raise self._not_found_error(resource, resource_id, 'id')
+
+    async def _find_resource_by_name(self, resource, name, project_id=None,
+                                     cmd_resource=None, parent_id=None,
+                                     fields=None):
+        data = await self._list_resources(
+            cmd_resource or resource, parent_id,
+            **self._name_lookup_params(name, project_id, fields))
+        return self._unique_match(resource, name, data)
+
+    async def find_resource(self, resource, name_or_id, project_id=None,
+                            cmd_resource=None, parent_id=None, fields=None):
+        trusted = self._trust_uuid(resource, name_or_id, cmd_resource,
+                                   parent_id, fields)
+        if trusted:
+            return trusted
+        if self._find_cache is None:
+            return await self._find_resource(resource, name_or_id,
+                                             project_id, cmd_resource,
+                                             parent_id, fields)
+        key = self._find_cache_key(resource, name_or_id, project_id,
+                                   cmd_resource, parent_id, fields)
+        cached = self._find_cache.get(key)
+        if cached is None:
+            info = await self._find_resource(resource, name_or_id,
+                                             project_id, cmd_resource,
+                                             parent_id, fields)
+            cached = self._cache_found(key, info, cmd_resource or resource,
+                                       parent_id)
+        return dict(cached[1])
+
+    async def _find_resource(self, resource, name_or_id, project_id=None,
+                             cmd_resource=None, parent_id=None, fields=None):
+        try:
+            return await self.find_resource_by_id(
+                resource, name_or_id, cmd_resource, parent_id, fields)
+        except exceptions.NotFound:
+            try:
+                return await self._find_resource_by_name(
+                    resource, name_or_id, project_id,
+                    cmd_resource, parent_id, fields)
+            except exceptions.NotFound:
+                raise self._not_found_error(resource, name_or_id,
+                                            'name_or_id')
@@ -16,11 +16,17 @@
 #    under the License.
 #
 
+from concurrent import futures
+import contextvars
+import copy
+import functools
 import inspect
-import itertools
 import logging
+import queue
 import re
+import threading
 import time
+import types
 import urllib.parse as urlparse
 
 import debtcollector.renames
@@ -29,10 +35,15 @@ import requests
 
 from neutronclient._i18n import _
 from neutronclient import client
+from neutronclient.common import cache
 from neutronclient.common import exceptions
 from neutronclient.common import extension as client_extension
+from neutronclient.common import metrics
+from neutronclient.common import records
+from neutronclient.common import retry
 from neutronclient.common import serializer
 from neutronclient.common import utils
+from neutronclient.v2_0 import registry
 
 
 _logger = logging.getLogger(__name__)
@@ -41,6 +52,12 @@ HEX_ELEM = '[0-9A-Fa-f]'
 UUID_PATTERN = '-'.join([HEX_ELEM + '{8}', HEX_ELEM + '{4}',
                          HEX_ELEM + '{4}', HEX_ELEM + '{4}',
                          HEX_ELEM + '{12}'])
+UUID_RE = re.compile(UUID_PATTERN)
+
+# Number of earlier attempts of the request being sent, reported to the
+# request observers.
+_retry_count = contextvars.ContextVar('neutronclient_retry_count',
+                                      default=0)
 
 
 def exception_handler_v20(status_code, error_content):
@@ -96,11 +113,17 @@ class _RequestIdMixin(object):
     """Wrapper class to expose x-openstack-request-id to the caller."""
     def _request_ids_setup(self):
         self._request_ids = []
+        self._retries = 0
 
     @property
     def request_ids(self):
         return self._request_ids
 
+    @property
+    def retries(self):
+        """Number of retries which were needed to get this result."""
+        return self._retries
+
     def _append_request_ids(self, resp):
         """Add request_ids as an attribute to the object
 
@@ -133,6 +156,16 @@ class _DictWithMeta(dict, _RequestIdMixin):
         self._append_request_ids(resp)
 
 
+def _copy_with_meta(result):
+    """Return a deep copy of a result shared by coalesced requests."""
+    if not isinstance(result, _DictWithMeta):
+        # Strings and tuples are immutable
+        return result
+    copied = _DictWithMeta(copy.deepcopy(dict(result)), result.request_ids)
+    copied._retries = result.retries
+    return copied
+
+
 class _TupleWithMeta(tuple, _RequestIdMixin):
     def __new__(cls, values, resp):
         return super(_TupleWithMeta, cls).__new__(cls, values)
@@ -179,12 +212,147 @@ class _GeneratorWithMeta(_RequestIdMixin):
         try:
             obj, req_id = next(self.generator)
             self._append_request_ids(req_id)
+            self._retries += getattr(obj, 'retries', 0)
         except StopIteration:
             raise StopIteration()
 
         return obj
 
 
+class _StreamGeneratorWithMeta(_GeneratorWithMeta):
+    """Generator yielding the resources of a collection one at a time."""
+
+    def _paginate(self):
+        for r in self.paginate_func(self.collection, self.path,
+                                    self._on_response, **self.params):
+            yield r, None
+
+    def _on_response(self, resp, retries=0):
+        """Record a response and the number of retries it needed."""
+        self._append_request_ids(resp)
+        self._retries += retries
+
+
+_registry_lock = threading.RLock()
+
+
+def _extension_method(verb, path, parent_resource, resource_plural=None):
+    """Return the function implementing a verb of a client extension."""
+    if verb == 'show':
+        if parent_resource:
+            def fn(self, obj, parent_id, **_params):
+                return self.show_ext(path % parent_id, obj, **_params)
+        else:
+            def fn(self, obj, **_params):
+                return self.show_ext(path, obj, **_params)
+    elif verb == 'list':
+        if parent_resource:
+            def fn(self, parent_id, retrieve_all=True, **_params):
+                return self.list_ext(resource_plural, path % parent_id,
+                                     retrieve_all, **_params)
+        else:
+            def fn(self, retrieve_all=True, **_params):
+                return self.list_ext(resource_plural, path, retrieve_all,
+                                     **_params)
+    elif verb == 'create':
+        if parent_resource:
+            def fn(self, parent_id, body=None):
+                return self.create_ext(path % parent_id, body)
+        else:
+            def fn(self, body=None):
+                return self.create_ext(path, body)
+    elif verb == 'delete':
+        if parent_resource:
+            def fn(self, obj, parent_id):
+                return self.delete_ext(path % parent_id, obj)
+        else:
+            def fn(self, obj):
+                return self.delete_ext(path, obj)
+    else:
+        if parent_resource:
+            def fn(self, obj, parent_id, body=None):
+                return self.update_ext(path % parent_id, obj, body)
+        else:
+            def fn(self, obj, body=None):
+                return self.update_ext(path, obj, body)
+    return fn
+
+
+def _get_module_extensions(module, version):
+    """Return the attributes and resources defined by an extension module."""
+    attrs = {}
+    resources = {}
+    filters = {}
+    classes = inspect.getmembers(module, inspect.isclass)
+    for cls_name, cls in classes:
+        if hasattr(cls, 'versions'):
+            if version not in cls.versions:
+                continue
+        parent_resource = getattr(cls, 'parent_resource', None)
+        if issubclass(cls, client_extension.ClientExtensionList):
+            attrs["list_%s" % cls.resource_plural] = _extension_method(
+                'list', cls.object_path, parent_resource, cls.resource_plural)
+            filters[cls.resource] = [
+                attr if isinstance(attr, str) else attr['name']
+                for attr in cls.filter_attrs]
+        elif issubclass(cls, client_extension.ClientExtensionCreate):
+            attrs["create_%s" % cls.resource] = _extension_method(
+                'create', cls.object_path, parent_resource)
+        elif issubclass(cls, client_extension.ClientExtensionUpdate):
+            attrs["update_%s" % cls.resource] = _extension_method(
+                'update', cls.resource_path, parent_resource)
+        elif issubclass(cls, client_extension.ClientExtensionDelete):
+            attrs["delete_%s" % cls.resource] = _extension_method(
+                'delete', cls.resource_path, parent_resource)
+        elif issubclass(cls, client_extension.ClientExtensionShow):
+            attrs["show_%s" % cls.resource] = _extension_method(
+                'show', cls.resource_path, parent_resource)
+        elif issubclass(cls, client_extension.NeutronClientExtension):
+            attrs["%s_path" % cls.resource_plural] = cls.object_path
+            attrs["%s_path" % cls.resource] = cls.resource_path
+            resources[cls.resource] = (cls.resource_plural, cls.object_path,
+                                       cls.resource_path, parent_resource)
+    return attrs, [
+        registry.ResourceInfo(singular, plural, collection_path,
+                              resource_path, parent,
+                              filters.get(singular, ()))
+        for singular, (plural, collection_path, resource_path, parent)
+        in resources.items()]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_extensions(version):
+    """Discover the client extensions once per process."""
+    attrs = {}
+    resources = []
+    for name, module in client_extension._discover_via_entry_points():
+        module_attrs, module_resources = _get_module_extensions(module,
+                                                                version)
+        attrs.update(module_attrs)
+        resources.extend(module_resources)
+    return attrs, tuple(resources)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_path_matcher(client_class):
+    return registry.PathMatcher.from_client(client_class)
+
+
+def _body_size(body):
+    if not body:
+        return 0
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    return len(body)
+
+
+def _with_plurals(plurals, resources):
+    """Return a copy of an EXTED_PLURALS dict including resources."""
+    plurals = dict(plurals)
+    plurals.update((info.plural, info.singular) for info in resources)
+    return plurals
+
+
 class ClientBase(object):
     """Client for the OpenStack Neutron v2.0 API.
 
@@ -223,11 +391,94 @@ class ClientBase(object):
     :param integer retries: How many times idempotent (GET, PUT, DELETE)
                             requests to Neutron server should be retried if
                             they fail (default: 0).
+    :param retry_policy: A neutronclient.common.retry.RetryPolicy deciding
+                         how idempotent requests are retried, with
+                         backoff, jitter and Retry-After support. Takes
+                         precedence over retries. (optional)
+    :param rate_limiter: A neutronclient.common.ratelimit.RateLimiter
+                         throttling the requests of all the threads using
+                         this client, with per-method token buckets and an
+                         adaptive concurrency limit. It may be shared by
+                         several clients. (optional)
+    :param token_cache: A neutronclient.common.tokencache.TokenCache, or
+                        True for one in the default directory, keeping the
+                        tokens and endpoints obtained from keystone on disk
+                        so that other clients and processes reuse them.
+                        Only used without a session. (optional)
+    :param integer token_refresh_margin: Number of seconds before its
+                                         expiry at which the token is
+                                         renewed, None to wait for it to
+                                         be rejected. Only used without a
+                                         session. (default: 30)
+    :param bool background_token_refresh: Renew the token from a timer
+                                          thread rather than before the
+                                          first request sent within
+                                          token_refresh_margin of its
+                                          expiry. (default: False)
     :param bool raise_errors: If True then exceptions caused by connection
                               failure are propagated to the caller.
                               (default: True)
     :param session: Keystone client auth session to use. (optional)
     :param auth: Keystone auth plugin to use. (optional)
+    :param integer pool_connections: Number of per-host connection pools to
+                                     keep when no session is used.
+                                     (optional)
+    :param integer pool_maxsize: Maximum number of connections kept alive
+                                 per host when no session is used. (optional)
+    :param float pool_idle_timeout: Seconds after which idle pooled
+                                    connections are dropped and reopened.
+                                    (optional)
+    :param transport: HTTP backend used when no session is given: a
+                      ``neutronclient.client.Transport`` instance, or the
+                      name of a built-in one, 'requests' (default) or
+                      'httpx' for HTTP/2. (optional)
+    :param string json_engine: JSON library used to encode requests and
+                               decode responses: 'jsonutils' (default),
+                               'stdlib', 'orjson' or 'ujson'. (optional)
+    :param float find_cache_ttl: Enable caching of name/ID resolutions done
+                                 by find_resource for the given number of
+                                 seconds. Entries are dropped when this
+                                 client writes to the resource type.
+                                 (default: None, caching disabled)
+    :param integer find_cache_size: Maximum number of cached resolutions,
+                                    least recently used ones are evicted
+                                    first. (default: 1024)
+    :param integer max_workers: Maximum number of concurrent requests used
+                                when a list call is split in several
+                                requests because of the URI length limit.
+                                (default: 4)
+    :param bool trust_uuids: When only the ID of a resource is requested
+                             from find_resource or find_resource_by_id and
+                             a syntactically valid UUID is given, return it
+                             without checking its existence on the server.
+                             (default: False)
+    :param bool verify_trusted_uuids: Record the UUIDs trusted without a
+                                      server call so that their existence
+                                      can be checked in batches later with
+                                      verify_trusted_uuids(). Only used with
+                                      trust_uuids. (default: False)
+    :param bool coalesce_requests: Share a single request between the
+                                   threads issuing identical GET requests
+                                   at the same time. Each caller gets its
+                                   own copy of the result. (default: False)
+    :param integer response_cache_size: Enable a cache of up to this many
+                                        single resource GET responses. They
+                                        are revalidated with If-None-Match
+                                        and reused when the server answers
+                                        304 Not Modified. Entries are
+                                        dropped when this client writes to
+                                        the resource. Neutron itself does
+                                        not support conditional GETs and
+                                        always sends the full response, so
+                                        this only saves transfers behind a
+                                        server or proxy which does; use
+                                        find_cache_ttl to save requests.
+                                        (default: None, caching disabled)
+    :param request_observers: Callables called after each request with a
+                              neutronclient.common.metrics.RequestEvent
+                              describing it: path template, status, sizes,
+                              timings, retries and request ID. See
+                              metrics.LatencyAggregator. (optional)
 
     Example::
 
@@ -239,12 +490,27 @@ class ClientBase(object):
 
         nets = neutron.list_networks()
         ...
+
+    A client may be shared by threads: requests do not modify the state of
+    the client, and only one thread authenticates when the token expires.
+    Increase pool_maxsize to the number of threads to keep a connection
+    per thread.
     """
 
     # API has no way to report plurals, so we have to hard code them
     # This variable should be overridden by a child class.
     EXTED_PLURALS = {}
 
+    # Size of the chunks read from the response body in streaming mode
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    # Length of a marker in pagination
+    # &marker=<uuid> (with len(uuid)=36)
+    MARKER_LEN = 44
+
+    # Query parameters whose values are never split across requests
+    UNSPLITTABLE_PARAMS = ('fields', 'sort_key', 'sort_dir')
+
     @debtcollector.renames.renamed_kwarg(
         'tenant_id', 'project_id', replace=True)
     def __init__(self, **kwargs):
@@ -254,12 +520,57 @@ class ClientBase(object):
                         "deprecated in favor of OpenstackSDK, please use "
                         "that as this will be removed in a future release.")
         self.retries = kwargs.pop('retries', 0)
+        self.retry_policy = kwargs.pop('retry_policy', None)
+        self.rate_limiter = kwargs.pop('rate_limiter', None)
         self.raise_errors = kwargs.pop('raise_errors', True)
-        self.httpclient = client.construct_http_client(**kwargs)
+        self._serializer = serializer.get_serializer(
+            kwargs.pop('json_engine', None))
+        find_cache_ttl = kwargs.pop('find_cache_ttl', None)
+        find_cache_size = kwargs.pop('find_cache_size', 1024)
+        self._find_cache = None
+        if find_cache_ttl:
+            self._find_cache = cache.TTLCache(maxsize=find_cache_size,
+                                              ttl=find_cache_ttl)
+        self.max_workers = kwargs.pop('max_workers', 4)
+        self.trust_uuids = kwargs.pop('trust_uuids', False)
+        self._verify_trusted = kwargs.pop('verify_trusted_uuids', False)
+        self._trusted_uuids = set()
+        self._trusted_uuids_lock = threading.Lock()
+        self._single_flight = None
+        if kwargs.pop('coalesce_requests', False):
+            self._single_flight = cache.SingleFlight()
+        response_cache_size = kwargs.pop('response_cache_size', None)
+        self._response_cache = None
+        if response_cache_size:
+            # Entries are revalidated on every use, they never expire
+            self._response_cache = cache.TTLCache(
+                maxsize=response_cache_size, ttl=None)
+        self._request_observers = tuple(
+            kwargs.pop('request_observers', None) or ())
+        self._observers_lock = threading.Lock()
+        self.httpclient = self._construct_http_client(**kwargs)
         self.version = '2.0'
         self.action_prefix = "/v%s" % (self.version)
         self.retry_interval = 1
 
+    def _construct_http_client(self, **kwargs):
+        return client.construct_http_client(**kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Release the connections held by the underlying HTTP client.
+
+        Session based clients share the connection pool of their keystoneauth
+        session, which is left untouched.
+        """
+        if isinstance(self.httpclient, client.HTTPClient):
+            self.httpclient.close()
+
     def _handle_fault_response(self, status_code, response_body, resp):
         # Create exception with HTTP status code and message
         _logger.debug("Error message: %s", response_body)
@@ -272,26 +583,172 @@ class ClientBase(object):
             des_error_body = {'message': response_body}
         error_body = self._convert_into_with_meta(des_error_body, resp)
         # Raise the appropriate exception
-        exception_handler_v20(status_code, error_body)
+        try:
+            exception_handler_v20(status_code, error_body)
+        except exceptions.NeutronClientException as e:
+            # Keep the headers around for the retry policy (Retry-After)
+            e.response_headers = getattr(resp, 'headers', None)
+            raise
 
-    def do_request(self, method, action, body=None, headers=None, params=None):
-        # Add format and project_id
+    def _build_action(self, action, params=None):
         action = self.action_prefix + action
         if isinstance(params, dict) and params:
             params = utils.safe_encode_dict(params)
             action += '?' + urlparse.urlencode(params, doseq=1)
+        return action
 
-        if body:
-            body = self.serialize(body)
+    def do_request(self, method, action, body=None, headers=None, params=None):
+        path = action
+        timing = metrics.Timing('serialize')
+        resp = replybody = error = None
+        try:
+            # Add format and project_id
+            action = self._build_action(action, params)
+
+            if body:
+                body = self.serialize(body)
+            headers, cached = self._conditional_headers(method, action, body,
+                                                        headers)
+
+            resp, replybody = self._send_request(method, action, timing,
+                                                 body=body, headers=headers)
+            timing.phase('deserialize')
+            return self._handle_conditional_response(method, action, resp,
+                                                     replybody, cached)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if self._request_observers:
+                timing.stop()
+                self._notify_request(method, path, body, resp, replybody,
+                                     timing, error)
+
+    def _send_request(self, method, action, timing, **kwargs):
+        """Send a request through the rate limiter, if any."""
+        if self.rate_limiter is None:
+            timing.phase('network')
+            return self.httpclient.do_request(action, method, **kwargs)
+        timing.phase('throttle')
+        with self.rate_limiter.limit(method) as outcome:
+            timing.phase('network')
+            resp, replybody = self.httpclient.do_request(action, method,
+                                                         **kwargs)
+            outcome.record(resp.status_code)
+        return resp, replybody
+
+    def add_request_observer(self, observer):
+        """Call observer with a RequestEvent after each request.
+
+        The observer is a callable taking a
+        ``neutronclient.common.metrics.RequestEvent``, called by the thread
+        which sent the request, e.g. a ``metrics.LatencyAggregator``.
+        """
+        with self._observers_lock:
+            self._request_observers += (observer,)
+
+    def remove_request_observer(self, observer):
+        with self._observers_lock:
+            self._request_observers = tuple(
+                o for o in self._request_observers if o != observer)
+
+    def get_path_template(self, path):
+        """Return the ``*_path`` attribute a path was built from, or None."""
+        matcher = self.__dict__.get('_path_matcher')
+        if matcher is None:
+            matcher = _get_path_matcher(type(self))
+        return matcher.match(path)
+
+    def _notify_request(self, method, path, body, resp, replybody, timing,
+                        error, stream=False):
+        status_code = request_id = response_bytes = None
+        if resp is not None:
+            status_code = resp.status_code
+            request_id = resp.headers.get('x-openstack-request-id')
+            if not stream:
+                content = getattr(resp, 'content', None)
+                response_bytes = _body_size(
+                    content if isinstance(content, bytes) else replybody)
+            elif replybody is not None:
+                response_bytes = _body_size(replybody)
+        path = path.partition('?')[0]
+        event = metrics.RequestEvent(
+            method=method, path_template=self.get_path_template(path),
+            path=path, status_code=status_code,
+            request_bytes=_body_size(body), response_bytes=response_bytes,
+            serialize_time=timing.get('serialize'),
+            throttle_time=timing.get('throttle'),
+            network_time=timing.get('network'),
+            deserialize_time=timing.get('deserialize'),
+            retries=_retry_count.get(), request_id=request_id, error=error)
+        for observer in self._request_observers:
+            try:
+                observer(event)
+            except Exception:
+                _logger.warning('Request observer %s failed', observer,
+                                exc_info=True)
 
-        resp, replybody = self.httpclient.do_request(action, method, body=body,
-                                                     headers=headers)
+    def _conditional_headers(self, method, action, body, headers):
+        """Return the request headers and the cached response of action.
 
+        A cached response is revalidated with an If-None-Match header.
+        """
+        if (self._response_cache is None or method != 'GET' or body or
+                (headers and 'If-None-Match' in headers)):
+            return headers, None
+        cached = self._response_cache.get(action)
+        if cached is None:
+            return headers, None
+        headers = dict(headers or {})
+        headers['If-None-Match'] = cached[1]
+        return headers, cached
+
+    def _handle_conditional_response(self, method, action, resp, replybody,
+                                     cached):
+        if (cached is not None and
+                resp.status_code == requests.codes.not_modified):
+            return _DictWithMeta(copy.deepcopy(cached[2]), resp)
+        result = self._handle_response(action, resp, replybody)
+        if self._response_cache is not None and method == 'GET':
+            validator = self._get_validator(resp, result)
+            if validator is not None:
+                self._response_cache.set(
+                    action, (action.partition('?')[0], validator,
+                             copy.deepcopy(dict(result))))
+            elif cached is not None:
+                self._response_cache.pop(action)
+        return result
+
+    @staticmethod
+    def _get_validator(resp, result):
+        """Return the entity tag of a single resource response, or None."""
+        if not isinstance(result, dict) or len(result) != 1:
+            return None
+        resource = next(iter(result.values()))
+        if not isinstance(resource, dict):
+            return None
+        etag = getattr(resp, 'headers', {}).get('ETag')
+        if etag:
+            return etag
+        # Neutron ignores If-None-Match, this is the syntax of its If-Match
+        # support for the servers honouring conditional GETs on revisions.
+        if resource.get('revision_number') is not None:
+            return 'revision_number=%s' % resource['revision_number']
+        return None
+
+    def _handle_response(self, action, resp, replybody):
+        """Deserialize a successful response or raise the mapped error."""
         status_code = resp.status_code
         if status_code in (requests.codes.ok,
                            requests.codes.created,
                            requests.codes.accepted,
                            requests.codes.no_content):
+            if self._trusted_uuids:
+                self._confirm_trusted_uuids(action)
+            # Decode straight from the raw bytes when they are available.
+            content = getattr(resp, 'content', None)
+            if isinstance(content, bytes):
+                replybody = content
             data = self.deserialize(replybody, status_code)
             return self._convert_into_with_meta(data, resp)
         else:
@@ -311,7 +768,7 @@ class ClientBase(object):
         if data is None:
             return None
         elif isinstance(data, dict):
-            return serializer.Serializer().serialize(data)
+            return self._serializer.serialize(data)
         else:
             raise Exception(_("Unable to serialize object of type = '%s'") %
                             type(data))
@@ -320,8 +777,38 @@ class ClientBase(object):
         """Deserializes a JSON string into a dictionary."""
         if not data:
             return data
-        return serializer.Serializer().deserialize(
-            data)['body']
+        return self._serializer.deserialize(data)['body']
+
+    def do_stream_request(self, action, params=None):
+        """Issue a GET request without reading the response body.
+
+        The returned response must be consumed with ``iter_content`` and
+        closed by the caller. The request observers are notified once the
+        headers are received, without the size of the body.
+        """
+        path = action
+        timing = metrics.Timing('serialize')
+        resp = replybody = error = None
+        try:
+            action = self._build_action(action, params)
+            resp, _body = self._send_request('GET', action, timing,
+                                             stream=True)
+            if resp.status_code != requests.codes.ok:
+                try:
+                    replybody = resp.text or resp.reason
+                finally:
+                    resp.close()
+                self._handle_fault_response(resp.status_code, replybody,
+                                            resp)
+            return resp
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if self._request_observers:
+                timing.stop()
+                self._notify_request('GET', path, None, resp, replybody,
+                                     timing, error, stream=True)
 
     def retry_request(self, method, action, body=None,
                       headers=None, params=None):
@@ -330,75 +817,359 @@ class ClientBase(object):
         Only idempotent requests should retry failed connection attempts.
         :raises: ConnectionFailed if the maximum # of retries is exceeded
         """
-        max_attempts = self.retries + 1
-        for i in range(max_attempts):
-            try:
-                return self.do_request(method, action, body=body,
-                                       headers=headers, params=params)
-            except (exceptions.ConnectionFailed, ksa_exc.ConnectionError):
-                # Exception has already been logged by do_request()
-                if i < self.retries:
-                    _logger.debug('Retrying connection to Neutron service')
-                    time.sleep(self.retry_interval)
-                elif self.raise_errors:
-                    raise
-
-        if self.retries:
+        return self._retry_call(self.do_request, method, action, body=body,
+                                headers=headers, params=params)
+
+    def _get_retry_policy(self):
+        if self.retry_policy is not None:
+            return self.retry_policy
+        return retry.RetryPolicy.fixed(self.retries, self.retry_interval)
+
+    def _retry_failed(self, state, exc):
+        """Return the exception to raise once retrying gave up."""
+        if self.raise_errors or not isinstance(
+                exc, (exceptions.ConnectionFailed, ksa_exc.ConnectionError)):
+            return exc
+        if state.retries:
             msg = (_("Failed to connect to Neutron server after %d attempts")
-                   % max_attempts)
+                   % (state.retries + 1))
         else:
             msg = _("Failed to connect Neutron server")
+        return exceptions.ConnectionFailed(reason=msg)
 
-        raise exceptions.ConnectionFailed(reason=msg)
+    def _retry_call(self, func, *args, **kwargs):
+        state = self._get_retry_policy().start()
+        while True:
+            retry_count = _retry_count.set(state.retries)
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                delay = state.next_delay(e)
+                if delay is None:
+                    error = self._retry_failed(state, e)
+                    if error is e:
+                        raise
+                    raise error
+                # Exception has already been logged by do_request()
+                _logger.debug('Retrying request to Neutron service in '
+                              '%.2f seconds', delay)
+                time.sleep(delay)
+            else:
+                if isinstance(result, _RequestIdMixin):
+                    result._retries = state.retries
+                return result
+            finally:
+                _retry_count.reset(retry_count)
+
+    def _invalidate_caches(self, action):
+        """Drop cached data made stale by a write to ``action``."""
+        if self._find_cache is not None:
+            def _is_stale(key, value):
+                path = value[0]
+                return (path is None or action == path or
+                        action.startswith(path + '/'))
+            self._find_cache.invalidate(_is_stale)
+        if self._response_cache is not None:
+            written = self.action_prefix + action.partition('?')[0]
+
+            def _is_stale_response(key, value):
+                path = value[0]
+                return (path == written or
+                        path.startswith(written + '/') or
+                        written.startswith(path + '/'))
+            self._response_cache.invalidate(_is_stale_response)
 
     def delete(self, action, body=None, headers=None, params=None):
-        return self.retry_request("DELETE", action, body=body,
-                                  headers=headers, params=params)
+        try:
+            return self.retry_request("DELETE", action, body=body,
+                                      headers=headers, params=params)
+        finally:
+            self._invalidate_caches(action)
 
     def get(self, action, body=None, headers=None, params=None):
-        return self.retry_request("GET", action, body=body,
-                                  headers=headers, params=params)
+        if self._single_flight is None or body or headers:
+            return self.retry_request("GET", action, body=body,
+                                      headers=headers, params=params)
+        result, shared = self._single_flight.do(
+            self._coalescing_key(action, params), self.retry_request,
+            "GET", action, params=params)
+        return _copy_with_meta(result) if shared else result
+
+    @staticmethod
+    def _coalescing_key(action, params):
+        items = []
+        for key, value in sorted((params or {}).items()):
+            if isinstance(value, (list, tuple, set)):
+                # The order of the sort parameters is meaningful
+                if key in ('sort_key', 'sort_dir'):
+                    value = tuple(value)
+                else:
+                    value = tuple(sorted(value, key=str))
+            items.append((key, value))
+        return action, tuple(items)
 
     def post(self, action, body=None, headers=None, params=None):
         # Do not retry POST requests to avoid the orphan objects problem.
-        return self.do_request("POST", action, body=body,
-                               headers=headers, params=params)
+        try:
+            return self.do_request("POST", action, body=body,
+                                   headers=headers, params=params)
+        finally:
+            self._invalidate_caches(action)
 
     def put(self, action, body=None, headers=None, params=None):
-        return self.retry_request("PUT", action, body=body,
-                                  headers=headers, params=params)
-
-    def list(self, collection, path, retrieve_all=True, **params):
+        try:
+            return self.retry_request("PUT", action, body=body,
+                                      headers=headers, params=params)
+        finally:
+            self._invalidate_caches(action)
+
+    def list(self, collection, path, retrieve_all=True, prefetch=0,
+             stream=False, compact=False, marker_len=None, filter_len=None,
+             **params):
+        """Fetch a collection, following pagination links.
+
+        :param prefetch: when set to a positive number, up to that many pages
+                         are fetched ahead of the consumer by a background
+                         thread. Page order is preserved.
+        :param stream: decode the response bodies incrementally. Combined
+                       with ``retrieve_all=False`` the returned generator
+                       yields the resources one at a time instead of pages,
+                       keeping memory usage bounded for huge collections.
+        :param compact: with ``retrieve_all``, store the resources as
+                        read-only ``neutronclient.common.records.Row``
+                        mappings sharing their keys, which takes a fraction
+                        of the memory of dicts.
+        :param marker_len: length kept free in the URI for the pagination
+                           marker when a long list filter is split,
+                           ``MARKER_LEN`` by default.
+        :param filter_len: minimum length counted for each value of a split
+                           list filter, e.g. 40 for ``id=<uuid>&``.
+        """
+        split = self._split_list_params(path, params, marker_len,
+                                        filter_len)
+        if split:
+            return self._chunked_list(collection, path, retrieve_all,
+                                      prefetch, stream, compact, split[0],
+                                      split[1], params, marker_len,
+                                      filter_len)
+        res = records.RowList() if compact else []
+        if stream:
+            if retrieve_all:
+                gen = _StreamGeneratorWithMeta(self._stream_pagination,
+                                               collection, path, **params)
+                res.extend(gen)
+                result = _DictWithMeta({collection: res}, gen.request_ids)
+                result._retries = gen.retries
+                return result
+            return _StreamGeneratorWithMeta(self._stream_pagination,
+                                            collection, path, **params)
+        if prefetch:
+            paginate = functools.partial(self._prefetch_pagination, prefetch)
+        else:
+            paginate = self._pagination
         if retrieve_all:
-            res = []
             request_ids = []
-            for r in self._pagination(collection, path, **params):
+            retries = 0
+            for r in paginate(collection, path, **params):
                 res.extend(r[collection])
                 request_ids.extend(r.request_ids)
-            return _DictWithMeta({collection: res}, request_ids)
+                retries += r.retries
+            result = _DictWithMeta({collection: res}, request_ids)
+            result._retries = retries
+            return result
         else:
-            return _GeneratorWithMeta(self._pagination, collection,
-                                      path, **params)
+            return _GeneratorWithMeta(paginate, collection, path, **params)
+
+    def _split_list_params(self, path, params, marker_len=None,
+                           filter_len=None):
+        """Split the longest list filter if the URI would be too long.
+
+        See list() for marker_len and filter_len.
+
+        :returns: None if the request fits MAX_URI_LEN, or a tuple of the
+                  name of the split filter and the chunks of its values.
+        """
+        candidates = [(len(urlparse.urlencode({key: value}, doseq=1)), key)
+                      for key, value in params.items()
+                      if (isinstance(value, (list, tuple)) and
+                          len(value) > 1 and
+                          key not in self.UNSPLITTABLE_PARAMS)]
+        if not candidates:
+            return None
+        key = max(candidates)[1]
+        chunks = self._split_filter_values(path, key, params[key], params,
+                                           marker_len, filter_len)
+        if len(chunks) < 2:
+            return None
+        return key, chunks
+
+    def _list_chunk(self, collection, path, prefetch, stream, compact, key,
+                    chunk, params, marker_len=None, filter_len=None):
+        """List the resources matching one chunk of a split filter.
+
+        The chunk is split in halves again if the URI turns out to be too
+        long, e.g. when the endpoint URL was not known yet.
+        """
+        try:
+            return self.list(collection, path, True, prefetch, stream,
+                             compact, marker_len, filter_len,
+                             **dict(params, **{key: chunk}))
+        except exceptions.RequestURITooLong as e:
+            halves = self._halve_chunk(chunk, e)
+        return self._merge_lists(
+            collection,
+            [self._list_chunk(collection, path, prefetch, stream, compact,
+                              key, half, params, marker_len, filter_len)
+             for half in halves],
+            compact)
+
+    @staticmethod
+    def _halve_chunk(chunk, error):
+        """Return the halves of a chunk whose URI was too long.
+
+        error, the RequestURITooLong raised for the chunk, is raised again
+        when the chunk holds a single value.
+        """
+        if len(chunk) < 2:
+            raise error
+        half = len(chunk) // 2
+        return chunk[:half], chunk[half:]
+
+    @staticmethod
+    def _merge_lists(collection, results, compact=False):
+        """Merge the lists of the chunks of a split filter, in order."""
+        res = records.RowList() if compact else []
+        request_ids = []
+        for r in results:
+            res.extend(r[collection])
+            request_ids.extend(r.request_ids)
+        result = _DictWithMeta({collection: res}, request_ids)
+        result._retries = sum(r.retries for r in results)
+        return result
+
+    def _chunked_list(self, collection, path, retrieve_all, prefetch, stream,
+                      compact, key, chunks, params, marker_len=None,
+                      filter_len=None):
+        """Issue one list per chunk of filter values and merge the results.
+
+        With retrieve_all the chunks are fetched concurrently by up to
+        max_workers threads, otherwise they are iterated one after the
+        other. Results are merged in chunk order, so a requested sort order
+        only holds within each chunk.
+        """
+        list_chunk = functools.partial(self._list_chunk, collection, path,
+                                       prefetch, stream, compact, key,
+                                       marker_len=marker_len,
+                                       filter_len=filter_len)
+        if not retrieve_all:
+            if stream:
+                def _stream(collection, path, on_response, **params):
+                    for chunk in chunks:
+                        r = list_chunk(chunk, params)
+                        on_response(r.request_ids, r.retries)
+                        for item in r[collection]:
+                            yield item
+                return _StreamGeneratorWithMeta(_stream, collection, path,
+                                                **params)
+
+            def _paginate(collection, path, **params):
+                for chunk in chunks:
+                    yield list_chunk(chunk, params)
+            return _GeneratorWithMeta(_paginate, collection, path, **params)
+        with futures.ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(chunks))) as executor:
+            results = list(executor.map(
+                lambda chunk: list_chunk(chunk, params), chunks))
+        return self._merge_lists(collection, results, compact)
+
+    def _next_page_params(self, res, collection, linkrel):
+        """Return the query parameters of the next page or None."""
+        try:
+            for link in res['%s_links' % collection]:
+                if link['rel'] == linkrel:
+                    query_str = urlparse.urlparse(link['href']).query
+                    return urlparse.parse_qs(query_str)
+        except KeyError:
+            pass
+        return None
 
     def _pagination(self, collection, path, **params):
         if params.get('page_reverse', False):
             linkrel = 'previous'
         else:
             linkrel = 'next'
-        next = True
-        while next:
+        while params is not None:
             res = self.get(path, params=params)
             yield res
-            next = False
+            params = self._next_page_params(res, collection, linkrel)
+
+    def _stream_pagination(self, collection, path, on_response, **params):
+        if params.get('page_reverse', False):
+            linkrel = 'previous'
+        else:
+            linkrel = 'next'
+        while params is not None:
+            attempts = []
+
+            def _request(params=params):
+                attempts.append(params)
+                return self.do_stream_request(path, params=params)
+            resp = self._retry_call(_request)
+            on_response(resp, len(attempts) - 1)
+            decoder = serializer.JSONCollectionStreamDeserializer(
+                resp.iter_content(self.STREAM_CHUNK_SIZE), collection)
             try:
-                for link in res['%s_links' % collection]:
-                    if link['rel'] == linkrel:
-                        query_str = urlparse.urlparse(link['href']).query
-                        params = urlparse.parse_qs(query_str)
-                        next = True
-                        break
-            except KeyError:
-                break
+                for item in decoder:
+                    yield item
+            finally:
+                resp.close()
+            params = self._next_page_params(decoder.extra, collection,
+                                            linkrel)
+
+    def _prefetch_pagination(self, prefetch, collection, path, **params):
+        """Paginate while fetching up to ``prefetch`` pages ahead.
+
+        Neutron uses marker based pagination, so the request for a page can
+        only be issued once the previous page, and therefore its last id, is
+        known. The next request is sent by a background thread as soon as a
+        page arrives, which overlaps the round trips with the processing done
+        by the consumer.
+        """
+        pages = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        end = object()
+
+        def _put(item):
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def _fetch():
+            try:
+                for page in self._pagination(collection, path, **params):
+                    if not _put((page, None)):
+                        return
+            except Exception as e:
+                _put((None, e))
+            else:
+                _put((end, None))
+
+        worker = threading.Thread(target=_fetch, daemon=True)
+        worker.start()
+        try:
+            while True:
+                page, exc = pages.get()
+                if exc is not None:
+                    raise exc
+                if page is end:
+                    return
+                yield page
+        finally:
+            stop.set()
 
     def _convert_into_with_meta(self, item, resp):
         if item:
@@ -409,72 +1180,371 @@ class ClientBase(object):
         else:
             return _TupleWithMeta((), resp)
 
+    @property
+    def resources(self):
+        """The neutronclient.v2_0.registry.ResourceRegistry of this client."""
+        resources = self.__dict__.get('_resources')
+        if resources is None:
+            resources = self._get_resource_registry()
+        return resources
+
+    @classmethod
+    def _get_resource_registry(cls):
+        resources = cls.__dict__.get('_resource_registry')
+        if resources is None:
+            with _registry_lock:
+                resources = cls.__dict__.get('_resource_registry')
+                if resources is None:
+                    resources = registry.ResourceRegistry.from_client_class(
+                        cls)
+                    cls._resource_registry = resources
+        return resources
+
     def get_resource_plural(self, resource):
-        for k in self.EXTED_PLURALS:
-            if self.EXTED_PLURALS[k] == resource:
-                return k
-        return resource + 's'
+        return self.resources.plural(resource)
 
-    def find_resource_by_id(self, resource, resource_id, cmd_resource=None,
-                            parent_id=None, fields=None):
+    def _trust_uuid(self, resource, resource_id, cmd_resource, parent_id,
+                    fields):
+        """Return ``{'id': resource_id}`` if the UUID can be trusted."""
+        if not self.trust_uuids or fields not in ('id', ['id'], ('id',)):
+            return None
+        if not UUID_RE.fullmatch(resource_id):
+            return None
+        # Neutron IDs are lower case UUIDs
+        resource_id = resource_id.lower()
+        if self._verify_trusted:
+            with self._trusted_uuids_lock:
+                self._trusted_uuids.add((resource, cmd_resource or resource,
+                                         parent_id, resource_id))
+        return {'id': resource_id}
+
+    def _split_filter_values(self, path, key, values, params,
+                             marker_len=None, filter_len=None):
+        """Split the values of a filter so each request fits MAX_URI_LEN.
+
+        :param path: path of the collection being listed
+        :param key: name of the filter, e.g. 'id'
+        :param values: list of values to filter on
+        :param params: the other query parameters of the request
+        :param marker_len: length kept for the pagination marker, MARKER_LEN
+                           if None
+        :param filter_len: minimum length of each key=value& filter
+        :returns: a list of chunks of values
+        """
+        if marker_len is None:
+            marker_len = self.MARKER_LEN
+        base = dict(params)
+        base.pop(key, None)
+        uri_len = (len(self.httpclient.endpoint_url or '') +
+                   len(self._build_action(path or '', base)) +
+                   len('?') + marker_len)
+        budget = client.MAX_URI_LEN - uri_len
+        chunks = []
+        chunk = []
+        chunk_len = 0
+        for value in values:
+            # key=value& once url-encoded
+            value_len = max(len(urlparse.urlencode({key: value})) + 1,
+                            filter_len or 0)
+            if chunk and chunk_len + value_len > budget:
+                chunks.append(chunk)
+                chunk = []
+                chunk_len = 0
+            chunk.append(value)
+            chunk_len += value_len
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _list_resources(self, cmd_resource, parent_id, **params):
+        obj_lister = getattr(
+            self, "list_%s" % self.get_resource_plural(cmd_resource))
+        if parent_id:
+            return obj_lister(parent_id, **params)
+        return obj_lister(**params)
+
+    # The helpers below hold the parts of the find_*() lookups which send
+    # no request, they are shared with the asyncio client.
+
+    def _start_lookup(self, resource, names_or_ids, cmd_resource, parent_id,
+                      fields):
+        """Split the values of a bulk lookup.
+
+        :returns: a tuple of the dict of the trusted values, the list of the
+                  distinct values and the list of the UUIDs to look up.
+        """
+        found = {}
+        pending = list(dict.fromkeys(names_or_ids))
+        ids = []
+        for value in pending:
+            trusted = self._trust_uuid(resource, value, cmd_resource,
+                                       parent_id, fields)
+            if trusted:
+                found[value] = trusted
+            elif UUID_RE.fullmatch(value):
+                ids.append(value)
+        return found, pending, ids
+
+    @staticmethod
+    def _lookup_params(key, values, project_id, fields):
+        """Return the query parameters of a bulk lookup by id or name."""
+        params = {}
+        if fields:
+            params['fields'] = sorted(set(fields) | set(['id', key]))
+        if key == 'name' and project_id:
+            params['tenant_id'] = project_id
+        if key == 'id':
+            values = list(dict.fromkeys(value.lower() for value in values))
+        params[key] = values
+        return params
+
+    @staticmethod
+    def _match_ids(ids, infos, found):
+        """Add the resources whose ID is one of ids to found.
+
+        The IDs are compared in lower case, the keys of found are the
+        given values.
+        """
+        by_id = dict((info['id'].lower(), info) for info in infos)
+        for value in ids:
+            info = by_id.get(value.lower())
+            if info is not None:
+                found[value] = info
+
+    @staticmethod
+    def _match_names(names, infos, found):
+        """Add the resources matching a single name to found.
+
+        :returns: the list of the names matching several resources.
+        """
+        matches = {}
+        for info in infos:
+            matches.setdefault(info['name'], []).append(info)
+        ambiguous = []
+        for name in names:
+            if len(matches.get(name, [])) > 1:
+                ambiguous.append(name)
+            elif name in matches:
+                found[name] = matches[name][0]
+        return ambiguous
+
+    @staticmethod
+    def _finish_lookup(resource, pending, found, ambiguous):
+        not_found = [value for value in pending
+                     if value not in found and value not in ambiguous]
+        if not_found or ambiguous:
+            raise exceptions.ResourceLookupError(resource,
+                                                 not_found=not_found,
+                                                 ambiguous=ambiguous,
+                                                 found=found)
+        return found
+
+    def find_resources(self, resource, names_or_ids, project_id=None,
+                       cmd_resource=None, parent_id=None, fields=None):
+        """Resolve several names or IDs of one resource type in bulk.
+
+        All the UUID-like values are looked up by a single list call
+        filtering on their IDs, then the remaining values by a single list
+        call filtering on names. A call is split only when its URI would
+        exceed MAX_URI_LEN.
+
+        :returns: a dict mapping each given name or ID to its resource
+        :raises: ResourceLookupError listing all the names or IDs which
+                 could not be found or matched several resources
+        """
         if not cmd_resource:
             cmd_resource = resource
-        cmd_resource_plural = self.get_resource_plural(cmd_resource)
-        resource_plural = self.get_resource_plural(resource)
-        # TODO(amotoki): Use show_%s instead of list_%s
-        obj_lister = getattr(self, "list_%s" % cmd_resource_plural)
-        # perform search by id only if we are passing a valid UUID
-        match = re.match(UUID_PATTERN, resource_id)
-        collection = resource_plural
-        if match:
-            params = {'id': resource_id}
-            if fields:
-                params['fields'] = fields
-            if parent_id:
-                data = obj_lister(parent_id, **params)
-            else:
-                data = obj_lister(**params)
-            if data and data[collection]:
-                return data[collection][0]
-        not_found_message = (_("Unable to find %(resource)s with id "
-                               "'%(id)s'") %
-                             {'resource': resource, 'id': resource_id})
+        collection = self.get_resource_plural(resource)
+        if isinstance(fields, str):
+            fields = [fields]
+        found, pending, ids = self._start_lookup(
+            resource, names_or_ids, cmd_resource, parent_id, fields)
+        if ids:
+            data = self._list_resources(
+                cmd_resource, parent_id,
+                **self._lookup_params('id', ids, project_id, fields))
+            self._match_ids(ids, data[collection], found)
+        names = [value for value in pending if value not in found]
+        ambiguous = []
+        if names:
+            data = self._list_resources(
+                cmd_resource, parent_id,
+                **self._lookup_params('name', names, project_id, fields))
+            ambiguous = self._match_names(names, data[collection], found)
+        return self._finish_lookup(resource, pending, found, ambiguous)
+
+    def _confirm_trusted_uuids(self, action):
+        """Forget the trusted UUIDs addressed by a successful request."""
+        segments = set(action.split('?', 1)[0].split('/'))
+        with self._trusted_uuids_lock:
+            self._trusted_uuids = set(entry for entry in self._trusted_uuids
+                                      if entry[3] not in segments)
+
+    def _pop_trusted_uuids(self):
+        """Return the pending trusted UUIDs grouped by resource and parent.
+
+        :returns: a sorted list of ``((resource, cmd_resource, parent_id),
+                  ids)`` tuples.
+        """
+        with self._trusted_uuids_lock:
+            pending = self._trusted_uuids
+            self._trusted_uuids = set()
+        groups = {}
+        for resource, cmd_resource, parent_id, resource_id in pending:
+            groups.setdefault((resource, cmd_resource, parent_id),
+                              set()).add(resource_id)
+        return sorted(groups.items(), key=lambda item: str(item[0]))
+
+    def _missing_uuids(self, resource, ids, data):
+        found = set(r['id'] for r in
+                    data[self.get_resource_plural(resource)])
+        return ['%s %s' % (resource, resource_id)
+                for resource_id in sorted(ids - found)]
+
+    @staticmethod
+    def _raise_missing_uuids(missing):
+        if missing:
+            not_found_message = (_("Unable to find %s") %
+                                 ", ".join(missing))
+            raise exceptions.NotFound(message=not_found_message)
+
+    def verify_trusted_uuids(self):
+        """Check that the UUIDs trusted without a server call do exist.
+
+        The pending UUIDs are checked with one list call per resource type
+        and parent.
+
+        :raises: NotFound listing the UUIDs which could not be found
+        """
+        missing = []
+        for (resource, cmd_resource, parent_id), ids in (
+                self._pop_trusted_uuids()):
+            data = self._list_resources(cmd_resource, parent_id,
+                                        id=sorted(ids), fields='id')
+            missing.extend(self._missing_uuids(resource, ids, data))
+        self._raise_missing_uuids(missing)
+
+    @staticmethod
+    def _not_found_error(resource, value, key):
+        """Return the NotFound error of a lookup by id, name or both."""
+        if key == 'id':
+            message = (_("Unable to find %(resource)s with id '%(id)s'") %
+                       {'resource': resource, 'id': value})
+        elif key == 'name':
+            message = (_("Unable to find %(resource)s with name "
+                         "'%(name)s'") %
+                       {'resource': resource, 'name': value})
+        else:
+            message = (_("Unable to find %(resource)s with name "
+                         "or id '%(name_or_id)s'") %
+                       {'resource': resource, 'name_or_id': value})
         # 404 is raised by exceptions.NotFound to simulate serverside behavior
-        raise exceptions.NotFound(message=not_found_message)
+        return exceptions.NotFound(message=message)
 
-    def _find_resource_by_name(self, resource, name, project_id=None,
-                               cmd_resource=None, parent_id=None, fields=None):
-        if not cmd_resource:
-            cmd_resource = resource
-        cmd_resource_plural = self.get_resource_plural(cmd_resource)
-        resource_plural = self.get_resource_plural(resource)
-        obj_lister = getattr(self, "list_%s" % cmd_resource_plural)
+    @staticmethod
+    def _id_lookup_params(resource_id, fields):
+        """Return the query parameters of a lookup by id, None if invalid."""
+        # perform search by id only if we are passing a valid UUID
+        if not UUID_RE.match(resource_id):
+            return None
+        params = {'id': resource_id}
+        if fields:
+            params['fields'] = fields
+        return params
+
+    @staticmethod
+    def _name_lookup_params(name, project_id, fields):
         params = {'name': name}
         if fields:
             params['fields'] = fields
         if project_id:
             params['tenant_id'] = project_id
-        if parent_id:
-            data = obj_lister(parent_id, **params)
-        else:
-            data = obj_lister(**params)
-        collection = resource_plural
-        info = data[collection]
+        return params
+
+    def _unique_match(self, resource, name, data):
+        info = data[self.get_resource_plural(resource)]
         if len(info) > 1:
             raise exceptions.NeutronClientNoUniqueMatch(resource=resource,
                                                         name=name)
         elif len(info) == 0:
-            not_found_message = (_("Unable to find %(resource)s with name "
-                                   "'%(name)s'") %
-                                 {'resource': resource, 'name': name})
-            # 404 is raised by exceptions.NotFound
-            # to simulate serverside behavior
-            raise exceptions.NotFound(message=not_found_message)
+            raise self._not_found_error(resource, name, 'name')
         else:
             return info[0]
 
+    def find_resource_by_id(self, resource, resource_id, cmd_resource=None,
+                            parent_id=None, fields=None):
+        trusted = self._trust_uuid(resource, resource_id, cmd_resource,
+                                   parent_id, fields)
+        if trusted:
+            return trusted
+        collection = self.get_resource_plural(resource)
+        params = self._id_lookup_params(resource_id, fields)
+        if params is not None:
+            # TODO(amotoki): Use show_%s instead of list_%s
+            data = self._list_resources(cmd_resource or resource, parent_id,
+                                        **params)
+            if data and data[collection]:
+                return data[collection][0]
+        raise self._not_found_error(resource, resource_id, 'id')
+
+    def _find_resource_by_name(self, resource, name, project_id=None,
+                               cmd_resource=None, parent_id=None, fields=None):
+        data = self._list_resources(
+            cmd_resource or resource, parent_id,
+            **self._name_lookup_params(name, project_id, fields))
+        return self._unique_match(resource, name, data)
+
+    def _get_collection_path(self, cmd_resource, parent_id=None):
+        """Return the collection path of a resource, None if unknown."""
+        info = self.resources.get(cmd_resource)
+        if info is not None and info.collection_path:
+            path = info.collection_path
+        else:
+            path = getattr(self, '%s_path' % self.get_resource_plural(
+                cmd_resource), None)
+        if not isinstance(path, str):
+            return None
+        if parent_id:
+            try:
+                path = path % parent_id
+            except TypeError:
+                return None
+        return path
+
+    @staticmethod
+    def _find_cache_key(resource, name_or_id, project_id, cmd_resource,
+                        parent_id, fields):
+        return (resource, name_or_id, project_id, cmd_resource, parent_id,
+                tuple(fields) if isinstance(fields, list) else fields)
+
+    def _cache_found(self, key, info, cmd_resource, parent_id):
+        """Cache a resource found by find_resource() and return the entry."""
+        path = self._get_collection_path(cmd_resource, parent_id)
+        cached = (path, info)
+        self._find_cache.set(key, cached)
+        return cached
+
     def find_resource(self, resource, name_or_id, project_id=None,
                       cmd_resource=None, parent_id=None, fields=None):
+        trusted = self._trust_uuid(resource, name_or_id, cmd_resource,
+                                   parent_id, fields)
+        if trusted:
+            return trusted
+        if self._find_cache is None:
+            return self._find_resource(resource, name_or_id, project_id,
+                                       cmd_resource, parent_id, fields)
+        key = self._find_cache_key(resource, name_or_id, project_id,
+                                   cmd_resource, parent_id, fields)
+        cached = self._find_cache.get(key)
+        if cached is None:
+            info = self._find_resource(resource, name_or_id, project_id,
+                                       cmd_resource, parent_id, fields)
+            cached = self._cache_found(key, info, cmd_resource or resource,
+                                       parent_id)
+        return dict(cached[1])
+
+    def _find_resource(self, resource, name_or_id, project_id=None,
+                       cmd_resource=None, parent_id=None, fields=None):
         try:
             return self.find_resource_by_id(resource, name_or_id,
                                             cmd_resource, parent_id, fields)
@@ -484,12 +1554,8 @@ class ClientBase(object):
                     resource, name_or_id, project_id,
                     cmd_resource, parent_id, fields)
             except exceptions.NotFound:
-                not_found_message = (_("Unable to find %(resource)s with name "
-                                       "or id '%(name_or_id)s'") %
-                                     {'resource': resource,
-                                      'name_or_id': name_or_id})
-                raise exceptions.NotFound(
-                    message=not_found_message)
+                raise self._not_found_error(resource, name_or_id,
+                                            'name_or_id')
 
 
 class Client(ClientBase):
@@ -2551,81 +3617,62 @@ class Client(ClientBase):
         return self.put(path, **kwargs)
 
     def extend_show(self, resource_singular, path, parent_resource):
-        def _fx(obj, **_params):
-            return self.show_ext(path, obj, **_params)
-
-        def _parent_fx(obj, parent_id, **_params):
-            return self.show_ext(path % parent_id, obj, **_params)
-        fn = _fx if not parent_resource else _parent_fx
-        setattr(self, "show_%s" % resource_singular, fn)
+        self._extend(_extension_method('show', path, parent_resource),
+                     "show_%s" % resource_singular)
 
     def extend_list(self, resource_plural, path, parent_resource):
-        def _fx(retrieve_all=True, **_params):
-            return self.list_ext(resource_plural, path,
-                                 retrieve_all, **_params)
-
-        def _parent_fx(parent_id, retrieve_all=True, **_params):
-            return self.list_ext(resource_plural, path % parent_id,
-                                 retrieve_all, **_params)
-        fn = _fx if not parent_resource else _parent_fx
-        setattr(self, "list_%s" % resource_plural, fn)
+        self._extend(_extension_method('list', path, parent_resource,
+                                       resource_plural),
+                     "list_%s" % resource_plural)
 
     def extend_create(self, resource_singular, path, parent_resource):
-        def _fx(body=None):
-            return self.create_ext(path, body)
-
-        def _parent_fx(parent_id, body=None):
-            return self.create_ext(path % parent_id, body)
-        fn = _fx if not parent_resource else _parent_fx
-        setattr(self, "create_%s" % resource_singular, fn)
+        self._extend(_extension_method('create', path, parent_resource),
+                     "create_%s" % resource_singular)
 
     def extend_delete(self, resource_singular, path, parent_resource):
-        def _fx(obj):
-            return self.delete_ext(path, obj)
-
-        def _parent_fx(obj, parent_id):
-            return self.delete_ext(path % parent_id, obj)
-        fn = _fx if not parent_resource else _parent_fx
-        setattr(self, "delete_%s" % resource_singular, fn)
+        self._extend(_extension_method('delete', path, parent_resource),
+                     "delete_%s" % resource_singular)
 
     def extend_update(self, resource_singular, path, parent_resource):
-        def _fx(obj, body=None):
-            return self.update_ext(path, obj, body)
+        self._extend(_extension_method('update', path, parent_resource),
+                     "update_%s" % resource_singular)
 
-        def _parent_fx(obj, parent_id, body=None):
-            return self.update_ext(path % parent_id, obj, body)
-        fn = _fx if not parent_resource else _parent_fx
-        setattr(self, "update_%s" % resource_singular, fn)
+    def _extend(self, function, name):
+        setattr(self, name, types.MethodType(function, self))
 
     def _extend_client_with_module(self, module, version):
-        classes = inspect.getmembers(module, inspect.isclass)
-        for cls_name, cls in classes:
-            if hasattr(cls, 'versions'):
-                if version not in cls.versions:
-                    continue
-            parent_resource = getattr(cls, 'parent_resource', None)
-            if issubclass(cls, client_extension.ClientExtensionList):
-                self.extend_list(cls.resource_plural, cls.object_path,
-                                 parent_resource)
-            elif issubclass(cls, client_extension.ClientExtensionCreate):
-                self.extend_create(cls.resource, cls.object_path,
-                                   parent_resource)
-            elif issubclass(cls, client_extension.ClientExtensionUpdate):
-                self.extend_update(cls.resource, cls.resource_path,
-                                   parent_resource)
-            elif issubclass(cls, client_extension.ClientExtensionDelete):
-                self.extend_delete(cls.resource, cls.resource_path,
-                                   parent_resource)
-            elif issubclass(cls, client_extension.ClientExtensionShow):
-                self.extend_show(cls.resource, cls.resource_path,
-                                 parent_resource)
-            elif issubclass(cls, client_extension.NeutronClientExtension):
-                setattr(self, "%s_path" % cls.resource_plural,
-                        cls.object_path)
-                setattr(self, "%s_path" % cls.resource, cls.resource_path)
-                self.EXTED_PLURALS.update({cls.resource_plural: cls.resource})
+        attrs, resources = _get_module_extensions(module, version)
+        for name, attr in attrs.items():
+            if callable(attr):
+                attr = types.MethodType(attr, self)
+            setattr(self, name, attr)
+        self._resources = self.resources.with_resources(resources)
+        # Replaced rather than updated, the class dict is shared
+        self.EXTED_PLURALS = _with_plurals(self.EXTED_PLURALS, resources)
+        self._path_matcher = registry.PathMatcher.from_client(self)
 
     def _register_extensions(self, version):
-        for name, module in itertools.chain(
-                client_extension._discover_via_entry_points()):
-            self._extend_client_with_module(module, version)
+        """Add the methods of the client extensions to the class.
+
+        The extensions are discovered once per process and class, the
+        clients created afterwards only check that it was done.
+        """
+        cls = type(self)
+        if version in cls.__dict__.get('_extension_versions', ()):
+            return
+        with _registry_lock:
+            registered = cls.__dict__.get('_extension_versions', frozenset())
+            if version in registered:
+                return
+            attrs, resources = _load_extensions(version)
+            for name, attr in attrs.items():
+                setattr(cls, name, attr)
+            _get_path_matcher.cache_clear()
+            if resources:
+                cls._resource_registry = (
+                    cls._get_resource_registry().with_resources(resources))
+                # Kept up to date for the code using it directly. It is
+                # replaced so that concurrent readers never see it change.
+                cls.EXTED_PLURALS = _with_plurals(cls.EXTED_PLURALS,
+                                                  resources)
+            cls._extension_versions = registered | {version}
@@ -0,0 +1,176 @@
+# Copyright 2026 OpenStack Foundation.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Metadata of the resources of the Neutron v2.0 API."""
+
+import collections
+
+
+class ResourceInfo(collections.namedtuple(
+        'ResourceInfo', ['singular', 'plural', 'collection_path',
+                         'resource_path', 'parent', 'filters'])):
+    """Description of a resource type.
+
+    :param singular: name of one resource, e.g. 'port'.
+    :param plural: name of the collection, e.g. 'ports'.
+    :param collection_path: path template of the collection, None if
+                            unknown. It has one %s per parent resource.
+    :param resource_path: path template of one resource, None if unknown.
+    :param parent: singular name of the parent resource, or None.
+    :param filters: names of the filters declared for the collection. An
+                    empty set means that none were declared, not that
+                    filtering is unsupported.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, singular, plural=None, collection_path=None,
+                resource_path=None, parent=None, filters=()):
+        return super(ResourceInfo, cls).__new__(
+            cls, singular, plural or singular + 's', collection_path,
+            resource_path, parent, frozenset(filters))
+
+
+class ResourceRegistry(object):
+    """An immutable index of ResourceInfo by singular and plural names.
+
+    Adding resources returns a new registry, so a registry can be shared
+    by threads without locking.
+    """
+
+    def __init__(self, resources=()):
+        by_singular = {}
+        for info in resources:
+            by_singular[info.singular] = info
+        self._by_singular = by_singular
+        self._by_plural = dict((info.plural, info)
+                               for info in by_singular.values())
+
+    def __iter__(self):
+        return iter(self._by_singular.values())
+
+    def __len__(self):
+        return len(self._by_singular)
+
+    def __contains__(self, name):
+        return name in self._by_singular or name in self._by_plural
+
+    def get(self, name):
+        """Return the ResourceInfo of a singular or plural name, or None."""
+        info = self._by_singular.get(name)
+        if info is None:
+            info = self._by_plural.get(name)
+        return info
+
+    def plural(self, singular):
+        """Return the plural of a resource name."""
+        info = self._by_singular.get(singular)
+        return info.plural if info is not None else singular + 's'
+
+    def singular(self, plural):
+        """Return the singular of a collection name, or None if unknown."""
+        info = self._by_plural.get(plural)
+        return info.singular if info is not None else None
+
+    def children(self, parent):
+        """Return the resources nested in the given one."""
+        return [info for info in self if info.parent == parent]
+
+    def with_resources(self, resources):
+        """Return a new registry with resources added or replaced."""
+        return ResourceRegistry(_with_parents(list(self) + list(resources)))
+
+    @classmethod
+    def from_client_class(cls, client_class):
+        """Build the registry of the resources known to a client class.
+
+        The resources are the ones named by its EXTED_PLURALS plus the
+        ones with both a ``<plural>_path`` and a ``<singular>_path``
+        attribute, plural being singular + 's'.
+        """
+        def _path(name):
+            path = getattr(client_class, '%s_path' % name, None)
+            return path if isinstance(path, str) else None
+
+        names = list(client_class.EXTED_PLURALS.items())
+        known = set(client_class.EXTED_PLURALS)
+        for attr in dir(client_class):
+            if not attr.endswith('s_path') or attr[:-5] in known:
+                continue
+            plural = attr[:-5]
+            if _path(plural) and _path(plural[:-1]):
+                names.append((plural, plural[:-1]))
+        resources = [ResourceInfo(singular, plural, _path(plural),
+                                  _path(singular))
+                     for plural, singular in names]
+        return cls(_with_parents(resources))
+
+
+def _with_parents(resources):
+    """Set the parent of the resources nested in another one."""
+    by_path = dict((info.resource_path, info.singular)
+                   for info in resources if info.resource_path)
+    result = []
+    for info in resources:
+        path = info.collection_path
+        if info.parent is None and path and '%s' in path:
+            prefix = path[:path.index('%s') + 2]
+            info = info._replace(parent=by_path.get(prefix))
+        result.append(info)
+    return result
+
+
+class PathMatcher(object):
+    """Find the path template an expanded path was built from.
+
+    A segment of a template containing a format specifier, e.g. '%s',
+    matches any segment. When several templates match, the one with the
+    fewest such segments wins, so '/routers/%s/add_router_interface' is
+    preferred to '/routers/%s/%s'.
+    """
+
+    def __init__(self, templates):
+        by_length = {}
+        for template in set(templates):
+            segments = tuple(template.strip('/').split('/'))
+            by_length.setdefault(len(segments), []).append(
+                (segments, template))
+        for candidates in by_length.values():
+            candidates.sort(key=lambda candidate: (
+                sum('%' in segment for segment in candidate[0]),
+                candidate[1]))
+        self._by_length = by_length
+
+    def match(self, path):
+        """Return the template of path, or None if none matches."""
+        segments = path.partition('?')[0].strip('/').split('/')
+        for template, name in self._by_length.get(len(segments), ()):
+            for expected, segment in zip(template, segments):
+                if expected != segment and '%' not in expected:
+                    break
+            else:
+                return name
+        return None
+
+    @classmethod
+    def from_client(cls, client):
+        """Build the matcher of the ``*_path`` attributes of a client."""
+        templates = []
+        for attr in dir(client):
+            if attr.endswith('_path'):
+                value = getattr(client, attr, None)
+                if isinstance(value, str):
+                    templates.append(value)
+        return cls(templates)